@@ -1,5 +1,5 @@
 $(dirname "$0")/test.sh
-export FLASK_APP=praline.server
+export FLASK_APP="praline.server:create_app()"
 export FLASK_DEBUG
 export PYTHONPATH=$(pwd)/sources
 python3 -m flask run
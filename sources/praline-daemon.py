@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+import logging
+import logging.config
+import os.path
+import yaml
+
+
+with open(f"{os.path.dirname(__file__)}/../resources/praline-client.config", 'r') as f:
+    configuration = yaml.load(f.read(), Loader=yaml.SafeLoader)
+    logging.config.dictConfig(configuration['logging'])
+
+
+from praline.client.daemon.server import BuildDaemon, BuildServer
+from praline.common.file_system import FileSystem
+
+
+if __name__ == '__main__':
+    logger = logging.getLogger(__name__)
+    path   = os.path.expanduser(configuration.get('daemon-socket', '~/.praline/daemon.sock'))
+    daemon = BuildDaemon(FileSystem(), configuration)
+    with BuildServer(path, daemon) as server:
+        logger.info(f"build daemon listening on '{path}'")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
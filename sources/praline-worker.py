@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+import logging
+import logging.config
+import os
+import os.path
+import yaml
+
+
+with open(f"{os.path.dirname(__file__)}/../resources/praline-client.config", 'r') as f:
+    configuration = yaml.load(f.read(), Loader=yaml.SafeLoader)
+    logging.config.dictConfig(configuration['logging'])
+
+
+from praline.common.compiling.workers.server import CompileServer, CompileWorker
+from praline.common.file_system import FileSystem
+
+from tempfile import TemporaryDirectory
+
+
+if __name__ == '__main__':
+    logger = logging.getLogger(__name__)
+    host   = configuration.get('compile-worker-host', '0.0.0.0')
+    port   = configuration.get('compile-worker-port', 5052)
+    jobs   = configuration.get('compile-worker-jobs', os.cpu_count() or 1)
+    with TemporaryDirectory(prefix='praline-worker-') as directory:
+        worker = CompileWorker(FileSystem(), directory, jobs)
+        with CompileServer(host, port, worker) as server:
+            logger.info(f"compile worker listening on {host}:{port} with {jobs} jobs")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
@@ -2,6 +2,7 @@
 import logging
 import logging.config
 import os.path
+import sys
 import yaml
 
 
@@ -10,13 +11,24 @@ with open(f"{os.path.dirname(__file__)}/../resources/praline-client.config", 'r'
     logging.config.dictConfig(configuration['logging'])
 
 
+from praline.client.daemon import request_build
+
+
+if __name__ == '__main__' and 'daemon-socket' in configuration and '--watch' not in sys.argv[1:]:
+    status = request_build(os.path.expanduser(configuration['daemon-socket']), os.getcwd(), sys.argv[1:])
+    if status != None:
+        exit(status)
+
+
 from praline.client.project.pipeline.orchestration import invoke_stage
 from praline.client.project.pipeline.configuration import get_artifact_manifest_and_compiler
 from praline.client.project.pipeline.program_arguments import get_program_arguments
 from praline.client.project.pipeline.stages import get_stages
+from praline.client.project.pipeline.watching import Watcher
 from praline.client.repository.remote_proxy import RemoteProxy
 from praline.common.pralinefile import read_pralinefile
 from praline.common.file_system import FileSystem, join
+from threading import Event
 
 
 if __name__ == '__main__':
@@ -25,7 +37,9 @@ if __name__ == '__main__':
         file_system       = FileSystem()
         stages            = get_stages()
         program_arguments = get_program_arguments(stages)
-        remote_proxy      = RemoteProxy(file_system, configuration['remote-repository'])
+        remote_proxy      = RemoteProxy(file_system, 
+                                        configuration['remote-repository'], 
+                                        configuration.get('download-connections', 8))
 
         try:
             project_directory = file_system.get_working_directory()
@@ -34,18 +48,41 @@ if __name__ == '__main__':
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Pralinefile was not found in working directory {project_directory}") from e
 
-        (artifact_manifest, compiler) = get_artifact_manifest_and_compiler(file_system, program_arguments, pralinefile)
+        (artifact_manifest, compiler) = get_artifact_manifest_and_compiler(file_system, 
+                                                                           configuration, 
+                                                                           program_arguments, 
+                                                                           remote_proxy,
+                                                                           pralinefile)
         
         stage = program_arguments['global']['running_stage']
 
-        invoke_stage(file_system,
-                     configuration,
-                     program_arguments,
-                     remote_proxy,
-                     artifact_manifest,
-                     compiler,
-                     stage, 
-                     stages)
+        if program_arguments['global']['watch']:
+            caches                = {}
+            compiler.interruption = Event()
+            watcher               = Watcher(file_system, [join(project_directory, 'sources'), 
+                                                          join(project_directory, 'resources')])
+            try:
+                watcher.watch(lambda: invoke_stage(file_system,
+                                                   configuration,
+                                                   program_arguments,
+                                                   remote_proxy,
+                                                   artifact_manifest,
+                                                   compiler,
+                                                   stage,
+                                                   stages,
+                                                   caches),
+                              compiler.interruption)
+            except KeyboardInterrupt:
+                pass
+        else:
+            invoke_stage(file_system,
+                         configuration,
+                         program_arguments,
+                         remote_proxy,
+                         artifact_manifest,
+                         compiler,
+                         stage, 
+                         stages)
 
         exit(0)
     except RuntimeError as exception:
@@ -0,0 +1,32 @@
+from typing import BinaryIO, List
+
+import json
+import socket
+import sys
+
+
+def request_build(socket_path: str, working_directory: str, arguments: List[str], output: BinaryIO = None) -> int:
+    output = output or sys.stdout.buffer
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        connection.close()
+        return None
+
+    with connection:
+        request = {'working_directory': working_directory, 'arguments': arguments}
+        connection.sendall(json.dumps(request).encode() + b'\n')
+        connection.shutdown(socket.SHUT_WR)
+        pending = b''
+        while chunk := connection.recv(65536):
+            data    = pending + chunk
+            pending = data[-1:]
+            output.write(data[:-1])
+            output.flush()
+
+    if not pending:
+        raise RuntimeError("build daemon closed the connection without reporting a status")
+    return pending[0]
@@ -0,0 +1,83 @@
+from praline.client.daemon import request_build
+from praline.client.daemon.server import BuildServer
+
+from tempfile import TemporaryDirectory
+from threading import Thread
+from typing import BinaryIO, List
+from unittest import TestCase
+
+import io
+import os
+import socket
+import stat
+
+
+class BuildDaemonMock:
+    def __init__(self, status: int):
+        self.status   = status
+        self.requests = []
+
+    def run(self, working_directory: str, arguments: List[str], output: BinaryIO) -> int:
+        self.requests.append((working_directory, arguments))
+        output.write(b'building...\n')
+        return self.status
+
+
+class DaemonTest(TestCase):
+    def setUp(self):
+        self.directory   = TemporaryDirectory()
+        self.socket_path = os.path.join(self.directory.name, 'daemon', 'daemon.sock')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_request_build(self):
+        daemon = BuildDaemonMock(status=3)
+        with BuildServer(self.socket_path, daemon) as server:
+            self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+
+            thread = Thread(target=server.handle_request)
+            thread.start()
+            output = io.BytesIO()
+            status = request_build(self.socket_path, '/project', ['--mode', 'release', 'main'], output)
+            thread.join()
+
+        self.assertEqual(status, 3)
+
+        self.assertEqual(output.getvalue(), b'building...\n')
+
+        self.assertEqual(daemon.requests, [('/project', ['--mode', 'release', 'main'])])
+
+        self.assertFalse(os.path.exists(self.socket_path))
+
+    def test_invalid_build_request(self):
+        daemon = BuildDaemonMock(status=0)
+        with BuildServer(self.socket_path, daemon) as server:
+            for request in [b'\x80\x04\x95\n', b'[]\n', b'{"working_directory": "/project", "arguments": [1]}\n', 
+                            b'{"working_directory": "project", "arguments": []}\n']:
+                thread = Thread(target=server.handle_request)
+                with self.assertLogs('praline.client.daemon.server', 'ERROR'):
+                    thread.start()
+                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                        connection.connect(self.socket_path)
+                        connection.sendall(request)
+                        connection.shutdown(socket.SHUT_WR)
+                        response = connection.makefile('rb').read()
+                    thread.join()
+
+                self.assertEqual(response[-1], 255)
+
+        self.assertEqual(daemon.requests, [])
+
+    def test_request_build_without_daemon(self):
+        self.assertIsNone(request_build(self.socket_path, '/project', ['main'], io.BytesIO()))
+
+    def test_stale_socket_is_replaced(self):
+        os.makedirs(os.path.dirname(self.socket_path))
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(self.socket_path)
+
+        self.assertIsNone(request_build(self.socket_path, '/project', ['main'], io.BytesIO()))
+
+        with BuildServer(self.socket_path, BuildDaemonMock(status=0)):
+            self.assertRaises(RuntimeError, BuildServer, self.socket_path, BuildDaemonMock(status=0))
@@ -0,0 +1,187 @@
+from praline.client.project.pipeline.configuration import get_artifact_manifest_and_compiler
+from praline.client.project.pipeline.orchestration import invoke_stage
+from praline.client.project.pipeline.program_arguments import get_program_arguments
+from praline.client.project.pipeline.stages import get_stages
+from praline.client.project.pipeline.watching import Watcher
+from praline.client.repository.remote_proxy import RemoteProxy
+from praline.common import ArtifactManifest
+from praline.common.compiling.compiler import CompilerWrapper
+from praline.common.file_system import FileSystem, join, normalized_path
+from praline.common.pralinefile import read_pralinefile
+
+from contextlib import redirect_stderr, redirect_stdout
+from logging import getLogger, StreamHandler
+from typing import Any, BinaryIO, Dict, List, Tuple
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+
+
+logger = getLogger(__name__)
+
+
+toolchain_executables = ['g++', 'clang++', 'cl', 'clang-cl']
+
+
+class InvalidBuildRequestError(Exception):
+    pass
+
+
+class BuildDaemon:
+    def __init__(self, file_system: FileSystem, configuration: Dict[str, Any]):
+        self.file_system   = file_system
+        self.configuration = configuration
+        self.stages        = get_stages()
+        self.remote_proxy  = RemoteProxy(file_system, 
+                                         configuration['remote-repository'], 
+                                         configuration.get('download-connections', 8))
+        self.projects      = {}
+        self.caches        = {}
+        self.watchers      = {}
+        self.file_system.file_hashes = {}
+
+    def get_artifact_manifest_and_compiler(self, 
+                                           program_arguments: Dict[str, Any]) -> Tuple[ArtifactManifest, CompilerWrapper]:
+        project_directory = self.file_system.get_working_directory()
+        pralinefile_path  = join(project_directory, 'Pralinefile')
+        if not self.file_system.exists(pralinefile_path):
+            raise FileNotFoundError(f"Pralinefile was not found in working directory {project_directory}")
+
+        signature = (self.file_system.get_size(pralinefile_path), 
+                     self.file_system.get_modification_time(pralinefile_path), 
+                     self.get_toolchain_signature())
+        key       = (project_directory, 
+                     tuple((k, v) for k, v in program_arguments['global'].items() if k != 'running_stage'))
+        if key in self.projects and self.projects[key][0] == signature:
+            return self.projects[key][1]
+
+        logger.info(f"loading project '{project_directory}'")
+        pralinefile = read_pralinefile(self.file_system, pralinefile_path)
+        self.projects[key] = (signature, get_artifact_manifest_and_compiler(self.file_system,
+                                                                            self.configuration,
+                                                                            program_arguments,
+                                                                            self.remote_proxy,
+                                                                            pralinefile))
+        return self.projects[key][1]
+
+    def get_toolchain_signature(self) -> Tuple[Tuple[str, int, float], ...]:
+        executables = [self.file_system.which(executable) for executable in toolchain_executables]
+        return tuple((executable, 
+                      self.file_system.get_size(executable), 
+                      self.file_system.get_modification_time(executable)) 
+                     for executable in executables if executable)
+
+    def get_watcher(self, project_directory: str) -> Watcher:
+        if project_directory not in self.watchers:
+            self.watchers[project_directory] = Watcher(self.file_system, [join(project_directory, 'sources'), 
+                                                                          join(project_directory, 'resources')])
+        return self.watchers[project_directory]
+
+    def build(self, arguments: List[str]) -> None:
+        program_arguments           = get_program_arguments(self.stages, arguments)
+        artifact_manifest, compiler = self.get_artifact_manifest_and_compiler(program_arguments)
+        snapshot                    = self.get_watcher(self.file_system.get_working_directory()).snapshot()
+
+        self.file_system.file_states = {normalized_path(path): state for path, state in snapshot.items()}
+
+        invoke_stage(self.file_system,
+                     self.configuration,
+                     program_arguments,
+                     self.remote_proxy,
+                     artifact_manifest,
+                     compiler,
+                     program_arguments['global']['running_stage'],
+                     self.stages,
+                     self.caches)
+
+    def run(self, working_directory: str, arguments: List[str], output: BinaryIO) -> int:
+        stream            = io.TextIOWrapper(output, write_through=True)
+        handlers          = [handler for handler in logging.getLogger().handlers 
+                             if type(handler) == StreamHandler and handler.stream in [sys.stdout, sys.stderr]]
+        streams           = [handler.setStream(stream) for handler in handlers]
+        current_directory = os.getcwd()
+        self.file_system.output = output
+        try:
+            os.chdir(working_directory)
+            with redirect_stdout(stream), redirect_stderr(stream):
+                self.build(arguments)
+            return 0
+        except SystemExit as exception:
+            if exception.code == None:
+                return 0
+            return exception.code if isinstance(exception.code, int) else 1
+        except RuntimeError as exception:
+            logger.fatal(exception)
+            return 255
+        except Exception as exception:
+            logger.exception(exception)
+            return 1
+        finally:
+            os.chdir(current_directory)
+            self.file_system.output      = None
+            self.file_system.file_states = None
+            for handler, previous_stream in zip(handlers, streams):
+                handler.setStream(previous_stream)
+            stream.detach()
+
+
+def read_build_request(line: bytes) -> Tuple[str, List[str]]:
+    try:
+        request = json.loads(line.decode())
+    except ValueError as exception:
+        raise InvalidBuildRequestError(f"build request is not valid JSON -- {exception}")
+    if not isinstance(request, dict):
+        raise InvalidBuildRequestError("build request is not a JSON object")
+    working_directory = request.get('working_directory')
+    arguments         = request.get('arguments')
+    if not isinstance(working_directory, str) or not os.path.isabs(working_directory):
+        raise InvalidBuildRequestError("build request working directory must be an absolute path")
+    if not isinstance(arguments, list) or not all(isinstance(argument, str) for argument in arguments):
+        raise InvalidBuildRequestError("build request arguments must be a list of strings")
+    return (working_directory, arguments)
+
+
+class BuildRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            working_directory, arguments = read_build_request(self.rfile.readline())
+        except InvalidBuildRequestError as exception:
+            logger.error(exception)
+            self.wfile.write(f'{exception}\n'.encode() + bytes([255]))
+            return
+        logger.info(f"building {arguments} in '{working_directory}'")
+        status = self.server.build_daemon.run(working_directory, arguments, self.wfile)
+        self.wfile.write(bytes([status & 0xff]))
+
+
+class BuildServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: str, daemon: BuildDaemon):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+            raise RuntimeError(f"a build daemon is already listening on '{socket_path}'")
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass
+        finally:
+            probe.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        os.makedirs(os.path.dirname(socket_path) or '.', mode=0o700, exist_ok=True)
+
+        umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, BuildRequestHandler)
+        finally:
+            os.umask(umask)
+        os.chmod(socket_path, 0o600)
+        self.build_daemon = daemon
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
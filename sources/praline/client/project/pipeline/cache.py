@@ -1,32 +1,101 @@
 from praline.common.file_system import FileSystem
 
+import io
 import pickle
+from copy import deepcopy
 from logging import getLogger
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 
 logger = getLogger(__name__)
 
 
+def get_weight(value: Any) -> int:
+    return max(1, len(value)) if isinstance(value, dict) else 1
+
+
 class Cache:
     path       : str
     file_system: FileSystem
     cache      : Dict[str, Any]
+    persisted  : Dict[str, Any]
+    records    : int
+    signature  : Tuple[int, float]
 
     def __init__(self, file_system: FileSystem, path: str):
         self.path = path
         self.file_system = file_system
         self.cache = {}
-    
+        self.persisted = {}
+        self.records = 0
+        self.signature = None
+
+    def get_signature(self) -> Tuple[int, float]:
+        if not self.file_system.exists(self.path):
+            return None
+        return (self.file_system.get_size(self.path), self.file_system.get_modification_time(self.path))
+
     def __enter__(self):
-        if self.file_system.exists(self.path):
+        signature = self.get_signature()
+        if signature == self.signature:
+            logger.debug(f"reusing loaded cache '{self.path}'")
+            return self
+
+        self.cache = {}
+        self.records = 0
+        corrupted = False
+        if signature != None:
             with self.file_system.open_file(self.path, 'rb') as handle:
-                self.cache = pickle.load(handle)
+                data = handle.read()
+            stream = io.BytesIO(data)
+            while stream.tell() < len(data):
+                try:
+                    record = pickle.load(stream)
+                except Exception as exception:
+                    logger.warning(f"discarding corrupted cache records from '{self.path}' -- {exception}")
+                    corrupted = True
+                    break
+                if isinstance(record, dict):
+                    self.cache.update(record)
+                    self.records += sum(get_weight(value) for value in record.values())
+                elif len(record) == 3:
+                    key, updated, removed = record
+                    entry = self.cache.setdefault(key, {})
+                    entry.update(updated)
+                    for subkey in removed:
+                        entry.pop(subkey, None)
+                    self.records += len(updated) + len(removed)
+                else:
+                    key, value = record
+                    self.cache[key] = value
+                    self.records += get_weight(value)
         logger.debug(f"read cache={self.cache}")
+        self.persisted = deepcopy(self.cache)
+        if corrupted:
+            self.compact()
+        self.signature = self.get_signature()
         return self
 
     def __setitem__(self, key: str, value) -> None:
         self.cache[key] = value
+        previous = self.persisted.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            updated = {k: v for k, v in value.items() if k not in previous or previous[k] != v}
+            removed = [k for k in previous if k not in value]
+            if not updated and not removed:
+                return
+            record = (key, updated, removed)
+            weight = len(updated) + len(removed)
+        else:
+            record = (key, value)
+            weight = get_weight(value)
+        logger.debug(f"writing cache record {record}")
+        self.file_system.create_file_if_missing(self.path)
+        with self.file_system.open_file(self.path, 'ab') as handle:
+            pickle.dump(record, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        self.persisted[key] = deepcopy(value)
+        self.records += weight
+        self.signature = self.get_signature()
 
     def __getitem__(self, key: str):
         return self.cache[key]
@@ -34,8 +103,19 @@ class Cache:
     def get(self, key: str, default=None):
         return self.cache.get(key, default)
 
+    def compact(self) -> None:
+        logger.debug(f"compacting cache with {self.records} records into {len(self.cache)}")
+        temporary_path = self.path + '.compacting'
+        self.file_system.remove_file_if_it_exists(temporary_path)
+        self.file_system.create_file_if_missing(temporary_path)
+        with self.file_system.open_file(temporary_path, 'wb') as handle:
+            for record in self.cache.items():
+                pickle.dump(record, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        self.file_system.rename(temporary_path, self.path)
+        self.persisted = deepcopy(self.cache)
+        self.records = sum(get_weight(value) for value in self.cache.values())
+        self.signature = self.get_signature()
+
     def __exit__(self, type, value, traceback):
-        logger.debug(f"writing cache={self.cache}")
-        self.file_system.create_file_if_missing(self.path)
-        with self.file_system.open_file(self.path, 'wb') as handle:
-            pickle.dump(self.cache, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.records > 2 * sum(get_weight(value) for value in self.cache.values()):
+            self.compact()
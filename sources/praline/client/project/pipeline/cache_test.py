@@ -2,6 +2,7 @@ from praline.client.project.pipeline.cache import Cache
 from praline.common.testing.file_system_mock import FileSystemMock
 from unittest import TestCase
 
+import io
 import pickle
 from os.path import join
 
@@ -124,3 +125,74 @@ class CacheTest(TestCase):
             with Cache(file_system, file_name) as cache:
                 self.assertEqual(cache.get('whale'), 'blue')
                 self.assertEqual(cache.get('dog'), 'grey')
+
+    def test_keys_are_appended_as_records(self):
+        file_name   = join('my', 'cache')
+        file_system = FileSystemMock()
+
+        with Cache(file_system, file_name) as cache:
+            cache['fox'] = 'orange'
+            cache['owl'] = 'brown'
+
+        stream  = io.BytesIO(file_system.files[file_name])
+        records = [pickle.load(stream), pickle.load(stream)]
+
+        self.assertEqual(records, [('fox', 'orange'), ('owl', 'brown')])
+
+    def test_truncated_records_are_discarded(self):
+        directory   = 'my'
+        file_name   = join('my', 'cache')
+        data        = pickle.dumps(('frog', 'green'), protocol=pickle.HIGHEST_PROTOCOL)
+        truncated   = pickle.dumps(('crow', 'black'), protocol=pickle.HIGHEST_PROTOCOL)[:-3]
+        file_system = FileSystemMock(
+            directories={
+                directory
+            },
+            files={
+                file_name: data + truncated
+            }
+        )
+
+        with Cache(file_system, file_name) as cache:
+            self.assertEqual(cache.get('frog'), 'green')
+            self.assertEqual(cache.get('crow'), None)
+            cache['crow'] = 'white'
+
+        with Cache(file_system, file_name) as cache:
+            self.assertEqual(cache.get('frog'), 'green')
+            self.assertEqual(cache.get('crow'), 'white')
+
+    def test_records_are_compacted(self):
+        file_name   = join('my', 'cache')
+        file_system = FileSystemMock()
+
+        with Cache(file_system, file_name) as cache:
+            for color in ['red', 'green', 'blue']:
+                cache['parrot'] = color
+
+        self.assertEqual(file_system.files[file_name], 
+                         pickle.dumps(('parrot', 'blue'), protocol=pickle.HIGHEST_PROTOCOL))
+
+    def test_only_changed_keys_are_appended(self):
+        file_name   = join('my', 'cache')
+        file_system = FileSystemMock()
+
+        with Cache(file_system, file_name) as cache:
+            cache['stage'] = {'a.cpp': 'hash-a', 'b.cpp': 'hash-b', 'c.cpp': 'hash-c', 'd.cpp': 'hash-d'}
+
+        with Cache(file_system, file_name) as cache:
+            stage_cache = cache.get('stage')
+            stage_cache['b.cpp'] = 'updated-hash-b'
+            del stage_cache['d.cpp']
+            cache['stage'] = stage_cache
+            cache['stage'] = stage_cache
+
+        stream  = io.BytesIO(file_system.files[file_name])
+        records = [pickle.load(stream), pickle.load(stream)]
+
+        self.assertEqual(stream.read(), b'')
+
+        self.assertEqual(records[1], ('stage', {'b.cpp': 'updated-hash-b'}, ['d.cpp']))
+
+        with Cache(file_system, file_name) as cache:
+            self.assertEqual(cache['stage'], {'a.cpp': 'hash-a', 'b.cpp': 'updated-hash-b', 'c.cpp': 'hash-c'})
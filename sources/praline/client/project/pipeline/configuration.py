@@ -1,12 +1,37 @@
-from praline.common import ArtifactDependency, ArtifactManifest
+from praline.client.repository.remote_object_cache import RemoteObjectCache
+from praline.client.repository.remote_proxy import RemoteProxy
+from praline.common import ArtifactDependency, ArtifactManifest, RemoteCacheMode
 from praline.common.compiling.compiler import CompilerWrapper, intantiate_compiler
-from praline.common.file_system import FileSystem
+from praline.common.compiling.object_cache import ObjectCache
+from praline.common.compiling.workers import CompileWorkerPool
+from praline.common.file_system import FileSystem, expand_user
 
 from typing import Any, Dict, Tuple
 
 
+def get_object_cache(file_system: FileSystem,
+                     configuration: Dict[str, Any],
+                     remote_proxy: RemoteProxy) -> ObjectCache:
+    if 'object-cache-directory' not in configuration:
+        return None
+    directory  = expand_user(configuration['object-cache-directory'])
+    size_limit = configuration.get('object-cache-size-limit-in-megabytes', 10240) * 1024 * 1024
+    if 'remote-cache-mode' in configuration:
+        mode = RemoteCacheMode(configuration['remote-cache-mode'])
+        return RemoteObjectCache(file_system, directory, size_limit, remote_proxy, mode)
+    return ObjectCache(file_system, directory, size_limit)
+
+
+def get_compile_workers(configuration: Dict[str, Any], artifact_manifest: ArtifactManifest) -> CompileWorkerPool:
+    if not configuration.get('compile-workers'):
+        return None
+    return CompileWorkerPool(configuration['compile-workers'], artifact_manifest)
+
+
 def get_artifact_manifest_and_compiler(file_system: FileSystem, 
+                                       configuration: Dict[str, Any],
                                        program_arguments: Dict[str, Any], 
+                                       remote_proxy: RemoteProxy,
                                        pralinefile: Dict[str, Any]) -> Tuple[ArtifactManifest, CompilerWrapper]:
     organization = pralinefile['organization']
     artifact     = pralinefile['artifact']
@@ -62,9 +87,28 @@ def get_artifact_manifest_and_compiler(file_system: FileSystem,
     
     compiler_name      = program_arguments['global']['compiler']
     fallback_compilers = pralinefile['compilers']
+    jobs               = program_arguments['global']['jobs']
+    hashing_strategy   = program_arguments['global']['hashing_strategy']
+    object_cache       = get_object_cache(file_system, configuration, remote_proxy)
     (artifact_manifest, compiler) = intantiate_compiler(file_system, 
                                                         artifact_manifest, 
                                                         compiler_name, 
-                                                        fallback_compilers)
+                                                        fallback_compilers,
+                                                        jobs,
+                                                        hashing_strategy,
+                                                        object_cache)
+    compiler.compile_workers  = get_compile_workers(configuration, artifact_manifest)
+    compiler.profiling        = program_arguments['global']['profile_compilation']
+    compiler.precompiling     = program_arguments['global']['precompile_headers']
+    compiler.unity_batch_size = None
+    if program_arguments['global']['unity']:
+        compiler.unity_batch_size = program_arguments['global']['unity_batch_size']
+
+    linker = program_arguments['global']['linker']
+    if linker == None:
+        linker = pralinefile['linker']
+    compiler.use_linker(linker)
+    compiler.use_split_dwarf(program_arguments['global']['split_dwarf'])
+    compiler.use_link_time_optimization(program_arguments['global']['lto'])
 
     return (artifact_manifest, compiler)
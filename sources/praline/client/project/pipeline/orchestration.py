@@ -10,6 +10,7 @@ from praline.common.file_system import FileSystem, join
 from praline.common.progress_bar import ProgressBarSupplier
 from praline.common.tracing import trace
 
+from contextlib import nullcontext
 from typing import Any, Dict, List
 
 
@@ -99,7 +100,8 @@ def invoke_stage(file_system: FileSystem,
                  artifact_manifest: ArtifactManifest,
                  compiler: CompilerWrapper,
                  target_stage: str,
-                 stages: Dict[str, Stage]):
+                 stages: Dict[str, Stage],
+                 caches: Dict[str, Cache] = None):
     global_resources = {}
     pipeline  = create_pipeline(file_system, 
                                 configuration, 
@@ -112,17 +114,28 @@ def invoke_stage(file_system: FileSystem,
 
     progress_bar_header_length = max(len(stage_name) for _, stage_name in pipeline)
 
-    for activation, stage_name in pipeline:
-        stage = stages[stage_name]
-        local_resources = {resource : global_resources[resource] for resource in stage.requirements[activation]}
-        stage_program_arguments = get_stage_program_arguments(stage_name, program_arguments)
-        with StageResources(stage_name, activation, local_resources, stage.output) as stage_resources:        
-            progress_bar_header   = stage_name.replace('_', ' ')
-            progress_bar_supplier = ProgressBarSupplier(file_system, progress_bar_header, progress_bar_header_length)
-            if stage.cacheable:
-                cache_path = join(file_system.get_working_directory(), 'target', 'cache.pickle')
-                with Cache(file_system, cache_path) as cache:
-                    cache[stage_name] = stage_cache = cache.get(stage_name, {})
+    if any(stages[stage_name].cacheable for _, stage_name in pipeline):
+        cache_path    = join(file_system.get_working_directory(), 
+                             'target', 
+                             artifact_manifest.get_configuration_identifier(), 
+                             'cache.pickle')
+        if caches != None:
+            cache_context = caches.setdefault(cache_path, Cache(file_system, cache_path))
+        else:
+            cache_context = Cache(file_system, cache_path)
+    else:
+        cache_context = nullcontext()
+
+    with cache_context as cache:
+        for activation, stage_name in pipeline:
+            stage = stages[stage_name]
+            local_resources = {resource : global_resources[resource] for resource in stage.requirements[activation]}
+            stage_program_arguments = get_stage_program_arguments(stage_name, program_arguments)
+            with StageResources(stage_name, activation, local_resources, stage.output) as stage_resources:        
+                progress_bar_header   = stage_name.replace('_', ' ')
+                progress_bar_supplier = ProgressBarSupplier(file_system, progress_bar_header, progress_bar_header_length)
+                if stage.cacheable:
+                    stage_cache = cache.get(stage_name, {})
                     arguments = StageArguments(file_system=file_system,
                                                configuration=configuration,
                                                program_arguments=stage_program_arguments,
@@ -132,15 +145,18 @@ def invoke_stage(file_system: FileSystem,
                                                resources=stage_resources,
                                                cache=stage_cache,
                                                progress_bar_supplier=progress_bar_supplier)
+                    try:
+                        stage.invoker(arguments)
+                    finally:
+                        cache[stage_name] = stage_cache
+                else:
+                    arguments = StageArguments(file_system=file_system,
+                                               configuration=configuration,
+                                               program_arguments=stage_program_arguments,
+                                               remote_proxy=remote_proxy,
+                                               artifact_manifest=artifact_manifest,
+                                               compiler=compiler,
+                                               resources=stage_resources,
+                                               progress_bar_supplier=progress_bar_supplier)
                     stage.invoker(arguments)
-            else:
-                arguments = StageArguments(file_system=file_system,
-                                           configuration=configuration,
-                                           program_arguments=stage_program_arguments,
-                                           remote_proxy=remote_proxy,
-                                           artifact_manifest=artifact_manifest,
-                                           compiler=compiler,
-                                           resources=stage_resources,
-                                           progress_bar_supplier=progress_bar_supplier)
-                stage.invoker(arguments)
-            global_resources.update(stage_resources.resources)
+                global_resources.update(stage_resources.resources)
@@ -1,9 +1,11 @@
+from praline.client.project.pipeline.cache import Cache
 from praline.client.project.pipeline.orchestration import (create_pipeline, invoke_stage, CyclicStagesError, 
                                                            MultipleSuppliersError, UnsatisfiableStageError)
 from praline.client.project.pipeline.stages import Stage, StageArguments, StagePredicateResult
+from praline.common import (Architecture, ArtifactLoggingLevel, ArtifactManifest, ArtifactType, ArtifactVersion, 
+                            Compiler, ExportedSymbols, Mode, Platform)
 from praline.common.testing.file_system_mock import FileSystemMock
 
-import pickle
 from os.path import join
 from unittest import TestCase
 
@@ -137,12 +139,24 @@ class OrchestrationTest(TestCase):
             'byStage': {'C': { 'some-argument': 'some_value' }}
         }
 
-        invoke_stage(file_system, None, program_arguments, None, None, None, 'A', stages)
+        artifact_manifest = ArtifactManifest(organization='my_organization',
+                                             artifact='my_artifact',
+                                             version=ArtifactVersion.from_string('0.0.0'),
+                                             mode=Mode.release,
+                                             architecture=Architecture.x64,
+                                             platform=Platform.linux,
+                                             compiler=Compiler.clang,
+                                             exported_symbols=ExportedSymbols.explicit,
+                                             artifact_type=ArtifactType.executable,
+                                             artifact_logging_level=ArtifactLoggingLevel.info,
+                                             dependencies=[])
 
-        cache_path = join('project', 'target', 'cache.pickle')
+        invoke_stage(file_system, None, program_arguments, None, artifact_manifest, None, 'A', stages)
 
-        self.assertEqual(pickle.loads(file_system.files[cache_path]), 
-                         {'C': {'c': 'c_value'}, 'D': {'d': 'd_value'}, 'G': {'g': 'g_value'}})
+        cache_path = join('project', 'target', 'clang-release-x64-info', 'cache.pickle')
+
+        with Cache(file_system, cache_path) as cache:
+            self.assertEqual(cache.cache, {'C': {'c': 'c_value'}, 'D': {'d': 'd_value'}, 'G': {'g': 'g_value'}})
 
     def test_invoke_stage_with_cycles(self):
         #
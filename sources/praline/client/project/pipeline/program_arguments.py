@@ -1,10 +1,23 @@
-from argparse import ArgumentParser, REMAINDER
+from argparse import ArgumentParser, ArgumentTypeError, REMAINDER
 from praline.client.project.pipeline.stages import Stage
-from praline.common import Architecture, ArtifactLoggingLevel, ArtifactType, Compiler, ExportedSymbols, Mode, Platform
-from typing import Any, Dict
+from praline.common import (Architecture, ArtifactLoggingLevel, ArtifactType, Compiler, ExportedSymbols, HashingStrategy,
+                            Linker, Mode, Platform)
+from typing import Any, Dict, List
 
+import os
 
-def get_program_arguments(stages: Dict[str, Stage]) -> Dict[str, Any]:
+
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise ArgumentTypeError(f"value must be at least 1 but got {number}")
+    return number
+
+
+def get_program_arguments(stages: Dict[str, Stage], program_arguments: List[str] = None) -> Dict[str, Any]:
     schema = {
         'global': [
             {
@@ -67,6 +80,14 @@ def get_program_arguments(stages: Dict[str, Stage]) -> Dict[str, Any]:
                 'help'   : "If set to explicit only symbols marked by the PRALINE_EXPORT macro will be exported " +
                     "otherwise all symbols are exported. Overrides Pralinefile exported_symbols."
             },
+            {
+                'name'   : '--linker',
+                'dest'   : 'linker',
+                'type'   : Linker,
+                'choices': list(Linker),
+                'help'   : "The linker used for executables and libraries. The auto linker picks the fastest of mold, " +
+                    "lld and gold found in the PATH and falls back to the default ld. Overrides Pralinefile linker."
+            },
             {
                 'name'   : '--artifact-logging-level',
                 'dest'   : 'artifact_logging_level',
@@ -78,13 +99,91 @@ def get_program_arguments(stages: Dict[str, Stage]) -> Dict[str, Any]:
                     "all dependencies otherwise the ABI will be broken. It's recommended to leave this flag to " +
                     "debug to compile all log statements and instead use the logger object interface to set the level."
             },
+            {
+                'name'   : '-j',
+                'alias'  : '--jobs',
+                'dest'   : 'jobs',
+                'type'   : positive_int,
+                'default': os.cpu_count() or 1,
+                'help'   : "The maximum number of sources preprocessed and compiled in parallel. Defaults to the " +
+                    "number of processors on the machine."
+            },
+            {
+                'name'   : '--hashing-strategy',
+                'dest'   : 'hashing_strategy',
+                'type'   : HashingStrategy,
+                'choices': list(HashingStrategy),
+                'default': HashingStrategy.preprocessed,
+                'help'   : "Decides how sources are checked for changes. The preprocessed strategy hashes the fully " +
+                    "preprocessed source on every build. The directives_only strategy hashes the source with only " +
+                    "the include directives expanded, which is cheaper but also picks up comment changes. The " +
+                    "dependencies strategy records the headers included by each source during compilation and only " +
+                    "hashes those files on later builds, skipping preprocessing altogether."
+            },
+            {
+                'name'  : '--profile-compilation',
+                'dest'  : 'profile_compilation',
+                'action': 'store_true',
+                'help'  : "Record the wall-clock time, peak memory and compiler timing report of every compiled " +
+                    "source and write an aggregated report to compilation-profile.txt in the target directory. " +
+                    "Sources are always compiled locally, bypassing the object cache and the compile workers."
+            },
+            {
+                'name'  : '--precompile-headers',
+                'dest'  : 'precompile_headers',
+                'action': 'store_true',
+                'help'  : "Precompile the headers included by most of the sources being compiled, standard library " +
+                    "and dependency headers included, and force-include the precompiled header in every source. " +
+                    "The precompiled header is rebuilt whenever its preprocessed contents change."
+            },
+            {
+                'name'  : '--unity',
+                'dest'  : 'unity',
+                'action': 'store_true',
+                'help'  : "Compile the main and test sources in batches, each batch being a generated source under " +
+                    "the unity directory of the target that includes its members. Sources keep their batch between " +
+                    "builds, so editing one only recompiles its batch."
+            },
+            {
+                'name'   : '--unity-batch-size',
+                'dest'   : 'unity_batch_size',
+                'type'   : positive_int,
+                'default': 8,
+                'metavar': 'BATCH_SIZE',
+                'help'   : "The number of sources in a batch when compiling with --unity (8 by default)."
+            },
+            {
+                'name'  : '--split-dwarf',
+                'dest'  : 'split_dwarf',
+                'action': 'store_true',
+                'help'  : "In debug mode, keep the debug information out of the objects and the linked artifact. " +
+                    "The gcc compiler writes it to .dwo files next to the objects and packs them in a .dwp symbols " +
+                    "table, also adding a gdb index when the linker supports it. The clang compiler packs it in a " +
+                    ".dwarf symbols table using dsymutil. Symbols tables are packaged along with the artifact."
+            },
+            {
+                'name'  : '--lto',
+                'dest'  : 'lto',
+                'action': 'store_true',
+                'help'  : "In release mode, enable link-time optimization so that the linker can inline and " +
+                    "optimize across sources. The gcc compiler uses -flto=auto. The clang compiler uses ThinLTO " +
+                    "and keeps its incremental cache in the link_cache directory of the target."
+            },
+            {
+                'name'  : '--watch',
+                'dest'  : 'watch',
+                'action': 'store_true',
+                'help'  : "Keep running the stage whenever sources or resources change. Edits made while a build " +
+                    "is running cancel the compilations that haven't started yet and trigger a new build."
+            },
         ],
         'byStage': {name : stage.program_arguments for name, stage in stages.items() if stage.exposed}
     }
     
     parser = ArgumentParser(description="A simple way to build and manage C++ dependencies.")
     for argument in schema['global']:
-        parser.add_argument(argument['name'], **{k : v for k, v in argument.items() if k != 'name' and k != 'key'})
+        names = [argument['name']] + ([argument['alias']] if 'alias' in argument else [])
+        parser.add_argument(*names, **{k : v for k, v in argument.items() if k not in ['name', 'alias', 'key']})
     
     stage_subparser = parser.add_subparsers(title='stage', dest='stage', required=True)
     for name, stage in stages.items():
@@ -93,7 +192,7 @@ def get_program_arguments(stages: Dict[str, Stage]) -> Dict[str, Any]:
             for argument in schema['byStage'][name]:
                 stage_parser.add_argument(argument['name'], **{k : v for k, v in argument.items() if k != 'name'})
 
-    parsed_arguments = parser.parse_args().__dict__
+    parsed_arguments = parser.parse_args(program_arguments).__dict__
     arguments = {
         'global': {argument['dest'] : parsed_arguments[argument['dest']] for argument in schema['global']},
         'byStage': {}
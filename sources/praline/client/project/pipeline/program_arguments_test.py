@@ -0,0 +1,50 @@
+from praline.client.project.pipeline.program_arguments import get_program_arguments
+from praline.client.project.pipeline.stages import Stage
+
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest import TestCase
+
+
+stages = {
+    'main': Stage(name='main',
+                  requirements=[],
+                  output=[],
+                  predicate=None,
+                  program_arguments=[],
+                  cacheable=False,
+                  exposed=True,
+                  invoker=None)
+}
+
+
+class ProgramArgumentsTest(TestCase):
+    def assertRejected(self, program_arguments):
+        with redirect_stderr(StringIO()):
+            self.assertRaises(SystemExit, get_program_arguments, stages, program_arguments)
+
+    def test_jobs(self):
+        self.assertEqual(get_program_arguments(stages, ['-j', '4', 'main'])['global']['jobs'], 4)
+
+        self.assertGreaterEqual(get_program_arguments(stages, ['main'])['global']['jobs'], 1)
+
+        self.assertRejected(['-j', '0', 'main'])
+
+        self.assertRejected(['--jobs', '-2', 'main'])
+
+        self.assertRejected(['--jobs', 'many', 'main'])
+
+    def test_unity(self):
+        self.assertFalse(get_program_arguments(stages, ['main'])['global']['unity'])
+
+        program_arguments = get_program_arguments(stages, ['--unity', 'main'])
+
+        self.assertTrue(program_arguments['global']['unity'])
+
+        self.assertEqual(program_arguments['global']['unity_batch_size'], 8)
+
+        program_arguments = get_program_arguments(stages, ['--unity', '--unity-batch-size', '16', 'main'])
+
+        self.assertEqual(program_arguments['global']['unity_batch_size'], 16)
+
+        self.assertRejected(['--unity', '--unity-batch-size', '0', 'main'])
@@ -7,6 +7,7 @@ class StagesTest(TestCase):
     def test_get_stages(self):
         expected_stages = {
             'load_resources', 
+            'analyze_dependencies',
             'deploy', 
             'load_clang_format', 
             'format_test_sources', 
@@ -0,0 +1,49 @@
+from praline.client.project.pipeline.stages import StageArguments, stage
+from praline.common.compiling.include_analysis import analyze_header_impact, format_include_report
+from praline.common.file_system import join, normalized_path, relative_path
+
+
+@stage(requirements=[['project_structure', 'headers', 'main_sources', 'test_sources', 'external_headers'],
+                     ['project_structure', 'headers', 'main_sources', 'external_headers']],
+       output=['dependencies_analysis'],
+       exposed=True,
+       cacheable=True)
+def analyze_dependencies(arguments: StageArguments):
+    file_system           = arguments.file_system
+    resources             = arguments.resources
+    compiler              = arguments.compiler
+    cache                 = arguments.cache
+    progress_bar_supplier = arguments.progress_bar_supplier
+
+    project_structure = resources['project_structure']
+    project_directory = project_structure.project_directory
+    headers           = resources['headers']
+    sources           = resources['main_sources']
+    if resources.activation == 0:
+        sources = sources + resources['test_sources']
+
+    dependencies = compiler.scan_dependencies_using_cache(project_structure,
+                                                          headers + resources['external_headers'],
+                                                          sources,
+                                                          cache,
+                                                          progress_bar_supplier,
+                                                          compiler.load_recorded_dependencies(project_structure))
+
+    def relative(path: str) -> str:
+        return relative_path(normalized_path(path), project_directory)
+
+    compile_times = {profile.source: profile.wall_time
+                     for profile in compiler.load_compilation_profiles(project_structure)}
+    dependencies  = {relative(source): [relative(d) for d in source_dependencies]
+                     for source, source_dependencies in dependencies.items()}
+    compile_times = {source: time for source, time in compile_times.items() if source in dependencies}
+    impacts       = analyze_header_impact([relative(header) for header in headers], dependencies, compile_times)
+    report        = format_include_report(impacts, len(dependencies), len(compile_times))
+
+    analysis = join(project_structure.target_root, 'dependencies-analysis.txt')
+    file_system.remove_file_if_it_exists(analysis)
+    with file_system.open_file(analysis, 'wb') as f:
+        f.write(report.encode())
+    file_system.print(report, end='')
+
+    resources['dependencies_analysis'] = analysis
@@ -0,0 +1,116 @@
+from praline.client.project.pipeline.stages import StageArguments
+from praline.client.project.pipeline.stage_resources import StageResources
+from praline.client.project.pipeline.stages.analyze_dependencies import analyze_dependencies
+from praline.common import ProjectStructure
+from praline.common.compiling.profiling import CompilationProfile
+from praline.common.progress_bar import ProgressBarSupplier
+from praline.common.testing import project_structure_dummy
+from praline.common.testing.file_system_mock import FileSystemMock
+
+from os.path import join
+from unittest import TestCase
+from typing import Any, Dict, List
+
+
+class CompilerWrapperMock:
+    def __init__(self,
+                 test_case: TestCase,
+                 expected_headers: List[str],
+                 dependencies: Dict[str, List[str]],
+                 profiles: List[CompilationProfile]):
+        self.test_case        = test_case
+        self.expected_headers = expected_headers
+        self.dependencies     = dependencies
+        self.profiles         = profiles
+        self.recorded         = {}
+
+    def scan_dependencies_using_cache(self,
+                                      project_structure: ProjectStructure,
+                                      headers: List[str],
+                                      sources: List[str],
+                                      cache: Dict[str, Any],
+                                      progress_bar_supplier: ProgressBarSupplier,
+                                      recorded: Dict[str, List[str]] = {}) -> Dict[str, List[str]]:
+        self.test_case.assertCountEqual(headers, self.expected_headers)
+        self.test_case.assertEqual(recorded, self.recorded)
+        return {source: self.dependencies[source] for source in sources}
+
+    def load_recorded_dependencies(self, project_structure: ProjectStructure) -> Dict[str, List[str]]:
+        return self.recorded
+
+    def load_compilation_profiles(self, project_structure: ProjectStructure) -> List[CompilationProfile]:
+        return self.profiles
+
+
+class AnalyzeDependenciesStageTest(TestCase):
+    def test_with_test_sources(self):
+        header_a = join(project_structure_dummy.sources_root, 'org', 'art', 'a.hpp')
+        source_a = join(project_structure_dummy.sources_root, 'org', 'art', 'a.cpp')
+        test_a   = join(project_structure_dummy.sources_root, 'org', 'art', 'a.test.cpp')
+
+        header_b = join(project_structure_dummy.sources_root, 'org', 'art', 'b.hpp')
+        source_b = join(project_structure_dummy.sources_root, 'org', 'art', 'b.cpp')
+
+        header_c = join(project_structure_dummy.external_headers_root, 'org', 'art', 'c.hpp')
+
+        compiler = CompilerWrapperMock(
+            self,
+            expected_headers=[
+                header_a,
+                header_b,
+                header_c,
+            ],
+            dependencies={
+                source_a: [source_a, header_a, header_b, header_c],
+                test_a: [test_a, header_a],
+                source_b: [source_b, header_b],
+            },
+            profiles=[
+                CompilationProfile(join('sources', 'org', 'art', 'a.cpp'), 2.0, None, {}, {}, {}),
+                CompilationProfile(join('sources', 'org', 'art', 'a.test.cpp'), 1.5, None, {}, {}, {}),
+                CompilationProfile(join('sources', 'org', 'art', 'removed.cpp'), 9.0, None, {}, {}, {})
+            ]
+        )
+
+        file_system = FileSystemMock(directories={project_structure_dummy.target_root})
+
+        with StageResources(
+            stage='analyze_dependencies',
+            activation=0,
+            resources={
+                'project_structure': project_structure_dummy,
+                'headers': [
+                    header_a,
+                    header_b,
+                ],
+                'main_sources': [
+                    source_a,
+                    source_b,
+                ],
+                'test_sources': [
+                    test_a,
+                ],
+                'external_headers': [
+                    header_c,
+                ]
+            },
+            constrained_output=['dependencies_analysis']
+        ) as resources:
+            stage_arguments = StageArguments(file_system=file_system, compiler=compiler, resources=resources)
+            analyze_dependencies(stage_arguments)
+
+        analysis = join(project_structure_dummy.target_root, 'dependencies-analysis.txt')
+
+        self.assertEqual(resources['dependencies_analysis'], analysis)
+
+        report = file_system.files[analysis].decode()
+
+        self.assertIn(report, file_system.stdout.getvalue())
+
+        self.assertEqual(report.splitlines()[0], "Impact of 2 headers on 3 translation units, with compile times from "
+                                                 "2 profiled translation units")
+
+        self.assertEqual(report.splitlines()[3:5], [
+            f"          2          3.50s  {join('sources', 'org', 'art', 'a.hpp')}  [fan-out]",
+            f"          2          2.00s* {join('sources', 'org', 'art', 'b.hpp')}  [fan-out]"
+        ])
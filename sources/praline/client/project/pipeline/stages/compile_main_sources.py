@@ -25,4 +25,5 @@ def compile_main_sources(arguments: StageArguments):
                                                              headers,
                                                              sources,
                                                              cache,
-                                                             progress_bar_supplier)
+                                                             progress_bar_supplier,
+                                                             unity='main')
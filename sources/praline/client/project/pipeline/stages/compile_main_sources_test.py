@@ -34,7 +34,8 @@ class CompilerWrapperMock:
                             headers: List[str],
                             sources: List[str],
                             cache: Dict[str, Any],
-                            progress_bar_supplier: ProgressBarSupplier) -> List[str]:
+                            progress_bar_supplier: ProgressBarSupplier,
+                            unity: str = None) -> List[str]:
         self.test_case.assertCountEqual(headers, self.expected_headers)
         return [self.sources_to_objects[source] for source in sources]
 
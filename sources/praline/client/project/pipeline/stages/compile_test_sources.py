@@ -24,4 +24,5 @@ def compile_test_sources(arguments: StageArguments):
                                                              headers,
                                                              sources,
                                                              cache,
-                                                             progress_bar_supplier)
+                                                             progress_bar_supplier,
+                                                             unity='test')
@@ -20,7 +20,8 @@ def format_headers(arguments: StageArguments):
             header = item.key
             if item.delta_type in [DeltaType.Added, DeltaType.Modified]:
                 progress_bar.update_summary(header)
-                file_system.execute_and_fail_on_bad_return([clang_format, '-i', '-style=file', header])
+                with file_system.rewriting(header):
+                    file_system.execute_and_fail_on_bad_return([clang_format, '-i', '-style=file', header])
             progress_bar.advance()
 
     resources['formatted_headers'] = headers
@@ -22,7 +22,8 @@ def format_main_executable_source(arguments: StageArguments):
             main_source = item.key
             if item.delta_type in [DeltaType.Added, DeltaType.Modified]:
                 progress_bar.update_summary(main_source)
-                file_system.execute_and_fail_on_bad_return([clang_format, '-i', '-style=file', main_source])
+                with file_system.rewriting(main_source):
+                    file_system.execute_and_fail_on_bad_return([clang_format, '-i', '-style=file', main_source])
             progress_bar.advance()
 
     resources['formatted_main_executable_source'] = resources['main_executable_source']
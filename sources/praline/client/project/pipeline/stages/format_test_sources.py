@@ -20,7 +20,8 @@ def format_test_sources(arguments: StageArguments):
             test_source = item.key
             if item.delta_type in [DeltaType.Added, DeltaType.Modified]:
                 progress_bar.update_summary(test_source)
-                file_system.execute_and_fail_on_bad_return([clang_format, '-i', '-style=file', test_source])
+                with file_system.rewriting(test_source):
+                    file_system.execute_and_fail_on_bad_return([clang_format, '-i', '-style=file', test_source])
             progress_bar.advance()
 
     resources['formatted_test_sources'] = test_sources
@@ -11,7 +11,9 @@ def link_main_executable(arguments: StageArguments):
     cache             = arguments.cache
     
     project_structure             = resources['project_structure']
-    main_objects                  = resources['main_objects'] + [resources['main_executable_object']]
+    main_executable_object        = resources['main_executable_object']
+    main_objects                  = [o for o in resources['main_objects'] if o != main_executable_object]
+    main_objects                  = main_objects + [main_executable_object]
     external_libraries            = resources['external_libraries']
     external_libraries_interfaces = resources['external_libraries_interfaces']
     artifact_identifier           = artifact_manifest.get_artifact_identifier()
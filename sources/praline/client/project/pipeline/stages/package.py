@@ -1,4 +1,5 @@
 from praline.client.project.pipeline.stages import StageArguments, stage
+from praline.common import ArchiveFormat
 from praline.common.package import manifest_file_name, pack, write_artifact_manifest
 from praline.common.file_system import join, relative_path
 
@@ -63,8 +64,9 @@ def package(arguments: StageArguments):
             package_files.append((main_library_symbols_table,
                                   relative_path(main_library_symbols_table, target_root)))
     
-    package_path = join(project_structure.external_packages_root, 
-                        artifact_manifest.get_package_file_name_and_instantiate_snapshot())
+    archive_format = ArchiveFormat(arguments.configuration.get('package-format', ArchiveFormat.gz))
+    package_path   = join(project_structure.external_packages_root, 
+                          artifact_manifest.get_package_file_name_and_instantiate_snapshot(archive_format))
 
     pack(file_system, package_path, package_files)
 
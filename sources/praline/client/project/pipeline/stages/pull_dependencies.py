@@ -1,7 +1,11 @@
 from praline.client.project.pipeline.stages import StageArguments, stage
-from praline.common.file_system import join
+from praline.client.repository.package_store import PackageStore
+from praline.common.concurrency import parallel_map
+from praline.common.file_system import basename, expand_user, join
 from praline.common.hashing import delta, DeltaType, progression_resolution
-from praline.common.package import clean_up_package, get_package_contents, unpack
+from praline.common.package import clean_up_package, contents_suffix, get_package_contents, unpack, unpack_streaming
+
+from typing import Dict, List
 
 
 @stage(requirements=[['project_structure']],
@@ -10,6 +14,7 @@ from praline.common.package import clean_up_package, get_package_contents, unpac
        cacheable=True, exposed=True)
 def pull_dependencies(arguments: StageArguments):
     file_system           = arguments.file_system
+    configuration         = arguments.configuration
     resources             = arguments.resources
     artifact_manifest     = arguments.artifact_manifest
     remote_proxy          = arguments.remote_proxy
@@ -36,36 +41,67 @@ def pull_dependencies(arguments: StageArguments):
     package_hashes = remote_proxy.solve_dependencies(artifact_manifest)
 
     external_root = project_structure.external_root
+
+    streaming = configuration.get('stream-dependencies', False)
+
+    package_store = None
+    if 'package-store-directory' in configuration:
+        package_store = PackageStore(file_system, expand_user(configuration['package-store-directory']))
+
+    def pull(package_path: str) -> Dict[str, List[str]]:
+        if package_store != None:
+            package_hash = package_hashes[basename(package_path)]
+            if not package_store.contains(package_hash):
+                package_store.populate(remote_proxy, basename(package_path), package_hash, streaming)
+            return package_store.link(package_hash, package_path, external_root)
+        if not streaming:
+            remote_proxy.pull_package(package_path)
+            return None
+        expected_hash = package_hashes[basename(package_path)]
+        return remote_proxy.stream_package(package_path, 
+                                           lambda stream: unpack_streaming(file_system, 
+                                                                           stream, 
+                                                                           package_path, 
+                                                                           external_root, 
+                                                                           expected_hash))
     
     new_cache  = {}
     packages   = package_hashes.keys()
     resolution = progression_resolution(packages, cache)
+    contents   = {}
+    pending    = []
     with progress_bar_supplier.create(resolution) as progress_bar:
         for item in delta(packages, lambda p: package_hashes[p], cache, new_cache):
-            package = item.key
-            progress_bar.update_summary(package)
+            package      = item.key
             package_path = join(project_structure.external_packages_root, package)
             if item.delta_type == DeltaType.Added:
-                remote_proxy.pull_package(package_path)
-                contents = unpack(file_system, package_path, external_root)
-                extend_externals(contents)
+                pending.append(package_path)
             elif item.delta_type == DeltaType.Modified:
                 clean_up_package(file_system, package_path, external_root)
-                remote_proxy.pull_package(package_path)
-                contents = unpack(file_system, package_path, external_root)
-                extend_externals(contents)
+                pending.append(package_path)
             elif item.delta_type == DeltaType.UpToDate:
-                if not file_system.exists(package_path):
+                if not file_system.exists(package_path) and not file_system.exists(package_path + contents_suffix):
                     clean_up_package(file_system, package_path, external_root)
-                    remote_proxy.pull_package(package_path)
-                    contents = unpack(file_system, package_path, external_root)
-                    extend_externals(contents)
+                    pending.append(package_path)
                 else:
-                    contents = get_package_contents(file_system, package_path, external_root)
-                    extend_externals(contents)
+                    contents[package] = get_package_contents(file_system, package_path, external_root)
+                    progress_bar.update_summary(package)
+                    progress_bar.advance()
             elif item.delta_type == DeltaType.Removed:
                 clean_up_package(file_system, package_path, external_root)
+                progress_bar.update_summary(package)
+                progress_bar.advance()
+
+        for package_path, unpacked in parallel_map(pull, pending, remote_proxy.connections):
+            package = basename(package_path)
+            if unpacked == None:
+                unpacked = unpack(file_system, package_path, external_root)
+            contents[package] = unpacked
+            progress_bar.update_summary(package)
             progress_bar.advance()
+
+    for package in sorted(contents):
+        extend_externals(contents[package])
     
     cache.clear()
     cache.update(new_cache)
@@ -0,0 +1,168 @@
+from praline.client.project.pipeline.stage_resources import StageResources
+from praline.client.project.pipeline.stages.pull_dependencies import pull_dependencies
+from praline.client.project.pipeline.stages import StageArguments
+from praline.common.testing import project_structure_dummy
+from praline.common.testing.file_system_mock import ArchiveMock, FileSystemMock
+from praline.common.package import PackageHashMismatchError
+from praline.common.testing.progress_bar_mock import ProgressBarSupplierMock
+
+from hashlib import sha3_256
+from os.path import basename, join
+from threading import Lock
+from typing import Dict
+from unittest import TestCase
+
+
+def hash_package(archive: ArchiveMock) -> str:
+    return sha3_256(b''.join(name.encode() + contents for name, contents in archive.members.items())).hexdigest()
+
+
+class RemoteProxyMock:
+    def __init__(self, file_system: FileSystemMock, packages: Dict[str, ArchiveMock], connections: int):
+        self.file_system = file_system
+        self.packages    = packages
+        self.connections = connections
+        self.pulled      = []
+        self.lock        = Lock()
+
+    def solve_dependencies(self, artifact_manifest) -> Dict[str, str]:
+        return {package: hash_package(archive) for package, archive in self.packages.items()}
+
+    def pull_package(self, package_path: str) -> None:
+        with self.lock:
+            self.pulled.append(basename(package_path))
+            self.file_system.files[package_path] = self.packages[basename(package_path)]
+
+    def stream_package(self, package_path: str, consume):
+        with self.lock:
+            self.pulled.append(basename(package_path))
+        return consume(self.packages[basename(package_path)])
+
+
+class PullDependenciesStageTest(TestCase):
+    def setUp(self):
+        self.external_root = external_root = project_structure_dummy.external_root
+        self.packages_root = packages_root = project_structure_dummy.external_packages_root
+        self.a             = a             = 'org-aa-x64-linux-gcc-debug-1.0.0.tar.gz'
+        self.b             = b             = 'org-bb-x64-linux-gcc-debug-1.0.0.tar.gz'
+        self.c             = c             = 'org-cc-x64-linux-gcc-debug-1.0.0.tar.gz'
+        self.d             = d             = 'org-dd-x64-linux-gcc-debug-1.0.0.tar.gz'
+
+        self.file_system = FileSystemMock(
+            directories={
+                packages_root,
+                join(external_root, 'headers', 'org', 'cc'),
+                join(external_root, 'headers', 'org', 'dd'),
+            },
+            files={
+                join(packages_root, c): ArchiveMock({'headers/org/cc/c.hpp': b'c'}),
+                join(packages_root, d): ArchiveMock({'headers/org/dd/d.hpp': b'd'}),
+                join(external_root, 'headers', 'org', 'cc', 'c.hpp'): b'c',
+                join(external_root, 'headers', 'org', 'dd', 'd.hpp'): b'd',
+            }
+        )
+
+        self.remote_proxy = RemoteProxyMock(self.file_system, {
+            a: ArchiveMock({'.manifest': b'manifest', 'headers/org/aa/a.hpp': b'PRALINE_EXPORT a'}),
+            b: ArchiveMock({'headers/org/bb/b.hpp': b'b'}),
+            c: ArchiveMock({'headers/org/cc/c.hpp': b'c'}),
+        }, connections=2)
+
+        self.cache = {c: hash_package(self.remote_proxy.packages[c]), d: 'hash'}
+
+    def pull_dependencies(self, configuration, expected_resolution=4):
+        with StageResources(stage='pull_dependencies',
+                            activation=0,
+                            resources={'project_structure': project_structure_dummy},
+                            constrained_output=['external_resources', 'external_headers', 'external_executables',
+                                                'external_libraries', 'external_libraries_interfaces',
+                                                'external_symbols_tables']) as resources:
+            stage_arguments = StageArguments(file_system=self.file_system,
+                                             configuration=configuration,
+                                             resources=resources,
+                                             remote_proxy=self.remote_proxy,
+                                             cache=self.cache,
+                                             progress_bar_supplier=ProgressBarSupplierMock(self,
+                                                                                           expected_resolution=expected_resolution))
+            pull_dependencies(stage_arguments)
+        return resources
+
+    def check_pulled_dependencies(self, resources):
+        external_root = self.external_root
+
+        self.assertCountEqual(self.remote_proxy.pulled, [self.a, self.b])
+
+        self.assertEqual(resources['external_headers'], [join(external_root, 'headers/org/aa/a.hpp'),
+                                                         join(external_root, 'headers/org/bb/b.hpp'),
+                                                         join(external_root, 'headers/org/cc/c.hpp')])
+
+        self.assertEqual(self.file_system.files[join(external_root, 'headers', 'org', 'aa', 'a.hpp')], 
+                         b'PRALINE_IMPORT a')
+
+        self.assertNotIn(join(self.packages_root, self.d), self.file_system.files)
+
+        self.assertNotIn(join(external_root, 'headers', 'org', 'dd', 'd.hpp'), self.file_system.files)
+
+        self.assertEqual(self.cache, self.remote_proxy.solve_dependencies(None))
+
+    def test_pull_dependencies_stage(self):
+        resources = self.pull_dependencies({})
+
+        self.check_pulled_dependencies(resources)
+
+        self.assertIn(join(self.packages_root, self.a), self.file_system.files)
+
+    def test_pull_dependencies_stage_with_streaming(self):
+        resources = self.pull_dependencies({'stream-dependencies': True})
+
+        self.check_pulled_dependencies(resources)
+
+        self.assertNotIn(join(self.packages_root, self.a), self.file_system.files)
+
+        self.remote_proxy.pulled = []
+
+        resources = self.pull_dependencies({'stream-dependencies': True}, expected_resolution=3)
+
+        self.assertEqual(self.remote_proxy.pulled, [])
+
+        self.assertEqual(resources['external_headers'], [join(self.external_root, 'headers/org/aa/a.hpp'),
+                                                         join(self.external_root, 'headers/org/bb/b.hpp'),
+                                                         join(self.external_root, 'headers/org/cc/c.hpp')])
+
+    def test_pull_dependencies_stage_with_streaming_and_corrupted_package(self):
+        solve_dependencies = self.remote_proxy.solve_dependencies
+
+        self.remote_proxy.solve_dependencies = lambda manifest: {**solve_dependencies(manifest), self.b: 'hash'}
+
+        self.assertRaises(PackageHashMismatchError, self.pull_dependencies, {'stream-dependencies': True})
+
+        self.assertNotIn(join(self.external_root, 'headers', 'org', 'bb', 'b.hpp'), self.file_system.files)
+
+    def test_pull_dependencies_stage_with_package_store(self):
+        for streaming in [False, True]:
+            self.remote_proxy.pulled = []
+
+            self.cache.clear()
+
+            self.file_system.remove_directory_recursively_if_it_exists(self.external_root)
+
+            self.file_system.create_directory_if_missing(self.packages_root)
+
+            configuration = {'stream-dependencies': streaming, 'package-store-directory': 'store'}
+
+            resources = self.pull_dependencies(configuration, expected_resolution=3)
+
+            self.assertCountEqual(self.remote_proxy.pulled, [] if streaming else [self.a, self.b, self.c])
+
+            self.assertEqual(resources['external_headers'], [join(self.external_root, 'headers/org/aa/a.hpp'),
+                                                             join(self.external_root, 'headers/org/bb/b.hpp'),
+                                                             join(self.external_root, 'headers/org/cc/c.hpp')])
+
+            self.assertEqual(self.file_system.files[join(self.external_root, 'headers', 'org', 'aa', 'a.hpp')], 
+                             b'PRALINE_IMPORT a')
+
+            self.assertNotIn(join(self.packages_root, self.a), self.file_system.files)
+
+            self.assertIn(join(self.packages_root, self.a) + '.contents', self.file_system.files)
+
+            self.assertEqual(self.cache, self.remote_proxy.solve_dependencies(None))
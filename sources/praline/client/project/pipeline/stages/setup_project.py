@@ -23,7 +23,7 @@ def setup_project(arguments: StageArguments):
     resources         = arguments.resources
 
     project_directory = file_system.get_working_directory()
-    target_root       = join(project_directory, 'target')
+    target_root       = join(project_directory, 'target', artifact_manifest.get_configuration_identifier())
     external_root     = join(target_root, 'external')
 
     organization      = artifact_manifest.organization
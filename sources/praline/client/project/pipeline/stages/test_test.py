@@ -12,9 +12,9 @@ from unittest import TestCase
 
 class TestStageTest(TestCase):
     def test_main(self):
-        executables_root        = join('project', 'target', 'executables')
-        external_libraries_root = join('project', 'target', 'external', 'libraries')
-        test_executable         = join('project', 'target', 'executables', 'test.exe')
+        executables_root        = project_structure_dummy.executables_root
+        external_libraries_root = project_structure_dummy.external_libraries_root
+        test_executable         = join(executables_root, 'test.exe')
         test_program_arguments  = ['test', 'program', 'arguments']
 
         header_length = 101
@@ -0,0 +1,101 @@
+from praline.common.concurrency import MappingInterruptedError
+from praline.common.file_system import FileSystem
+
+from contextlib import contextmanager
+from logging import getLogger
+from threading import Event, Lock, Thread
+from time import sleep
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+logger = getLogger(__name__)
+
+
+class Watcher:
+    def __init__(self, file_system: FileSystem, directories: List[str], interval: float = 0.25, debounce: float = 0.25):
+        self.file_system = file_system
+        self.directories = directories
+        self.interval    = interval
+        self.debounce    = debounce
+        self.lock        = Lock()
+        self.rewriting   = set()
+        self.rewritten   = {}
+
+    def snapshot(self) -> Dict[str, Tuple[int, float]]:
+        snapshot = {}
+        for directory in self.directories:
+            if not self.file_system.exists(directory):
+                continue
+            for path in self.file_system.files_in_directory(directory):
+                try:
+                    snapshot[path] = (self.file_system.get_size(path), self.file_system.get_modification_time(path))
+                except FileNotFoundError:
+                    pass
+        return snapshot
+
+    def wait_for_changes(self, snapshot: Dict[str, Tuple[int, float]]) -> Dict[str, Tuple[int, float]]:
+        current = self.snapshot()
+        while current == snapshot:
+            sleep(self.interval)
+            current = self.snapshot()
+        while True:
+            sleep(self.debounce)
+            settled = self.snapshot()
+            if settled == current:
+                return settled
+            current = settled
+
+    @contextmanager
+    def rewrite(self, path: str) -> Iterator[None]:
+        with self.lock:
+            self.rewriting.add(path)
+        try:
+            yield
+        finally:
+            try:
+                stat = (self.file_system.get_size(path), self.file_system.get_modification_time(path))
+            except FileNotFoundError:
+                stat = None
+            with self.lock:
+                self.rewritten[path] = stat
+                self.rewriting.discard(path)
+
+    def acknowledge_rewrites(self, snapshot: Dict[str, Tuple[int, float]]) -> Dict[str, Tuple[int, float]]:
+        with self.lock:
+            acknowledged = {**snapshot, **self.rewritten}
+        return {path: stat for path, stat in acknowledged.items() if stat != None}
+
+    def monitor(self, snapshot: Dict[str, Tuple[int, float]], interruption: Event, finished: Event) -> None:
+        while not finished.wait(self.interval):
+            current  = self.snapshot()
+            expected = self.acknowledge_rewrites(snapshot)
+            with self.lock:
+                rewriting = set(self.rewriting)
+            changed = {path for path in current.keys() | expected.keys() if current.get(path) != expected.get(path)}
+            if changed - rewriting:
+                logger.info("sources changed during the build, cancelling compilations")
+                interruption.set()
+                return
+
+    def watch(self, build: Callable[[], None], interruption: Event) -> None:
+        self.file_system.interruption = interruption
+        self.file_system.on_rewrite   = self.rewrite
+        snapshot = self.snapshot()
+        while True:
+            interruption.clear()
+            with self.lock:
+                self.rewritten = {}
+            finished = Event()
+            monitor  = Thread(target=self.monitor, args=(snapshot, interruption, finished), daemon=True)
+            monitor.start()
+            try:
+                build()
+            except MappingInterruptedError:
+                logger.info("build was superseded by newer changes")
+            except Exception as exception:
+                logger.error(exception)
+            finally:
+                finished.set()
+                monitor.join()
+            logger.info(f"watching {', '.join(self.directories)} for changes")
+            snapshot = self.wait_for_changes(self.acknowledge_rewrites(snapshot))
@@ -0,0 +1,129 @@
+from praline.client.project.pipeline.watching import Watcher
+from praline.common.concurrency import MappingInterruptedError
+from praline.common.testing.file_system_mock import FileSystemMock
+
+from os.path import join
+from threading import Event, Timer
+from unittest import TestCase
+
+
+class StopWatchingError(BaseException):
+    pass
+
+
+class WatcherTest(TestCase):
+    def test_snapshot(self):
+        file_system = FileSystemMock(
+            directories={
+                'project/sources',
+                'project/resources'
+            },
+            files={
+                'project/sources/a.cpp': b'a',
+                'project/resources/b.txt': b'bb',
+                'project/Pralinefile': b'...'
+            }
+        )
+        watcher = Watcher(file_system, ['project/sources', 'project/resources', 'project/missing'])
+
+        self.assertEqual(watcher.snapshot(), {
+            join('project', 'sources', 'a.cpp'): (1, 0),
+            join('project', 'resources', 'b.txt'): (2, 0)
+        })
+
+    def test_wait_for_changes(self):
+        file_system = FileSystemMock(
+            directories={
+                'project/sources'
+            },
+            files={
+                'project/sources/a.cpp': b'a'
+            }
+        )
+        watcher  = Watcher(file_system, ['project/sources'], interval=0.01, debounce=0.01)
+        snapshot = watcher.snapshot()
+
+        timer = Timer(0.05, file_system.touch, ['project/sources/a.cpp'])
+        timer.start()
+        changed = watcher.wait_for_changes(snapshot)
+        timer.join()
+
+        self.assertNotEqual(changed, snapshot)
+
+        self.assertEqual(changed, watcher.snapshot())
+
+    def test_watch_rebuilds_on_changes(self):
+        file_system = FileSystemMock(
+            directories={
+                'project/sources'
+            },
+            files={
+                'project/sources/a.cpp': b'a'
+            }
+        )
+        watcher = Watcher(file_system, ['project/sources'], interval=0.01, debounce=0.01)
+        builds  = []
+
+        def build():
+            builds.append(watcher.snapshot())
+            if len(builds) == 1:
+                Timer(0.05, file_system.touch, ['project/sources/a.cpp']).start()
+                raise ValueError("compilation failed")
+            raise StopWatchingError()
+
+        self.assertRaises(StopWatchingError, watcher.watch, build, Event())
+
+        self.assertEqual(len(builds), 2)
+
+        self.assertNotEqual(builds[0], builds[1])
+
+    def test_watch_interrupts_superseded_builds(self):
+        file_system = FileSystemMock(
+            directories={
+                'project/sources'
+            },
+            files={
+                'project/sources/a.cpp': b'a'
+            }
+        )
+        watcher      = Watcher(file_system, ['project/sources'], interval=0.01, debounce=0.01)
+        interruption = Event()
+        builds       = []
+
+        def build():
+            builds.append(interruption.is_set())
+            if len(builds) == 1:
+                file_system.touch('project/sources/a.cpp')
+                self.assertTrue(interruption.wait(1))
+                raise MappingInterruptedError()
+            raise StopWatchingError()
+
+        self.assertRaises(StopWatchingError, watcher.watch, build, interruption)
+
+        self.assertEqual(builds, [False, False])
+
+    def test_watch_ignores_rewrites_by_praline(self):
+        file_system = FileSystemMock(
+            directories={
+                'project/sources'
+            },
+            files={
+                'project/sources/a.cpp': b'a'
+            }
+        )
+        watcher      = Watcher(file_system, ['project/sources'], interval=0.01, debounce=0.01)
+        interruption = Event()
+        snapshot     = watcher.snapshot()
+
+        def build():
+            with file_system.rewriting(join('project', 'sources', 'a.cpp')):
+                file_system.touch('project/sources/a.cpp')
+                self.assertFalse(interruption.wait(0.05))
+            self.assertFalse(interruption.wait(0.05))
+            raise StopWatchingError()
+
+        self.assertRaises(StopWatchingError, watcher.watch, build, interruption)
+
+        self.assertNotEqual(watcher.snapshot(), snapshot)
+
+        self.assertEqual(watcher.acknowledge_rewrites(snapshot), watcher.snapshot())
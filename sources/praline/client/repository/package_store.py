@@ -0,0 +1,85 @@
+from praline.client.repository.remote_proxy import RemoteProxy
+from praline.common.file_system import FileSystem, directory_name, join, relative_path
+from praline.common.hashing import hash_archive
+from praline.common.package import PackageHashMismatchError, contents_suffix, unpack, unpack_streaming
+from praline.common.tracing import trace
+
+import json
+from logging import getLogger
+from typing import Dict, List
+from uuid import uuid4
+
+
+logger = getLogger(__name__)
+
+
+class PackageStore:
+    def __init__(self, file_system: FileSystem, directory: str):
+        self.file_system = file_system
+        self.directory   = directory
+
+    def __repr__(self) -> str:
+        return f'PackageStore({self.directory})'
+
+    def get_entry(self, package_hash: str) -> str:
+        return join(self.directory, package_hash[:2], package_hash)
+
+    def contains(self, package_hash: str) -> bool:
+        return self.file_system.exists(join(self.get_entry(package_hash), contents_suffix))
+
+    @trace
+    def populate(self, remote_proxy: RemoteProxy, package: str, package_hash: str, streaming: bool) -> None:
+        entry     = self.get_entry(package_hash)
+        temporary = f'{entry}.{uuid4().hex}'
+        archive   = join(temporary, package)
+        self.file_system.create_directory_if_missing(temporary)
+        try:
+            if streaming:
+                contents = remote_proxy.stream_package(archive,
+                                                       lambda stream: unpack_streaming(self.file_system,
+                                                                                       stream,
+                                                                                       archive,
+                                                                                       temporary,
+                                                                                       package_hash))
+            else:
+                remote_proxy.pull_package(archive)
+                if hash_archive(self.file_system, archive) != package_hash:
+                    raise PackageHashMismatchError(f"package '{package}' doesn't match its hash {package_hash}")
+                contents = unpack(self.file_system, archive, temporary)
+            self.file_system.remove_file_if_it_exists(archive)
+            self.file_system.remove_file_if_it_exists(archive + contents_suffix)
+
+            listing = {root: [relative_path(f, temporary) for f in files] for root, files in contents.items()}
+            with self.file_system.open_file(join(temporary, contents_suffix), 'wb') as f:
+                f.write(json.dumps(listing).encode())
+        except Exception:
+            self.file_system.remove_directory_recursively_if_it_exists(temporary)
+            raise
+
+        try:
+            self.file_system.rename(temporary, entry)
+        except OSError:
+            self.file_system.remove_directory_recursively(temporary)
+            if not self.contains(package_hash):
+                raise
+        logger.debug(f"package store populated with '{package}' under '{entry}'")
+
+    @trace
+    def link(self, package_hash: str, package_path: str, extraction_path: str) -> Dict[str, List[str]]:
+        entry = self.get_entry(package_hash)
+        with self.file_system.open_file(join(entry, contents_suffix), 'rb') as f:
+            listing = json.loads(f.read().decode())
+
+        contents = {}
+        for root, files in listing.items():
+            contents[root] = []
+            for file in files:
+                path = join(extraction_path, file)
+                self.file_system.create_directory_if_missing(directory_name(path))
+                self.file_system.remove_file_if_it_exists(path)
+                self.file_system.link_or_copy_file(join(entry, file), path)
+                contents[root].append(path)
+
+        with self.file_system.open_file(package_path + contents_suffix, 'wb') as f:
+            f.write(json.dumps(contents).encode())
+        return contents
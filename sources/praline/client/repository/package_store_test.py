@@ -0,0 +1,115 @@
+from praline.client.repository.package_store import PackageStore
+from praline.common.package import PackageHashMismatchError
+from praline.common.testing.file_system_mock import ArchiveMock, FileSystemMock
+
+from hashlib import sha3_256
+from os.path import basename, join, normpath
+from typing import Dict
+from unittest import TestCase
+
+
+def hash_package(archive: ArchiveMock) -> str:
+    return sha3_256(b''.join(name.encode() + contents for name, contents in archive.members.items())).hexdigest()
+
+
+class RemoteProxyMock:
+    def __init__(self, file_system: FileSystemMock, packages: Dict[str, ArchiveMock]):
+        self.file_system = file_system
+        self.packages    = packages
+        self.pulled      = []
+
+    def pull_package(self, package_path: str) -> None:
+        self.pulled.append(basename(package_path))
+        self.file_system.files[normpath(package_path)] = self.packages[basename(package_path)]
+
+    def stream_package(self, package_path: str, consume):
+        self.pulled.append(basename(package_path))
+        return consume(self.packages[basename(package_path)])
+
+
+class PackageStoreTest(TestCase):
+    def setUp(self):
+        self.package = package = 'org-aa-x64-linux-gcc-debug-1.0.0.tar.gz'
+        self.archive = archive = ArchiveMock({
+            '.manifest': b'manifest',
+            'headers/org/aa/a.hpp': b'PRALINE_EXPORT a',
+            'libraries/org-aa-x64-linux-gcc-debug-1.0.0.so': b'library'
+        })
+        self.package_hash = hash_package(archive)
+
+        self.file_system   = FileSystemMock(directories={'store', 
+                                                           'project/target/external/packages', 
+                                                           'other_project/target/external/packages'})
+        self.remote_proxy  = RemoteProxyMock(self.file_system, {package: archive})
+        self.package_store = PackageStore(self.file_system, 'store')
+
+    def check_populated_store(self):
+        entry = join('store', self.package_hash[:2], self.package_hash)
+
+        self.assertTrue(self.package_store.contains(self.package_hash))
+
+        self.assertEqual(self.remote_proxy.pulled, [self.package])
+
+        self.assertCountEqual([f for f in self.file_system.files if f.startswith('store')],
+                              [join(entry, '.contents'),
+                               join(entry, 'headers', 'org', 'aa', 'a.hpp'),
+                               join(entry, 'libraries', 'org-aa-x64-linux-gcc-debug-1.0.0.so')])
+
+        self.assertEqual(self.file_system.files[join(entry, 'headers', 'org', 'aa', 'a.hpp')], b'PRALINE_IMPORT a')
+
+    def check_linked_package(self, external_root: str):
+        package_path = join(external_root, 'packages', self.package)
+
+        contents = self.package_store.link(self.package_hash, package_path, external_root)
+
+        self.assertEqual(contents['headers'], [join(external_root, 'headers', 'org', 'aa', 'a.hpp')])
+
+        self.assertEqual(contents['libraries'], [join(external_root, 'libraries',
+                                                      'org-aa-x64-linux-gcc-debug-1.0.0.so')])
+
+        self.assertEqual(self.file_system.files[join(external_root, 'headers', 'org', 'aa', 'a.hpp')],
+                         b'PRALINE_IMPORT a')
+
+        self.assertIn(package_path + '.contents', self.file_system.files)
+
+        self.assertNotIn(package_path, self.file_system.files)
+
+    def test_populate_and_link(self):
+        self.assertFalse(self.package_store.contains(self.package_hash))
+
+        self.package_store.populate(self.remote_proxy, self.package, self.package_hash, streaming=False)
+
+        self.check_populated_store()
+
+        self.check_linked_package(join('project', 'target', 'external'))
+
+        self.check_linked_package(join('other_project', 'target', 'external'))
+
+    def test_populate_with_streaming_and_link(self):
+        self.package_store.populate(self.remote_proxy, self.package, self.package_hash, streaming=True)
+
+        self.check_populated_store()
+
+        self.check_linked_package(join('project', 'target', 'external'))
+
+    def test_populate_with_corrupted_package(self):
+        for streaming in [False, True]:
+            self.assertRaises(PackageHashMismatchError,
+                              self.package_store.populate,
+                              self.remote_proxy,
+                              self.package,
+                              'hash',
+                              streaming)
+
+            self.assertFalse(self.package_store.contains('hash'))
+
+            self.assertEqual([f for f in self.file_system.files if f.startswith('store')], [])
+
+    def test_populate_already_populated_by_another_process(self):
+        entry = join('store', self.package_hash[:2], self.package_hash)
+
+        self.file_system.create_file_if_missing(join(entry, '.contents'), b'{"headers": []}')
+
+        self.package_store.populate(self.remote_proxy, self.package, self.package_hash, streaming=False)
+
+        self.assertEqual([f for f in self.file_system.files if f.startswith('store')], [join(entry, '.contents')])
@@ -0,0 +1,81 @@
+from praline.client.repository.remote_proxy import RemoteProxy
+from praline.common import RemoteCacheMode
+from praline.common.compiling.object_cache import ObjectCache, metadata_suffix
+from praline.common.file_system import FileSystem
+from praline.common.hashing import hash_file, hash_pattern
+
+from logging import getLogger
+from typing import Any, Tuple
+
+import json
+import requests
+
+
+logger = getLogger(__name__)
+
+
+class RemoteCacheEntryError(Exception):
+    pass
+
+
+class RemoteObjectCache(ObjectCache):
+    def __init__(self,
+                 file_system: FileSystem,
+                 directory: str,
+                 size_limit: int,
+                 remote_proxy: RemoteProxy,
+                 mode: RemoteCacheMode):
+        super().__init__(file_system, directory, size_limit)
+        self.remote_proxy = remote_proxy
+        self.mode         = mode
+
+    def __repr__(self) -> str:
+        return f'RemoteObjectCache({self.directory}, {self.remote_proxy}, {self.mode})'
+
+    def fetch(self, key: str, object_: str) -> Tuple[bool, Any]:
+        hit, metadata = super().fetch(key, object_)
+        if hit:
+            return (hit, metadata)
+
+        object_temporary   = self.get_temporary(key)
+        metadata_temporary = self.get_temporary(key)
+        try:
+            if not self.remote_proxy.pull_cache_entry(key + metadata_suffix, metadata_temporary):
+                return (False, None)
+            with self.file_system.open_file(metadata_temporary, 'rb') as f:
+                entry = json.loads(f.read().decode())
+            object_hash = entry.get('object') if isinstance(entry, dict) else None
+            if not isinstance(object_hash, str) or not hash_pattern.fullmatch(object_hash):
+                raise RemoteCacheEntryError(f"invalid object hash in remote cache entry {key}")
+            if not self.remote_proxy.pull_cache_entry(object_hash, object_temporary):
+                return (False, None)
+            if hash_file(self.file_system, object_temporary) != object_hash:
+                raise RemoteCacheEntryError(f"object {object_hash} doesn't match its hash")
+            self.file_system.remove_file(metadata_temporary)
+            with self.file_system.open_file(metadata_temporary, 'wb') as f:
+                f.write(json.dumps(entry.get('metadata')).encode())
+            self.commit(key, object_temporary, metadata_temporary)
+        except (requests.RequestException, RuntimeError, ValueError, RemoteCacheEntryError) as exception:
+            logger.warning(f"couldn't pull cache entry {key} from remote -- {exception}")
+            return (False, None)
+        finally:
+            self.file_system.remove_file_if_it_exists(object_temporary)
+            self.file_system.remove_file_if_it_exists(metadata_temporary)
+
+        return super().fetch(key, object_)
+
+    def store(self, key: str, object_: str, metadata: Any = None) -> None:
+        super().store(key, object_, metadata)
+        if self.mode == RemoteCacheMode.read_write:
+            object_entry = self.get_entry(key)
+            object_hash  = hash_file(self.file_system, object_entry)
+            temporary    = self.get_temporary(key)
+            try:
+                with self.file_system.open_file(temporary, 'wb') as f:
+                    f.write(json.dumps({'object': object_hash, 'metadata': metadata}).encode())
+                self.remote_proxy.push_cache_entry(object_hash, object_entry)
+                self.remote_proxy.push_cache_entry(key + metadata_suffix, temporary)
+            except (requests.RequestException, RuntimeError) as exception:
+                logger.warning(f"couldn't push cache entry {key} to remote -- {exception}")
+            finally:
+                self.file_system.remove_file_if_it_exists(temporary)
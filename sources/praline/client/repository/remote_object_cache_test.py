@@ -0,0 +1,137 @@
+from praline.client.repository.remote_object_cache import RemoteObjectCache
+from praline.common import RemoteCacheMode
+from praline.common.testing.file_system_mock import FileSystemMock
+
+from hashlib import sha3_256
+from os.path import join, normpath
+from typing import Dict
+from unittest import TestCase
+
+import json
+import requests
+
+
+object_hash = sha3_256(b'object-a.').hexdigest()
+
+
+class RemoteProxyMock:
+    def __init__(self, file_system: FileSystemMock, entries: Dict[str, bytes], available: bool = True):
+        self.file_system = file_system
+        self.entries     = entries
+        self.available   = available
+
+    def pull_cache_entry(self, name: str, path: str) -> bool:
+        if not self.available:
+            raise requests.ConnectionError("remote is unavailable")
+        if name not in self.entries:
+            return False
+        with self.file_system.open_file(path, 'wb') as f:
+            f.write(self.entries[name])
+        return True
+
+    def push_cache_entry(self, name: str, path: str) -> None:
+        if not self.available:
+            raise requests.ConnectionError("remote is unavailable")
+        with self.file_system.open_file(path, 'rb') as f:
+            self.entries[name] = f.read()
+
+
+class RemoteObjectCacheTest(TestCase):
+    def test_fetch_from_remote(self):
+        file_system  = FileSystemMock(directories={'cache', 'target/objects'})
+        remote_proxy = RemoteProxyMock(file_system, {
+            object_hash: b'object-a.',
+            'abcd.metadata': json.dumps({'object': object_hash, 'metadata': ['sources/a.hpp']}).encode()
+        })
+        object_cache = RemoteObjectCache(file_system, 'cache', 1024, remote_proxy, RemoteCacheMode.read_only)
+
+        hit, metadata = object_cache.fetch('abcd', 'target/objects/a.o')
+
+        self.assertTrue(hit)
+
+        self.assertEqual(metadata, ['sources/a.hpp'])
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.o')], b'object-a.')
+
+        self.assertTrue(file_system.exists(join('cache', 'ab', 'abcd')))
+
+    def test_fetch_tampered_object_from_remote(self):
+        file_system  = FileSystemMock(directories={'cache', 'target/objects'})
+        remote_proxy = RemoteProxyMock(file_system, {
+            object_hash: b'tampered-object-a.',
+            'abcd.metadata': json.dumps({'object': object_hash, 'metadata': ['sources/a.hpp']}).encode()
+        })
+        object_cache = RemoteObjectCache(file_system, 'cache', 1024, remote_proxy, RemoteCacheMode.read_only)
+
+        with self.assertLogs('praline.client.repository.remote_object_cache', level='WARNING'):
+            hit, metadata = object_cache.fetch('abcd', 'target/objects/a.o')
+
+        self.assertFalse(hit)
+
+        self.assertIsNone(metadata)
+
+        self.assertEqual(file_system.files, {})
+
+    def test_fetch_invalid_metadata_from_remote(self):
+        for metadata in [b'\x80\x04\x95', b'[]', json.dumps({'object': '../../etc/passwd'}).encode()]:
+            file_system  = FileSystemMock(directories={'cache', 'target/objects'})
+            remote_proxy = RemoteProxyMock(file_system, {'abcd.metadata': metadata})
+            object_cache = RemoteObjectCache(file_system, 'cache', 1024, remote_proxy, RemoteCacheMode.read_only)
+
+            with self.assertLogs('praline.client.repository.remote_object_cache', level='WARNING'):
+                hit, _ = object_cache.fetch('abcd', 'target/objects/a.o')
+
+            self.assertFalse(hit)
+
+            self.assertEqual(file_system.files, {})
+
+    def test_fetch_missing_from_remote(self):
+        file_system  = FileSystemMock(directories={'cache', 'target/objects'})
+        remote_proxy = RemoteProxyMock(file_system, {})
+        object_cache = RemoteObjectCache(file_system, 'cache', 1024, remote_proxy, RemoteCacheMode.read_only)
+
+        hit, metadata = object_cache.fetch('abcd', 'target/objects/a.o')
+
+        self.assertFalse(hit)
+
+        self.assertIsNone(metadata)
+
+        self.assertEqual(file_system.files, {})
+
+    def test_read_only_store(self):
+        file_system  = FileSystemMock(directories={'cache'}, files={'a.o': b'object-a.'})
+        remote_proxy = RemoteProxyMock(file_system, {})
+        object_cache = RemoteObjectCache(file_system, 'cache', 1024, remote_proxy, RemoteCacheMode.read_only)
+
+        object_cache.store('abcd', 'a.o')
+
+        self.assertEqual(remote_proxy.entries, {})
+
+        self.assertTrue(file_system.exists(join('cache', 'ab', 'abcd')))
+
+    def test_read_write_store(self):
+        file_system  = FileSystemMock(directories={'cache'}, files={'a.o': b'object-a.'})
+        remote_proxy = RemoteProxyMock(file_system, {})
+        object_cache = RemoteObjectCache(file_system, 'cache', 1024, remote_proxy, RemoteCacheMode.read_write)
+
+        object_cache.store('abcd', 'a.o', ['sources/a.hpp'])
+
+        self.assertEqual(remote_proxy.entries[object_hash], b'object-a.')
+
+        self.assertEqual(json.loads(remote_proxy.entries['abcd.metadata']), {'object': object_hash, 
+                                                                             'metadata': ['sources/a.hpp']})
+
+        self.assertEqual(file_system.files[join('cache', 'ab', 'abcd.metadata')], b'["sources/a.hpp"]')
+
+    def test_unavailable_remote(self):
+        file_system  = FileSystemMock(directories={'cache', 'target/objects'}, files={'a.o': b'object-a.'})
+        remote_proxy = RemoteProxyMock(file_system, {}, available=False)
+        object_cache = RemoteObjectCache(file_system, 'cache', 1024, remote_proxy, RemoteCacheMode.read_write)
+
+        hit, _ = object_cache.fetch('abcd', 'target/objects/a.o')
+
+        self.assertFalse(hit)
+
+        object_cache.store('abcd', 'a.o')
+
+        self.assertTrue(file_system.exists(join('cache', 'ab', 'abcd')))
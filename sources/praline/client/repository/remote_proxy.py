@@ -1,44 +1,84 @@
 from praline.common import ArtifactManifest
 from praline.common.file_system import basename, FileSystem
 from praline.common.tracing import trace
-from typing import Dict
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict, IO, TypeVar
 
 import pickle
 import requests
 import base64
 
 
+T = TypeVar('T')
+
+
 class RemoteProxy:
-    def __init__(self, file_system: FileSystem, remote_repository: str):
+    def __init__(self, file_system: FileSystem, remote_repository: str, connections: int = 8):
+        if connections <= 0:
+            raise ValueError("number of connections must be greater than 0")
+
         self.file_system       = file_system
         self.remote_repository = remote_repository.rstrip('/')
+        self.connections       = connections
+        self.session           = requests.Session()
+        adapter                = HTTPAdapter(pool_connections=connections, pool_maxsize=connections)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
     def __repr__(self) -> str:
         return f'RemoteProxy({self.remote_repository})'
 
     @trace
     def pull_package(self, package_path: str) -> None:
-        response = requests.get(f'{self.remote_repository}/package/{basename(package_path)}', stream=True)
-        if response.status_code == 200:
-            with self.file_system.open_file(package_path, 'wb') as package:
-                self.file_system.copyfileobj(response.raw, package)
-        else:
-            raise RuntimeError(f"request failed with status code {response.status_code}: {response.text}")
+        with self.session.get(f'{self.remote_repository}/package/{basename(package_path)}', stream=True) as response:
+            if response.status_code == 200:
+                with self.file_system.open_file(package_path, 'wb') as package:
+                    self.file_system.copyfileobj(response.raw, package)
+            else:
+                raise RuntimeError(f"request failed with status code {response.status_code}: {response.text}")
+
+    @trace
+    def stream_package(self, package_path: str, consume: Callable[[IO[Any]], T]) -> T:
+        with self.session.get(f'{self.remote_repository}/package/{basename(package_path)}', stream=True) as response:
+            if response.status_code == 200:
+                return consume(response.raw)
+            else:
+                raise RuntimeError(f"request failed with status code {response.status_code}: {response.text}")
 
     @trace
     def push_package(self, package_path: str) -> None:
         package = basename(package_path)
         headers = {'Content-type': 'application/octet-stream', 'Slug': package}
         with self.file_system.open_file(package_path, 'rb') as f:
-            response = requests.put(f'{self.remote_repository}/package/{package}', data=f, headers=headers)
+            response = self.session.put(f'{self.remote_repository}/package/{package}', data=f, headers=headers)
         if response.status_code != 201:
             raise RuntimeError(f"request failed with status code {response.status_code}: {response.text}")
 
+    @trace
+    def pull_cache_entry(self, name: str, path: str) -> bool:
+        with self.session.get(f'{self.remote_repository}/cache/{name}', stream=True) as response:
+            if response.status_code == 200:
+                with self.file_system.open_file(path, 'wb') as entry:
+                    self.file_system.copyfileobj(response.raw, entry)
+                return True
+            elif response.status_code == 404:
+                return False
+            else:
+                raise RuntimeError(f"request failed with status code {response.status_code}: {response.text}")
+
+    @trace
+    def push_cache_entry(self, name: str, path: str) -> None:
+        headers = {'Content-type': 'application/octet-stream', 'Slug': name}
+        with self.file_system.open_file(path, 'rb') as f:
+            response = self.session.put(f'{self.remote_repository}/cache/{name}', data=f, headers=headers)
+        if response.status_code not in [200, 201]:
+            raise RuntimeError(f"request failed with status code {response.status_code}: {response.text}")
+
     @trace
     def solve_dependencies(self, artifact_manifest: ArtifactManifest) -> Dict[str, str]:
         blob = base64.b32encode(pickle.dumps(artifact_manifest)).decode()
-        payload = { 'artifact_manifest': blob }
-        response = requests.get(f'{self.remote_repository}/solve-dependencies', json=payload)
+        payload = { 'artifact_manifest': blob, 'archive_formats': self.file_system.get_archive_formats() }
+        response = self.session.get(f'{self.remote_repository}/solve-dependencies', json=payload)
         if response.status_code != 200:
             raise RuntimeError(f"request failed with status code {response.status_code}: {response.text}")
         return response.json()
@@ -9,7 +9,27 @@ import re
 snapshot_datetime_format = "%Y%m%d%H%M%S%f"
 
 
-package_extension = '.tar.gz'
+class ArchiveFormat(StrEnum):
+    gz  = auto()
+    zst = auto()
+
+
+package_extension_pattern = re.compile(fr"\.tar\.(?P<archive_format>{'|'.join(ArchiveFormat)})$")
+
+
+def get_package_extension(archive_format: ArchiveFormat) -> str:
+    return f'.tar.{archive_format}'
+
+
+def get_archive_format(package_name: str) -> ArchiveFormat:
+    match = package_extension_pattern.search(package_name)
+    if not match:
+        raise RuntimeError(f"unrecognized package extension in '{package_name}'")
+    return ArchiveFormat(match['archive_format'])
+
+
+def strip_package_extension(package_name: str) -> str:
+    return package_extension_pattern.sub('', package_name)
 
 
 class Architecture(StrEnum):
@@ -38,11 +58,30 @@ class Compiler(StrEnum):
     msvc     = auto()
 
 
+class Linker(StrEnum):
+    ld   = auto()
+    mold = auto()
+    lld  = auto()
+    gold = auto()
+    auto = auto()
+
+
 class Mode(StrEnum):
     debug   = auto()
     release = auto()
 
 
+class HashingStrategy(StrEnum):
+    preprocessed    = auto()
+    directives_only = auto()
+    dependencies    = auto()
+
+
+class RemoteCacheMode(StrEnum):
+    read_only  = auto()
+    read_write = auto()
+
+
 class Platform(StrEnum):
     windows = auto()
     linux   = auto()
@@ -99,7 +138,7 @@ package_name_pattern = re.compile(
     f"(?P<mode>{'|'.join(Mode)})-"
     fr"(?P<major>{number_regex})\."
     fr"(?P<minor>{number_regex})\."
-    fr"(?P<patch>{number_regex})(?P<snapshot>.SNAPSHOT\d{{20}})?\.tar\.gz"
+    fr"(?P<patch>{number_regex})(?P<snapshot>.SNAPSHOT\d{{20}})?\.tar\.(?P<archive_format>{'|'.join(ArchiveFormat)})"
 )
 
 
@@ -271,19 +310,22 @@ class ArtifactManifest:
         return (f"{target.organization}-{target.artifact}-{self.architecture}-{self.platform}-{self.compiler}-"
                 f"{self.mode}-{version}")
 
-    def get_package_file_name(self) -> str:
-        return self.get_artifact_identifier() + package_extension
+    def get_configuration_identifier(self) -> str:
+        return f"{self.compiler}-{self.mode}-{self.architecture}-{self.artifact_logging_level}"
+
+    def get_package_file_name(self, archive_format: ArchiveFormat = ArchiveFormat.gz) -> str:
+        return self.get_artifact_identifier() + get_package_extension(archive_format)
 
-    def get_package_file_name_and_instantiate_snapshot(self) -> str:
+    def get_package_file_name_and_instantiate_snapshot(self, archive_format: ArchiveFormat = ArchiveFormat.gz) -> str:
         version = PackageVersion(self.version.major, 
                                  self.version.minor, 
                                  self.version.patch, 
                                  datetime.now(timezone.utc)) if self.version.snapshot else self.version
 
-        return self.get_artifact_identifier(override_version=version) + package_extension
+        return self.get_artifact_identifier(override_version=version) + get_package_extension(archive_format)
 
-    def get_package_dependencies_file_names(self) -> List[str]:
-        return [self.get_artifact_identifier(d) + package_extension for d in self.dependencies]
+    def get_package_dependencies_file_names(self, archive_format: ArchiveFormat = ArchiveFormat.gz) -> List[str]:
+        return [self.get_artifact_identifier(d) + get_package_extension(archive_format) for d in self.dependencies]
 
     def is_compatible(self, other) -> bool:
         return (
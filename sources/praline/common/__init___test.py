@@ -1,4 +1,5 @@
-from praline.common import ArtifactVersion, DependencyVersion, PackageVersion
+from praline.common import (ArchiveFormat, ArtifactVersion, DependencyVersion, PackageVersion, get_archive_format, 
+                            strip_package_extension)
 
 from datetime import datetime, timezone
 from unittest import TestCase
@@ -363,3 +364,13 @@ class PralineCommonTest(TestCase):
         sorted_versions = sorted(versions)
 
         self.assertEqual(sorted_versions, expected_sorted_versions)
+
+    def test_archive_format(self):
+        self.assertEqual(get_archive_format('org-art-x64-linux-gcc-debug-1.0.0.tar.gz'), ArchiveFormat.gz)
+
+        self.assertEqual(get_archive_format('org-art-x64-linux-gcc-debug-1.0.0.tar.zst'), ArchiveFormat.zst)
+
+        self.assertEqual(strip_package_extension('org-art-x64-linux-gcc-debug-1.0.0.tar.zst'), 
+                         'org-art-x64-linux-gcc-debug-1.0.0')
+
+        self.assertRaises(RuntimeError, get_archive_format, 'org-art-x64-linux-gcc-debug-1.0.0.zip')
@@ -1,8 +1,12 @@
-from praline.common import (Architecture, ArtifactManifest, Compiler, ExportedSymbols, Mode, Platform,
+from praline.common import (Architecture, ArtifactManifest, Compiler, ExportedSymbols, Linker, Mode, Platform,
                             get_artifact_logging_level_code)
-from praline.common.compiling.compiler import ICompiler, CompilerInstantionError, ICompilerSupplier, IYieldDescriptor
-from praline.common.file_system import basename, FileSystem, join
-from typing import List
+from praline.common.compiling.compiler import (ICompiler, CompilerInstantionError, ICompilerSupplier, IYieldDescriptor,
+                                               find_linker, identify_linker, parse_dynamic_symbols,
+                                               parse_make_dependencies)
+from praline.common.compiling.profiling import CompilationProfile, parse_time_trace
+from praline.common.file_system import basename, FileSystem, join, normalized_path
+from praline.common.hashing import hash_binary
+from typing import Callable, List, Tuple
 
 import logging
 
@@ -10,7 +14,17 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+clang_linkers = {
+    Linker.ld  : 'ld',
+    Linker.mold: 'ld64.mold',
+    Linker.lld : 'ld64.lld'
+}
+
+
 class ClangYieldDescriptor(IYieldDescriptor):    
+    def __init__(self, symbols_tables: bool = True):
+        self.symbols_tables = symbols_tables
+
     def get_object(self, sources_root: str, objects_root: str, source: str) -> str:
         return super().get_object(sources_root, objects_root, source) + '.o'
 
@@ -24,14 +38,20 @@ class ClangYieldDescriptor(IYieldDescriptor):
         return None
 
     def get_symbols_table(self, symbols_tables_root: str, name: str) -> str:
-        return None
+        return join(symbols_tables_root, f'{name}.dwarf') if self.symbols_tables else None
 
 
 class ClangCompiler(ICompiler):
     def __init__(self, file_system: FileSystem, artifact_manifest: ArtifactManifest):
-        self.file_system       = file_system
-        self.artifact_manifest = artifact_manifest
-        logging_level_code     = get_artifact_logging_level_code(artifact_manifest.artifact_logging_level)
+        self.file_system         = file_system
+        self.artifact_manifest   = artifact_manifest
+        self.fingerprint         = None
+        self.precompiled_header  = None
+        self.precompiled_sources = set()
+        self.link_flags          = []
+        self.packager            = None
+        self.link_cache          = None
+        logging_level_code       = get_artifact_logging_level_code(artifact_manifest.artifact_logging_level)
 
         if artifact_manifest.exported_symbols == ExportedSymbols.explicit:
             visibility = 'hidden'
@@ -61,14 +81,24 @@ class ClangCompiler(ICompiler):
             raise CompilerInstantionError(f"the clang compiler could not find the clang++ executable in the PATH")
 
     def get_yield_descriptor(self) -> IYieldDescriptor:
-        return ClangYieldDescriptor()
+        return ClangYieldDescriptor(self.packager != None)
+
+    def get_fingerprint(self) -> str:
+        if self.fingerprint == None:
+            _, version, _ = self.file_system.execute(['clang++', '--version'])
+            self.fingerprint = hash_binary(version + ' '.join(self.flags).encode())
+        return self.fingerprint
 
     def preprocess(self,
                    headers_root: str,
                    external_headers_root: str,
                    headers: List[str],
-                   source: str) -> bytes:
-        status, stdout, stderror = self.file_system.execute(['clang++', '-E', '-P', source] + self.flags + 
+                   source: str,
+                   directives_only: bool = False) -> bytes:
+        directives  = ['-frewrite-includes'] if directives_only else []
+        precompiled = self.get_precompiled_header_flags(source, compiling=False)
+        status, stdout, stderror = self.file_system.execute(['clang++', '-E', '-P', source] + directives + self.flags + 
+                                                            precompiled + 
                                                             [f'-I{headers_root}', f'-I{external_headers_root}'])
         if stderror:
             logger.error(stderror.decode())
@@ -76,14 +106,156 @@ class ClangCompiler(ICompiler):
             raise RuntimeError(f"failed preprocessing source {source} -- process exited with status code {status}")
         return stdout
 
+    def preprocess_streaming(self,
+                             headers_root: str,
+                             external_headers_root: str,
+                             headers: List[str],
+                             source: str,
+                             consume: Callable[[bytes], None],
+                             directives_only: bool = False) -> None:
+        directives  = ['-frewrite-includes'] if directives_only else []
+        precompiled = self.get_precompiled_header_flags(source, compiling=False)
+        status, stderror = self.file_system.execute_streaming(['clang++', '-E', '-P', source] + directives + self.flags + 
+                                                              precompiled + 
+                                                              [f'-I{headers_root}', f'-I{external_headers_root}'],
+                                                              consume)
+        if stderror:
+            logger.error(stderror.decode())
+        if status != 0:
+            raise RuntimeError(f"failed preprocessing source {source} -- process exited with status code {status}")
+
     def compile(self,
                 headers_root: str,
                 external_headers_root: str,
                 headers: List[str],
                 source: str,
-                object_: str):
-        self.file_system.execute_and_fail_on_bad_return(['clang++', '-o', object_, '-c', source] + self.flags + 
+                object_: str) -> List[str]:
+        dependencies_file = object_ + '.d'
+        self.file_system.execute_and_fail_on_bad_return(['clang++', '-o', object_, '-c', source, 
+                                                         '-MMD', '-MF', dependencies_file] + self.flags + 
+                                                        self.get_precompiled_header_flags(source, compiling=True) + 
+                                                        [f'-I{headers_root}', f'-I{external_headers_root}'])
+        with self.file_system.open_file(dependencies_file, 'r') as f:
+            dependencies = parse_make_dependencies(f.read())
+        self.file_system.remove_file(dependencies_file)
+        return dependencies
+
+    def scan_dependencies(self,
+                          headers_root: str,
+                          external_headers_root: str,
+                          headers: List[str],
+                          source: str) -> List[str]:
+        status, stdout, stderror = self.file_system.execute(['clang++', '-MM', source] + self.flags + 
+                                                            [f'-I{headers_root}', f'-I{external_headers_root}'])
+        if stderror:
+            logger.error(stderror.decode())
+        if status != 0:
+            raise RuntimeError(f"failed scanning dependencies of source {source} -- process exited with status code "
+                               f"{status}")
+        return parse_make_dependencies(stdout.decode())
+
+    def precompile_header(self,
+                          headers_root: str,
+                          external_headers_root: str,
+                          headers: List[str],
+                          header: str) -> List[str]:
+        dependencies_file = header + '.d'
+        self.file_system.execute_and_fail_on_bad_return(['clang++', '-x', 'c++-header', '-o', header[:-len('.hpp')] + '.pch', header, 
+                                                         '-MMD', '-MF', dependencies_file] + self.flags + 
                                                         [f'-I{headers_root}', f'-I{external_headers_root}'])
+        with self.file_system.open_file(dependencies_file, 'r') as f:
+            dependencies = parse_make_dependencies(f.read())
+        self.file_system.remove_file(dependencies_file)
+        return dependencies
+
+    def use_precompiled_header(self, header: str, sources: List[str]) -> None:
+        self.precompiled_header  = header
+        self.precompiled_sources = {normalized_path(s) for s in sources}
+
+    def enable_split_dwarf(self) -> None:
+        if self.artifact_manifest.mode != Mode.debug:
+            return
+        self.packager = 'dsymutil' if self.file_system.which('dsymutil') else None
+        if self.packager == None:
+            logger.warning("dsymutil was not found in the PATH -- debug information won't be packaged in symbols "
+                           "tables")
+
+    def package_symbols_table(self, linked: str, symbols_table: str) -> None:
+        if symbols_table != None and self.packager != None:
+            self.file_system.execute_and_fail_on_bad_return([self.packager, '--flat', linked, '-o', symbols_table])
+
+    def enable_link_time_optimization(self) -> None:
+        if self.artifact_manifest.mode != Mode.release or '-flto=thin' in self.flags:
+            return
+        self.flags.append('-flto=thin')
+        self.fingerprint = None
+
+    def use_link_cache(self, directory: str) -> None:
+        self.link_cache = directory
+
+    def get_link_cache_flags(self) -> List[str]:
+        if self.link_cache == None or '-flto=thin' not in self.flags:
+            return []
+        return [f'-Wl,-cache_path_lto,{self.link_cache}']
+
+    def get_precompiled_header_flags(self, source: str, compiling: bool) -> List[str]:
+        if self.precompiled_header == None or normalized_path(source) not in self.precompiled_sources:
+            return []
+        if compiling:
+            return ['-include-pch', self.precompiled_header[:-len('.hpp')] + '.pch']
+        return ['-include', self.precompiled_header]
+
+    def compile_and_profile(self,
+                            headers_root: str,
+                            external_headers_root: str,
+                            headers: List[str],
+                            source: str,
+                            object_: str) -> Tuple[List[str], CompilationProfile]:
+        dependencies_file = object_ + '.d'
+        time_trace_file   = object_[:-len('.o')] + '.json'
+        command           = (['clang++', '-o', object_, '-c', source, '-MMD', '-MF', dependencies_file, '-ftime-trace'] + 
+                             self.flags + self.get_precompiled_header_flags(source, compiling=True) + 
+                             [f'-I{headers_root}', f'-I{external_headers_root}'])
+        status, _, stderror, usage = self.file_system.execute_and_measure(command)
+        if status != 0:
+            logger.error(stderror.decode())
+            raise RuntimeError(f"command exited with return code {status}")
+        with self.file_system.open_file(dependencies_file, 'r') as f:
+            dependencies = parse_make_dependencies(f.read())
+        self.file_system.remove_file(dependencies_file)
+        with self.file_system.open_file(time_trace_file, 'r') as f:
+            phases, headers_times, instantiations = parse_time_trace(f.read())
+        self.file_system.remove_file(time_trace_file)
+        return (dependencies, 
+                CompilationProfile(source, usage.wall_time, usage.peak_memory, phases, headers_times, instantiations))
+
+    def supports_distribution(self) -> bool:
+        return True
+
+    def preprocess_for_distribution(self,
+                                    headers_root: str,
+                                    external_headers_root: str,
+                                    headers: List[str],
+                                    source: str,
+                                    object_: str) -> Tuple[bytes, List[str]]:
+        dependencies_file = object_ + '.d'
+        precompiled       = self.get_precompiled_header_flags(source, compiling=False)
+        status, stdout, stderror = self.file_system.execute(['clang++', '-E', source, 
+                                                             '-MMD', '-MF', dependencies_file] + self.flags + 
+                                                            precompiled + 
+                                                            [f'-I{headers_root}', f'-I{external_headers_root}'])
+        if stderror:
+            logger.error(stderror.decode())
+        if status != 0:
+            raise RuntimeError(f"failed preprocessing source {source} -- process exited with status code {status}")
+        with self.file_system.open_file(dependencies_file, 'r') as f:
+            dependencies = parse_make_dependencies(f.read())
+        self.file_system.remove_file(dependencies_file)
+        return (stdout, dependencies)
+
+    def compile_preprocessed(self, preprocessed_source: str, object_: str) -> None:
+        self.file_system.execute_and_fail_on_bad_return(['clang++', '-o', object_, '-c', preprocessed_source] + 
+                                                        self.flags)
 
     def link_executable(self,
                         external_libraries_root: str,
@@ -96,10 +268,11 @@ class ClangCompiler(ICompiler):
         self.file_system.execute_and_fail_on_bad_return(['clang++', '-o', executable,
                                                          '-rpath', '@executable_path/../libraries',
                                                          '-rpath', '@executable_path/../external/libraries'] +
-                                                        self.flags + objects + 
+                                                        self.flags + self.link_flags + 
+                                                        self.get_link_cache_flags() + objects + 
                                                         [f'-L{external_libraries_root}'] +
                                                         [f'-l{basename(lib)[3:-6]}' for lib in external_libraries])
-
+        self.package_symbols_table(executable, symbols_table)
 
     def link_library(self,
                      external_libraries_root: str,
@@ -111,9 +284,20 @@ class ClangCompiler(ICompiler):
                      library_interface: str,
                      symbols_table: str):
         self.file_system.execute_and_fail_on_bad_return(['clang++', '-o', library, '-shared', '-install_name', 
-                                                         f'@rpath/{basename(library)}'] + self.flags + objects + 
+                                                         f'@rpath/{basename(library)}'] + self.flags + 
+                                                        self.link_flags + self.get_link_cache_flags() + objects + 
                                                         [f'-L{external_libraries_root}'] +
                                                         [f'-l{basename(lib)[3:-6]}' for lib in external_libraries])
+        self.package_symbols_table(library, symbols_table)
+
+    def select_linker(self, linker: Linker) -> str:
+        linker, executable = find_linker(self.file_system, linker, clang_linkers)
+        self.link_flags    = [f'-fuse-ld={linker}'] if linker != Linker.ld else []
+        return identify_linker(self.file_system, linker, executable)
+
+    def get_exported_symbols(self, library: str) -> str:
+        status, stdout, _ = self.file_system.execute(['nm', '-g', '-U', '-P', library])
+        return parse_dynamic_symbols(stdout.decode()) if status == 0 else None
 
 
 class ClangCompilerSupplier(ICompilerSupplier):
@@ -1,7 +1,9 @@
 from praline.common import (Architecture, ArtifactManifest, Compiler, ExportedSymbols, Mode, Platform, 
                             get_artifact_logging_level_code)
-from praline.common.compiling.compiler import ICompiler, CompilerInstantionError, ICompilerSupplier, IYieldDescriptor
+from praline.common.compiling.compiler import (ICompiler, CompilerInstantionError, ICompilerSupplier, IYieldDescriptor,
+                                               parse_show_includes)
 from praline.common.file_system import FileSystem, join
+from praline.common.hashing import hash_binary
 from typing import List
 
 import logging
@@ -56,6 +58,7 @@ class ClangClCompiler(ICompiler):
         self.artifact_manifest = artifact_manifest
         self.environment_file  = get_environment_file(artifact_manifest.architecture)
         self.machine           = get_msvc_machine(artifact_manifest.architecture)
+        self.fingerprint       = None
         logging_level_code     = get_artifact_logging_level_code(artifact_manifest.artifact_logging_level)
         
         self.compiler_flags  = ['/analyze-', '/permissive-', '/GS', '/Gd', '/FC', '/sdl', '/fp:precise',
@@ -96,11 +99,21 @@ class ClangClCompiler(ICompiler):
     def get_yield_descriptor(self) -> IYieldDescriptor:
         return ClangClYieldDescriptor()
 
+    def get_fingerprint(self) -> str:
+        if self.fingerprint == None:
+            _, version, _    = self.file_system.execute([self.environment_file, '>nul', '2>&1', '&&', 
+                                                     'clang-cl', '--version'])
+            identity         = ([self.environment_file, self.file_system.which('clang-cl'), self.machine] + 
+                                self.compiler_flags)
+            self.fingerprint = hash_binary(version + ' '.join(identity).encode())
+        return self.fingerprint
+
     def preprocess(self,
                    headers_root: str,
                    external_headers_root: str,
                    headers: List[str],
-                   source: str) -> bytes:
+                   source: str,
+                   directives_only: bool = False) -> bytes:
         status, stdout, stderror = self.file_system.execute([self.environment_file, '>nul', '2>&1', '&&',
                                                              'clang-cl', '/EP', source] + self.compiler_flags +
                                                             ['/I', headers_root, '/I', external_headers_root])
@@ -114,15 +127,16 @@ class ClangClCompiler(ICompiler):
                 external_headers_root: str,
                 headers: List[str],
                 source: str,
-                object_: str) -> None:
+                object_: str) -> List[str]:
         status, stdout, stderror = self.file_system.execute([self.environment_file, '>nul', '2>&1', '&&', 
-                                                             'clang-cl', f'/Fo{object_}', '/c', source] + 
+                                                             'clang-cl', f'/Fo{object_}', '/c', '/showIncludes', source] + 
                                                             self.compiler_flags +
                                                             ['/I', headers_root, '/I', external_headers_root])
         if status != 0:
             logger.info(stdout.decode())
             logger.error(stderror.decode())
             raise RuntimeError(f"command exited with return code {status}")
+        return parse_show_includes(stdout.decode())
 
     def link_executable(self,
                         external_libraries_root: str,
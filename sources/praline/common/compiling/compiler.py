@@ -1,11 +1,31 @@
-from praline.common import ArtifactManifest, Compiler, Platform, ProjectStructure, get_duplicates
+from praline.common import (ArtifactManifest, Compiler, HashingStrategy, Linker, Platform, ProjectStructure,
+                            get_duplicates)
+from praline.common.compiling.object_cache import ObjectCache
+from praline.common.compiling.precompiled_headers import (collect_includes, format_precompiled_header,
+                                                          select_precompiled_includes)
+from praline.common.compiling.profiling import (CompilationProfile, format_compilation_report,
+                                                load_compilation_profile, save_compilation_profile)
+from praline.common.compiling.unity import update_unity_sources
+from praline.common.concurrency import parallel_map
 from praline.common.progress_bar import ProgressBarSupplier
-from praline.common.file_system import FileSystem, join, get_separator, relative_path
-from praline.common.hashing import hash_binary, delta, DeltaType, progression_resolution
+from praline.common.file_system import (basename, directory_name, FileSystem, join, get_separator, normalized_path,
+                                       relative_path)
+from praline.common.hashing import hash_binary, hash_file, hash_streaming, delta, DeltaType, progression_resolution
 from praline.common.reflection import subclasses_of
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from dataclasses import replace
+from logging import getLogger
+from time import monotonic
+from typing import Any, Callable, Dict, List, Tuple
+
+import json
+import re
+
+
+logger = getLogger(__name__)
+
+linker_versions = {}
 
 
 class CompilerInstantionError(Exception):
@@ -16,6 +36,49 @@ class NoSupportedCompilerFoundError(Exception):
     pass
 
 
+class LinkerNotFoundError(Exception):
+    pass
+
+
+def parse_make_dependencies(contents: str) -> List[str]:
+    _, _, prerequisites = contents.replace('\\\r\n', ' ').replace('\\\n', ' ').partition(': ')
+    return [p.replace('\\ ', ' ') for p in re.split(r'(?<!\\)\s+', prerequisites.strip()) if p]
+
+
+def parse_dynamic_symbols(output: str) -> str:
+    return '\n'.join(sorted(' '.join(line.split()[:2]) for line in output.splitlines() if line.strip()))
+
+
+def parse_show_includes(output: str) -> List[str]:
+    prefix = 'Note: including file:'
+    return [line[len(prefix):].strip() for line in output.splitlines() if line.startswith(prefix)]
+
+
+def find_linker(file_system: FileSystem, linker: Linker, executables: Dict[Linker, str]) -> Tuple[Linker, str]:
+    if linker == Linker.auto:
+        for candidate in [Linker.mold, Linker.lld, Linker.gold]:
+            if candidate in executables and file_system.which(executables[candidate]) != None:
+                return (candidate, executables[candidate])
+        return (Linker.ld, executables.get(Linker.ld))
+    if linker not in executables:
+        raise LinkerNotFoundError(f"the {linker} linker is not supported by this compiler -- supported linkers are "
+                                  f"{list(executables)}")
+    if linker != Linker.ld and file_system.which(executables[linker]) == None:
+        raise LinkerNotFoundError(f"could not find the {linker} linker executable {executables[linker]} in the PATH")
+    return (linker, executables[linker])
+
+
+def identify_linker(file_system: FileSystem, linker: Linker, executable: str) -> str:
+    if linker == Linker.ld:
+        return hash_binary(f'{linker}'.encode())
+    path  = file_system.which(executable)
+    state = (path, file_system.get_modification_time(path))
+    if state not in linker_versions:
+        _, version, _          = file_system.execute([executable, '--version'])
+        linker_versions[state] = version
+    return hash_binary(f'{linker} '.encode() + linker_versions[state])
+
+
 class IYieldDescriptor(ABC):
     @abstractmethod
     def get_object(self, sources_root: str, objects_root: str, source: str) -> str:
@@ -44,14 +107,28 @@ class ICompiler(ABC):
     def get_yield_descriptor(self) -> IYieldDescriptor:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_fingerprint(self) -> str:
+        raise NotImplementedError()
+
     @abstractmethod
     def preprocess(self,
                    headers_root: str,
                    external_headers_root: str,
                    headers: List[str],
-                   source: str) -> bytes:
+                   source: str,
+                   directives_only: bool = False) -> bytes:
         raise NotImplementedError()
 
+    def preprocess_streaming(self,
+                             headers_root: str,
+                             external_headers_root: str,
+                             headers: List[str],
+                             source: str,
+                             consume: Callable[[bytes], None],
+                             directives_only: bool = False) -> None:
+        consume(self.preprocess(headers_root, external_headers_root, headers, source, directives_only))
+
     @abstractmethod
     def compile(self,
                 headers_root: str,
@@ -61,6 +138,59 @@ class ICompiler(ABC):
                 object_: str) -> List[str]:
         raise NotImplementedError()
 
+    def scan_dependencies(self,
+                          headers_root: str,
+                          external_headers_root: str,
+                          headers: List[str],
+                          source: str) -> List[str]:
+        return None
+
+    def precompile_header(self,
+                          headers_root: str,
+                          external_headers_root: str,
+                          headers: List[str],
+                          header: str) -> List[str]:
+        return None
+
+    def use_precompiled_header(self, header: str, sources: List[str]) -> None:
+        pass
+
+    def enable_split_dwarf(self) -> None:
+        pass
+
+    def get_side_outputs(self, object_: str) -> List[str]:
+        return []
+
+    def enable_link_time_optimization(self) -> None:
+        pass
+
+    def use_link_cache(self, directory: str) -> None:
+        pass
+
+    def compile_and_profile(self,
+                            headers_root: str,
+                            external_headers_root: str,
+                            headers: List[str],
+                            source: str,
+                            object_: str) -> Tuple[List[str], CompilationProfile]:
+        start        = monotonic()
+        dependencies = self.compile(headers_root, external_headers_root, headers, source, object_)
+        return (dependencies, CompilationProfile(source, monotonic() - start, None, {}, {}, {}))
+
+    def supports_distribution(self) -> bool:
+        return False
+
+    def preprocess_for_distribution(self,
+                                    headers_root: str,
+                                    external_headers_root: str,
+                                    headers: List[str],
+                                    source: str,
+                                    object_: str) -> Tuple[bytes, List[str]]:
+        return None
+
+    def compile_preprocessed(self, preprocessed_source: str, object_: str) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     def link_executable(self,
                         external_libraries_root: str,
@@ -72,6 +202,14 @@ class ICompiler(ABC):
                         symbols_table: str) -> Tuple[str, str, str]:
         raise NotImplementedError()
 
+    def get_exported_symbols(self, library: str) -> str:
+        return None
+
+    def select_linker(self, linker: Linker) -> str:
+        if linker not in [Linker.ld, Linker.auto]:
+            raise LinkerNotFoundError(f"the {linker} linker is not supported by this compiler")
+        return None
+
     @abstractmethod
     def link_library(self,
                      external_libraries_root: str,
@@ -100,9 +238,27 @@ class ICompilerSupplier(ABC):
 
 
 class CompilerWrapper:
-    def __init__(self, file_system: FileSystem, compiler: ICompiler):
-        self.file_system = file_system
-        self.compiler    = compiler
+    def __init__(self, 
+                 file_system: FileSystem, 
+                 compiler: ICompiler, 
+                 jobs: int = 1,
+                 hashing_strategy: HashingStrategy = HashingStrategy.preprocessed,
+                 object_cache: ObjectCache = None):
+        if jobs <= 0:
+            raise ValueError("number of compilation jobs must be greater than 0")
+
+        self.file_system      = file_system
+        self.compiler         = compiler
+        self.jobs             = jobs
+        self.hashing_strategy = hashing_strategy
+        self.object_cache     = object_cache
+        self.objects_hashes   = {}
+        self.interruption     = None
+        self.compile_workers  = None
+        self.profiling        = False
+        self.precompiling     = False
+        self.unity_batch_size = None
+        self.linker_identity  = None
 
     def get_yield_descriptor(self) -> IYieldDescriptor:
         return self.compiler.get_yield_descriptor()
@@ -112,45 +268,432 @@ class CompilerWrapper:
                             headers: List[str],
                             sources: List[str],
                             cache: Dict[str, Any],
-                            progress_bar_supplier: ProgressBarSupplier) -> List[str]:
-        new_cache        = {}
-        objects          = []
-        yield_descriptor = self.compiler.get_yield_descriptor()
-        resolution       = progression_resolution(sources, cache)
+                            progress_bar_supplier: ProgressBarSupplier,
+                            unity: str = None) -> List[str]:
+        unity_root = join(project_structure.target_root, 'unity')
+        if unity and self.unity_batch_size:
+            standalone = [s for s in sources if basename(s) == 'executable.cpp']
+            batched    = [s for s in sources if s not in standalone]
+            sources    = update_unity_sources(self.file_system, unity_root, unity, batched, self.unity_batch_size)
+            sources    = sources + standalone
+
+        new_cache         = {}
+        objects           = []
+        pending           = []
+        files_hashes      = {}
+        yield_descriptor  = self.compiler.get_yield_descriptor()
+        resolution        = progression_resolution(sources, cache)
+        project_directory = project_structure.project_directory
+        fingerprint       = self.compiler.get_fingerprint()
+        precompiled       = self.prepare_precompiled_header(project_structure, headers, sources, unity or 'default')
+        stored            = []
         with progress_bar_supplier.create(resolution) as progress_bar:
+            def hash_dependencies(dependencies: List[str]):
+                for dependency in dependencies:
+                    if dependency not in files_hashes:
+                        exists = self.file_system.exists(dependency)
+                        files_hashes[dependency] = hash_file(self.file_system, dependency) if exists else None
+                lines = [fingerprint] + [f'{d} {files_hashes[d]}' for d in dependencies]
+                return hash_binary('\n'.join(lines).encode())
+
             def hasher(source: str):
+                if self.hashing_strategy == HashingStrategy.dependencies:
+                    record = cache.get(source)
+                    if isinstance(record, tuple):
+                        _, dependencies = record
+                        return (hash_dependencies(dependencies), dependencies)
+                    return None
+                directives_only = self.hashing_strategy == HashingStrategy.directives_only
+                return hash_streaming(f'{fingerprint}\n'.encode(),
+                                      lambda consume: self.compiler.preprocess_streaming(
+                                          project_structure.sources_root, 
+                                          project_structure.external_headers_root,
+                                          headers, 
+                                          source,
+                                          consume,
+                                          directives_only=directives_only))
+
+            def get_object_key(source: str):
+                content_hash = hashes[source]
+                if self.hashing_strategy == HashingStrategy.dependencies:
+                    content_hash = hash_streaming(b'', 
+                                                  lambda consume: self.compiler.preprocess_streaming(
+                                                      project_structure.sources_root, 
+                                                      project_structure.external_headers_root,
+                                                      headers, 
+                                                      source,
+                                                      consume))
+                kind = 'directives_only' if self.hashing_strategy == HashingStrategy.directives_only else 'preprocessed'
+                return hash_binary(f'{fingerprint} {kind} {content_hash}'.encode())
+
+            def compile_source(source_and_object: Tuple[str, str]):
+                source, object_ = source_and_object
+                key             = get_object_key(source) if self.object_cache else None
+                side_outputs    = self.compiler.get_side_outputs(object_)
+                side_keys       = {o: hash_binary(f'{key} {basename(o)}'.encode()) for o in side_outputs} if key else {}
+                hit             = False
+                if key and not self.profiling:
+                    hit = all(self.object_cache.fetch(k, o)[0] for o, k in side_keys.items())
+                    if hit:
+                        hit, dependencies = self.object_cache.fetch(key, object_)
+                if hit:
+                    dependencies = [normalized_path(join(project_directory, d)) for d in dependencies]
+                else:
+                    self.file_system.remove_file_if_it_exists(object_)
+                    for side_output in side_outputs:
+                        self.file_system.remove_file_if_it_exists(side_output)
+                    dependencies = None
+                    if self.profiling:
+                        dependencies = self.compile_and_profile(project_structure, headers, source, object_)
+                    elif self.compile_workers and self.compiler.supports_distribution() and not side_outputs:
+                        dependencies = self.compile_remotely(project_structure, headers, source, object_)
+                    if dependencies == None:
+                        dependencies = self.compiler.compile(project_structure.sources_root, 
+                                                             project_structure.external_headers_root, 
+                                                             headers, 
+                                                             source, 
+                                                             object_)
+                    if key:
+                        self.object_cache.store(key, 
+                                                object_, 
+                                                [relative_path(d, project_directory) for d in dependencies or []])
+                        for side_output, side_key in side_keys.items():
+                            self.object_cache.store(side_key, side_output)
+                        stored.append(object_)
+                if dependencies != None:
+                    self.save_dependencies(project_structure, source, object_, dependencies)
+                record = None
+                if self.hashing_strategy == HashingStrategy.dependencies:
+                    dependencies = sorted({source, *dependencies, *precompiled.get(source, [])})
+                    record       = (hash_dependencies(dependencies), dependencies)
+                return (record, self.get_file_state(object_), hash_file(self.file_system, object_))
+
+            hashes = {}
+            for source, hash_code in parallel_map(hasher, sources, self.jobs):
                 progress_bar.update_summary(source)
-                return hash_binary(self.compiler.preprocess(project_structure.sources_root, 
-                                                            project_structure.external_headers_root,
-                                                            headers, 
-                                                            source))
-            for item in delta(sources, hasher, cache, new_cache):
-                source  = item.key
-                object_ = yield_descriptor.get_object(project_structure.sources_root, 
-                                                      project_structure.objects_root, 
-                                                      source)
+                hashes[source] = hash_code
+
+            for item in delta(sources, lambda source: hashes[source], cache, new_cache):
+                source       = item.key
+                in_unity     = directory_name(source) == unity_root
+                sources_root = unity_root if in_unity else project_structure.sources_root
+                object_      = yield_descriptor.get_object(sources_root, project_structure.objects_root, source)
                 if item.delta_type in [DeltaType.Added, DeltaType.Modified]:
-                    self.compiler.compile(project_structure.sources_root, 
-                                          project_structure.external_headers_root, 
-                                          headers, 
-                                          source, 
-                                          object_)
+                    pending.append((source, object_))
                     objects.append(object_)
                 elif item.delta_type == DeltaType.UpToDate:
-                    if not self.file_system.exists(object_):
-                        self.compiler.compile(project_structure.sources_root, 
-                                              project_structure.external_headers_root, 
-                                              headers, 
-                                              source, 
-                                              object_)
+                    side_outputs = self.compiler.get_side_outputs(object_)
+                    if not all(self.file_system.exists(o) for o in [object_] + side_outputs):
+                        pending.append((source, object_))
+                    else:
+                        progress_bar.advance()
                     objects.append(object_)
                 elif item.delta_type == DeltaType.Removed:
-                    if self.file_system.exists(object_):
-                        self.file_system.remove_file(object_)
+                    for output in [object_] + self.compiler.get_side_outputs(object_):
+                        self.file_system.remove_file_if_it_exists(output)
+                    self.objects_hashes.pop(object_, None)
+                    self.file_system.remove_file_if_it_exists(self.get_profile(project_structure, object_))
+                    self.file_system.remove_file_if_it_exists(self.get_dependencies_record(project_structure, object_))
+                    progress_bar.advance()
+
+            unfinished = {source for source, _ in pending}
+            try:
+                for (source, object_), (record, object_state, object_hash) in parallel_map(compile_source, 
+                                                                                         pending, 
+                                                                                         self.jobs, 
+                                                                                         self.interruption):
+                    progress_bar.update_summary(source)
+                    if record:
+                        new_cache[source] = record
+                    self.objects_hashes[object_] = (object_state, object_hash)
+                    unfinished.remove(source)
+                    progress_bar.advance()
+            finally:
+                for source in unfinished:
+                    if source in cache:
+                        new_cache[source] = cache[source]
+                    else:
+                        new_cache.pop(source, None)
+                cache.clear()
+                cache.update(new_cache)
+
+            if self.profiling:
+                self.write_compilation_report(project_structure)
+
+            if stored:
+                self.object_cache.evict()
+        return objects
+
+    def get_profile(self, project_structure: ProjectStructure, object_: str) -> str:
+        return join(project_structure.target_root, 'profiles', basename(object_) + '.json')
+
+    def get_dependencies_record(self, project_structure: ProjectStructure, object_: str) -> str:
+        return join(project_structure.target_root, 'dependencies', basename(object_) + '.json')
+
+    def save_dependencies(self, 
+                          project_structure: ProjectStructure, 
+                          source: str, 
+                          object_: str, 
+                          dependencies: List[str]) -> None:
+        project_directory = project_structure.project_directory
+        record_path       = self.get_dependencies_record(project_structure, object_)
+        record            = {
+            'source'      : relative_path(source, project_directory),
+            'dependencies': [relative_path(d, project_directory) for d in dependencies]
+        }
+        self.file_system.create_directory_if_missing(directory_name(record_path))
+        self.file_system.remove_file_if_it_exists(record_path)
+        with self.file_system.open_file(record_path, 'wb') as f:
+            f.write(json.dumps(record).encode())
+
+    def load_recorded_dependencies(self, project_structure: ProjectStructure) -> Dict[str, List[str]]:
+        project_directory = project_structure.project_directory
+        records_root      = join(project_structure.target_root, 'dependencies')
+        recorded          = {}
+        if not self.file_system.exists(records_root):
+            return recorded
+        for path in self.file_system.files_in_directory(records_root):
+            try:
+                with self.file_system.open_file(path, 'rb') as f:
+                    record = json.loads(f.read().decode())
+                recorded_time = self.file_system.get_modification_time(path)
+                source        = normalized_path(join(project_directory, record['source']))
+                dependencies  = [normalized_path(join(project_directory, d)) for d in record['dependencies']]
+                if all(self.file_system.get_modification_time(d) <= recorded_time for d in [source, *dependencies]):
+                    recorded[source] = dependencies
+            except (FileNotFoundError, ValueError, KeyError):
+                pass
+        return recorded
+
+    def compile_and_profile(self,
+                            project_structure: ProjectStructure,
+                            headers: List[str],
+                            source: str,
+                            object_: str) -> List[str]:
+        dependencies, profile = self.compiler.compile_and_profile(project_structure.sources_root, 
+                                                                  project_structure.external_headers_root, 
+                                                                  headers, 
+                                                                  source, 
+                                                                  object_)
+        profile_path = self.get_profile(project_structure, object_)
+        self.file_system.create_directory_if_missing(directory_name(profile_path))
+        self.file_system.remove_file_if_it_exists(profile_path)
+        profile      = replace(profile, source=relative_path(source, project_structure.project_directory))
+        with self.file_system.open_file(profile_path, 'wb') as f:
+            f.write(save_compilation_profile(profile).encode())
+        return dependencies
+
+    def prepare_precompiled_header(self,
+                                   project_structure: ProjectStructure,
+                                   headers: List[str],
+                                   sources: List[str],
+                                   scope: str) -> Dict[str, List[str]]:
+        self.compiler.use_precompiled_header(None, [])
+        root = join(project_structure.target_root, 'precompiled', scope)
+
+        def remove_stale(name: str = None):
+            if self.file_system.exists(root):
+                for path in self.file_system.files_in_directory(root, hidden=True):
+                    if name == None or not basename(path).startswith(f'{name}.'):
+                        self.file_system.remove_file(path)
+
+        if not self.precompiling or not sources:
+            remove_stale()
+            return {}
+
+        includes = collect_includes(self.file_system, 
+                                    [project_structure.sources_root, project_structure.external_headers_root],
+                                    sources)
+        selected = select_precompiled_includes(includes)
+        covered  = [source for source, reached in includes.items() if reached.issuperset(selected)]
+        if not selected or not covered:
+            remove_stale()
+            return {}
+
+        contents = format_precompiled_header(selected).encode()
+        name     = hash_binary(contents)
+        header   = join(root, f'{name}.hpp')
+        record   = join(root, f'{name}.json')
+        remove_stale(name)
+        if not self.file_system.exists(header):
+            self.file_system.create_directory_if_missing(root)
+            with self.file_system.open_file(header, 'wb') as f:
+                f.write(contents)
+
+        try:
+            key = hash_streaming(f'{self.compiler.get_fingerprint()}\n'.encode(),
+                                 lambda consume: self.compiler.preprocess_streaming(
+                                     project_structure.sources_root, 
+                                     project_structure.external_headers_root,
+                                     headers, 
+                                     header,
+                                     consume))
+            dependencies = None
+            if self.file_system.exists(record):
+                with self.file_system.open_file(record, 'rb') as f:
+                    precompiled = json.loads(f.read().decode())
+                if precompiled['key'] == key:
+                    dependencies = precompiled['dependencies']
+            if dependencies == None:
+                self.file_system.remove_file_if_it_exists(record)
+                dependencies = self.compiler.precompile_header(project_structure.sources_root, 
+                                                               project_structure.external_headers_root,
+                                                               headers,
+                                                               header)
+                if dependencies == None:
+                    return {}
+                with self.file_system.open_file(record, 'wb') as f:
+                    f.write(json.dumps({'key': key, 'dependencies': dependencies}).encode())
+        except RuntimeError as exception:
+            logger.warning(f"couldn't precompile header {header}, compiling without it -- {exception}")
+            return {}
+
+        self.compiler.use_precompiled_header(header, covered)
+        return {source: dependencies for source in covered}
+
+    def load_compilation_profiles(self, project_structure: ProjectStructure) -> List[CompilationProfile]:
+        profiles_root = join(project_structure.target_root, 'profiles')
+        profiles      = []
+        if self.file_system.exists(profiles_root):
+            for path in self.file_system.files_in_directory(profiles_root):
+                with self.file_system.open_file(path, 'rb') as f:
+                    profiles.append(load_compilation_profile(f.read().decode()))
+        return profiles
+
+    def write_compilation_report(self, project_structure: ProjectStructure) -> None:
+        profiles = self.load_compilation_profiles(project_structure)
+        report   = join(project_structure.target_root, 'compilation-profile.txt')
+        self.file_system.remove_file_if_it_exists(report)
+        with self.file_system.open_file(report, 'wb') as f:
+            f.write(format_compilation_report(profiles).encode())
+        logger.info(f"compilation profile of {len(profiles)} translation units written to '{report}'")
+
+    def compile_remotely(self,
+                         project_structure: ProjectStructure,
+                         headers: List[str],
+                         source: str,
+                         object_: str) -> List[str]:
+        dependencies = None
+
+        def preprocess() -> bytes:
+            nonlocal dependencies
+            result = self.compiler.preprocess_for_distribution(project_structure.sources_root, 
+                                                               project_structure.external_headers_root, 
+                                                               headers, 
+                                                               source, 
+                                                               object_)
+            if result == None:
+                return None
+            preprocessed, dependencies = result
+            return preprocessed
+
+        data = self.compile_workers.compile(self.compiler.get_fingerprint(), preprocess)
+        if data == None:
+            return None
+        with self.file_system.open_file(object_, 'wb') as f:
+            f.write(data)
+        return dependencies
+
+    def scan_dependencies_using_cache(self,
+                                      project_structure: ProjectStructure,
+                                      headers: List[str],
+                                      sources: List[str],
+                                      cache: Dict[str, Any],
+                                      progress_bar_supplier: ProgressBarSupplier,
+                                      recorded: Dict[str, List[str]] = {}) -> Dict[str, List[str]]:
+        files_hashes = {}
+        new_cache    = {}
+
+        def hash_dependencies(dependencies: List[str]):
+            for dependency in dependencies:
+                if dependency not in files_hashes:
+                    exists = self.file_system.exists(dependency)
+                    files_hashes[dependency] = hash_file(self.file_system, dependency) if exists else None
+            return hash_binary('\n'.join(f'{d} {files_hashes[d]}' for d in dependencies).encode())
+
+        def scan(source: str):
+            record = cache.get(source)
+            if record and record[0] == hash_dependencies(record[1]):
+                return record
+            dependencies = recorded.get(normalized_path(source))
+            if dependencies == None:
+                dependencies = self.compiler.scan_dependencies(project_structure.sources_root, 
+                                                               project_structure.external_headers_root, 
+                                                               headers, 
+                                                               source)
+            if dependencies == None:
+                raise RuntimeError(f"the compiler can't scan the dependencies of source {source}")
+            dependencies = sorted({normalized_path(d) for d in [source, *dependencies]})
+            return (hash_dependencies(dependencies), dependencies)
+
+        with progress_bar_supplier.create(len(sources)) as progress_bar:
+            for source, record in parallel_map(scan, sources, self.jobs, self.interruption):
+                progress_bar.update_summary(source)
+                new_cache[source] = record
                 progress_bar.advance()
+
         cache.clear()
         cache.update(new_cache)
-        return objects
+        return {source: dependencies for source, (_, dependencies) in new_cache.items()}
+
+    def use_linker(self, linker: Linker) -> None:
+        self.linker_identity = self.compiler.select_linker(linker)
+
+    def use_split_dwarf(self, split_dwarf: bool) -> None:
+        if split_dwarf:
+            self.compiler.enable_split_dwarf()
+            if self.compile_workers:
+                self.compile_workers.enable_split_dwarf()
+
+    def use_link_time_optimization(self, link_time_optimization: bool) -> None:
+        if link_time_optimization:
+            self.compiler.enable_link_time_optimization()
+            if self.compile_workers:
+                self.compile_workers.enable_link_time_optimization()
+
+    def get_file_state(self, path: str) -> Tuple[int, float]:
+        return (self.file_system.get_size(path), self.file_system.get_modification_time(path))
+
+    def get_input_hash(self, input_: str, external_libraries: List[str]) -> str:
+        if input_ in self.objects_hashes:
+            object_state, object_hash = self.objects_hashes[input_]
+            if object_state == self.get_file_state(input_):
+                return object_hash
+            del self.objects_hashes[input_]
+        if input_ in external_libraries:
+            exported_symbols = self.compiler.get_exported_symbols(input_)
+            if exported_symbols != None:
+                return hash_binary(exported_symbols.encode())
+        return hash_file(self.file_system, input_)
+
+    def link_using_cache(self,
+                         project_structure: ProjectStructure,
+                         objects: List[str],
+                         external_libraries: List[str],
+                         external_libraries_interfaces: List[str],
+                         outputs: List[str],
+                         link: Callable[[], None],
+                         cache: Dict[str, Any]) -> None:
+        project_directory = project_structure.project_directory
+        outputs           = [output for output in outputs if output]
+        inputs_hashes     = [f'{relative_path(i, project_directory)} {self.get_input_hash(i, external_libraries)}'
+                             for i in objects + external_libraries + external_libraries_interfaces]
+        linker            = [f'linker {self.linker_identity}'] if self.linker_identity else []
+        fingerprint       = hash_binary('\n'.join([self.compiler.get_fingerprint()] + linker + inputs_hashes).encode())
+        if cache.get('fingerprint') == fingerprint and all(self.file_system.exists(o) for o in outputs):
+            return
+
+        cache.clear()
+        keys = {o: hash_binary(f'{fingerprint} {basename(o)}'.encode()) for o in outputs} if self.object_cache else {}
+        if not keys or not all(self.object_cache.fetch(key, output)[0] for output, key in keys.items()):
+            for output in outputs:
+                self.file_system.remove_file_if_it_exists(output)
+            self.compiler.use_link_cache(join(project_structure.target_root, 'link_cache'))
+            link()
+            for output, key in keys.items():
+                if self.file_system.exists(output):
+                    self.object_cache.store(key, output)
+        cache['fingerprint'] = fingerprint
 
     def link_executable_using_cache(self,
                                     project_structure: ProjectStructure,
@@ -164,13 +707,23 @@ class CompilerWrapper:
                                                            artifact_identifier)
         symbols_table    = yield_descriptor.get_symbols_table(project_structure.symbols_tables_root, 
                                                               artifact_identifier)
-        self.compiler.link_executable(project_structure.external_libraries_root,
-                                      project_structure.external_libraries_interfaces_root,
-                                      objects,
-                                      external_libraries,
-                                      external_libraries_interfaces,
-                                      executable,
-                                      symbols_table)
+
+        def link():
+            self.compiler.link_executable(project_structure.external_libraries_root,
+                                          project_structure.external_libraries_interfaces_root,
+                                          objects,
+                                          external_libraries,
+                                          external_libraries_interfaces,
+                                          executable,
+                                          symbols_table)
+
+        self.link_using_cache(project_structure,
+                              objects,
+                              external_libraries,
+                              external_libraries_interfaces,
+                              [executable, symbols_table],
+                              link,
+                              cache)
         if self.file_system.exists(symbols_table):
             return (executable, symbols_table)
         else:
@@ -190,14 +743,24 @@ class CompilerWrapper:
                                                                    artifact_identifier)
         symbols_table     = yield_descriptor.get_symbols_table(project_structure.symbols_tables_root, 
                                                                artifact_identifier)
-        self.compiler.link_library(project_structure.external_libraries_root,
-                                   project_structure.external_libraries_interfaces_root,
-                                   objects,
-                                   external_libraries,
-                                   external_libraries_interfaces,
-                                   library,
-                                   library_interface,
-                                   symbols_table)
+
+        def link():
+            self.compiler.link_library(project_structure.external_libraries_root,
+                                       project_structure.external_libraries_interfaces_root,
+                                       objects,
+                                       external_libraries,
+                                       external_libraries_interfaces,
+                                       library,
+                                       library_interface,
+                                       symbols_table)
+
+        self.link_using_cache(project_structure,
+                              objects,
+                              external_libraries,
+                              external_libraries_interfaces,
+                              [library, library_interface, symbols_table],
+                              link,
+                              cache)
         if self.file_system.exists(symbols_table):
             return (library, library_interface, symbols_table)
         else:
@@ -236,7 +799,10 @@ def get_prefered_compiler(file_system: FileSystem) -> Compiler:
 def intantiate_compiler(file_system: FileSystem,
                         artifact_manifest: ArtifactManifest, 
                         compiler_name: Compiler, 
-                        fallback_compilers: List[Compiler]) -> Tuple[ArtifactManifest, CompilerWrapper]:
+                        fallback_compilers: List[Compiler],
+                        jobs: int = 1,
+                        hashing_strategy: HashingStrategy = HashingStrategy.preprocessed,
+                        object_cache: ObjectCache = None) -> Tuple[ArtifactManifest, CompilerWrapper]:
     manifest       = vars(artifact_manifest)
     final_manifest = None
     compiler       = None
@@ -266,4 +832,4 @@ def intantiate_compiler(file_system: FileSystem,
         if compiler == None:
             raise NoSupportedCompilerFoundError(f"no suitable compiler was found:\n" + '\n'.join(messages))
     
-    return (final_manifest, CompilerWrapper(file_system, compiler))
+    return (final_manifest, CompilerWrapper(file_system, compiler, jobs, hashing_strategy, object_cache))
@@ -1,11 +1,16 @@
 from os.path import normpath
 from praline.common import ProjectStructure
-from praline.common.compiling.compiler import ICompiler, IYieldDescriptor, CompilerWrapper
-from praline.common.file_system import join
+from praline.common import HashingStrategy, Linker
+from praline.common.compiling.compiler import (ICompiler, IYieldDescriptor, CompilerWrapper, LinkerNotFoundError,
+                                               find_linker, identify_linker, parse_dynamic_symbols,
+                                               parse_make_dependencies, parse_show_includes)
+from praline.common.compiling.object_cache import ObjectCache
+from praline.common.file_system import directory_name, join
+from praline.common.hashing import hash_binary
 from praline.common.testing.file_system_mock import FileSystemMock
 from praline.common.testing.progress_bar_mock import ProgressBarSupplierMock
 
-from typing import List
+from typing import Callable, List, Tuple
 from unittest import TestCase
 
 
@@ -29,15 +34,21 @@ class YieldDescriptorMock(IYieldDescriptor):
 class CompilerMock(ICompiler):
     def __init__(self, file_system):
         self.file_system = file_system
+        self.links       = 0
+        self.scans       = 0
 
     def get_yield_descriptor(self) -> IYieldDescriptor:
         return YieldDescriptorMock()
 
+    def get_fingerprint(self) -> str:
+        return 'compmock'
+
     def preprocess(self,
                    headers_root: str,
                    external_headers_root: str,
                    headers: List[str],
-                   source: str) -> bytes:
+                   source: str,
+                   directives_only: bool = False) -> bytes:
         headers = [h for h in headers if source[:-4] == h[:-4]]
         if headers:
             with self.file_system.open_file(headers[0], 'rb') as h:
@@ -52,10 +63,31 @@ class CompilerMock(ICompiler):
                 external_headers_root: str,
                 headers: List[str],
                 source: str,
-                object_: str) -> None:
+                object_: str) -> List[str]:
         data = self.preprocess(headers_root, external_headers_root, headers, source)
         with self.file_system.open_file(object_, 'wb') as o:
             o.write(data)
+        return [h for h in headers if source[:-4] == h[:-4]]
+
+    def scan_dependencies(self,
+                          headers_root: str,
+                          external_headers_root: str,
+                          headers: List[str],
+                          source: str) -> List[str]:
+        self.scans += 1
+        return [source] + [h for h in headers if source[:-4] == h[:-4]]
+
+    def supports_distribution(self) -> bool:
+        return True
+
+    def preprocess_for_distribution(self,
+                                    headers_root: str,
+                                    external_headers_root: str,
+                                    headers: List[str],
+                                    source: str,
+                                    object_: str) -> Tuple[bytes, List[str]]:
+        return (self.preprocess(headers_root, external_headers_root, headers, source), 
+                [h for h in headers if source[:-4] == h[:-4]])
 
     def link_executable(self,
                         external_libraries_root: str,
@@ -65,6 +97,7 @@ class CompilerMock(ICompiler):
                         external_libraries_interfaces: List[str],
                         executable: str,
                         symbols_table: str) -> None:
+        self.links += 1
         data = b''
         for file_name in objects + external_libraries + external_libraries_interfaces:
             with self.file_system.open_file(file_name, 'rb') as o:
@@ -83,6 +116,7 @@ class CompilerMock(ICompiler):
                      library: str,
                      library_interface: str,
                      symbols_table: str) -> None:
+        self.links += 1
         data = b''
         for file_name in objects + external_libraries + external_libraries_interfaces:
             with self.file_system.open_file(file_name, 'rb') as o:
@@ -94,6 +128,100 @@ class CompilerMock(ICompiler):
         with self.file_system.open_file(symbols_table, 'wb') as s:
             s.write(data + b'pbd')
 
+    def get_exported_symbols(self, library: str) -> str:
+        with self.file_system.open_file(library, 'rb') as l:
+            return l.read().split(b';')[0].decode()
+
+
+class PrecompilingCompilerMock(CompilerMock):
+    def __init__(self, file_system):
+        super().__init__(file_system)
+        self.precompiled_header  = None
+        self.precompiled_sources = []
+        self.precompilations     = []
+        self.compilations        = []
+
+    def preprocess(self,
+                   headers_root: str,
+                   external_headers_root: str,
+                   headers: List[str],
+                   source: str,
+                   directives_only: bool = False) -> bytes:
+        if source.endswith('.hpp'):
+            with self.file_system.open_file(source, 'rb') as f:
+                data = f.read()
+            for header in headers:
+                with self.file_system.open_file(header, 'rb') as f:
+                    data += f.read()
+            return data
+        prefix = b'precompiled.' if self.get_precompiled_header(source) else b''
+        return prefix + super().preprocess(headers_root, external_headers_root, headers, source, directives_only)
+
+    def compile(self,
+                headers_root: str,
+                external_headers_root: str,
+                headers: List[str],
+                source: str,
+                object_: str) -> List[str]:
+        self.compilations.append((source, self.get_precompiled_header(source)))
+        return super().compile(headers_root, external_headers_root, headers, source, object_)
+
+    def precompile_header(self,
+                          headers_root: str,
+                          external_headers_root: str,
+                          headers: List[str],
+                          header: str) -> List[str]:
+        self.precompilations.append(header)
+        with self.file_system.open_file(header + '.pch', 'wb') as f:
+            f.write(self.preprocess(headers_root, external_headers_root, headers, header))
+        return [header] + headers
+
+    def use_precompiled_header(self, header: str, sources: List[str]) -> None:
+        self.precompiled_header  = header
+        self.precompiled_sources = sources
+
+    def get_precompiled_header(self, source: str) -> str:
+        return self.precompiled_header if source in self.precompiled_sources else None
+
+
+class SplittingCompilerMock(CompilerMock):
+    def __init__(self, file_system):
+        super().__init__(file_system)
+        self.compilations = []
+
+    def compile(self,
+                headers_root: str,
+                external_headers_root: str,
+                headers: List[str],
+                source: str,
+                object_: str) -> List[str]:
+        self.compilations.append(source)
+        dependencies = super().compile(headers_root, external_headers_root, headers, source, object_)
+        with self.file_system.open_file(self.get_side_outputs(object_)[0], 'wb') as f:
+            f.write(b'debug:' + self.preprocess(headers_root, external_headers_root, headers, source))
+        return dependencies
+
+    def get_side_outputs(self, object_: str) -> List[str]:
+        return [object_[:-len('.obj')] + '.dwo']
+
+
+class CompileWorkerPoolMock:
+    def __init__(self, available: bool):
+        self.available              = available
+        self.split_dwarf            = False
+        self.link_time_optimization = False
+
+    def enable_split_dwarf(self) -> None:
+        self.split_dwarf = True
+
+    def enable_link_time_optimization(self) -> None:
+        self.link_time_optimization = True
+
+    def compile(self, fingerprint: str, preprocess: Callable[[], bytes]) -> bytes:
+        if not self.available:
+            return None
+        return b'remote:' + preprocess()
+
 
 class CompilerTest(TestCase):
     def setUp(self):
@@ -143,10 +271,10 @@ class CompilerTest(TestCase):
         headers  = ['sources/a.hpp', 'sources/b.hpp', 'sources/d.hpp']
         sources  = ['sources/a.cpp', 'sources/b.cpp', 'sources/d.cpp', 'sources/e.cpp']
         cache    = {
-            'sources/a.cpp': '8ceb2730683fdf075d4ede855d5ed98f32be31b093f74b0bee13fd5dea9037dc',
+            'sources/a.cpp': 'f7d557633bba8854ec8be7b9df2c4d03308c908115d57bd2f2658c3011b0f54d',
             'sources/b.cpp': '5addc12d3b54fb9836277adccb06a03131ab92c10faf97613259bb77775db8d3',
             'sources/c.cpp': '853b9c27fdbe775b24a8fb14f7ef43aba1d6e698df4f2df6bc4e0f22c800f1d5',
-            'sources/e.cpp': '7e0494e082ebf4d0b3b06d2433a4c59e3a610ea10e5e3747e5d4d68fd734e485',
+            'sources/e.cpp': '3ca9f6c4aa80c6848b704d9940c968e732fa68b39ddb40dad7dc41582fed75af',
         }
 
         progress_bar_supplier = ProgressBarSupplierMock(self, expected_resolution=5)
@@ -177,121 +305,1288 @@ class CompilerTest(TestCase):
 
         expected_files = {normpath(p): data for p, data in new_files.items()}
 
-        self.assertEqual(file_system.files, expected_files)
+        records = [normpath(f'target/dependencies/{o}.obj.json') for o in ['b', 'd', 'e']]
+
+        self.assertEqual({p: d for p, d in file_system.files.items() if p not in records}, expected_files)
+
+        self.assertEqual(compiler.load_recorded_dependencies(self.project_structure), {
+            normpath('sources/b.cpp'): [normpath('sources/b.hpp')],
+            normpath('sources/d.cpp'): [normpath('sources/d.hpp')],
+            normpath('sources/e.cpp'): [],
+        })
+
+        file_system.touch('sources/d.hpp')
+
+        self.assertEqual(compiler.load_recorded_dependencies(self.project_structure), {
+            normpath('sources/b.cpp'): [normpath('sources/b.hpp')],
+            normpath('sources/e.cpp'): [],
+        })
 
         expected_cache = {
-            'sources/a.cpp': '8ceb2730683fdf075d4ede855d5ed98f32be31b093f74b0bee13fd5dea9037dc',
-            'sources/b.cpp': 'db4b8fea71a29aedd0eac30601ac3489bdc72a3261697215901cf04da2d6a931',
-            'sources/d.cpp': 'edf58f60231d34dfe3eb468e1b4cfeb35dd39cecd796183660cf13bf301f103b',
-            'sources/e.cpp': '7e0494e082ebf4d0b3b06d2433a4c59e3a610ea10e5e3747e5d4d68fd734e485',
+            'sources/a.cpp': 'f7d557633bba8854ec8be7b9df2c4d03308c908115d57bd2f2658c3011b0f54d',
+            'sources/b.cpp': '69df016713d55d4720c918d3d77b7ed2a0ebe9dcb49dc20cc0276ac48e5008cf',
+            'sources/d.cpp': '5bd302151b5038e5d3c8f8d5e228f2cc2f33bbbf9dbce4a29e82ac1471ec9872',
+            'sources/e.cpp': '3ca9f6c4aa80c6848b704d9940c968e732fa68b39ddb40dad7dc41582fed75af',
         }
 
         self.assertEqual(cache, expected_cache)
 
-    def test_link_executable_using_cache(self):
+    def test_compilation_using_cache_in_parallel(self):
         file_system = FileSystemMock(
             directories={
                 self.project_structure.objects_root,
-                self.project_structure.executables_root,
-                self.project_structure.symbols_tables_root,
-                self.project_structure.external_libraries_root,
-                self.project_structure.external_libraries_interfaces_root
-            },
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
             files={
-                'target/objects/a.obj':                       b'object-a.',
-                'target/external/libraries/b.dll':            b'external-library-b.',
-                'target/external/libraries_interfaces/c.lib': b'external-library-interface-c.'
+                'sources/a.hpp': b'header-a.',
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+                'sources/c.cpp': b'source-c.',
+                'sources/d.cpp': b'source-d.',
+                'target/objects/a.obj': b'header-a.source-a.',
+                'target/objects/e.obj': b'source-e.'
             }
         )
 
-        compiler                      = CompilerWrapper(file_system, CompilerMock(file_system))
-        objects                       = ['target/objects/a.obj']
-        external_libraries            = ['target/external/libraries/b.dll']
-        external_libraries_interfaces = ['target/external/libraries_interfaces/c.lib']
-        cache                         = {}
+        compiler = CompilerWrapper(file_system, CompilerMock(file_system), jobs=3)
+        headers  = ['sources/a.hpp']
+        sources  = ['sources/a.cpp', 'sources/b.cpp', 'sources/c.cpp', 'sources/d.cpp']
+        cache    = {
+            'sources/a.cpp': 'f7d557633bba8854ec8be7b9df2c4d03308c908115d57bd2f2658c3011b0f54d',
+            'sources/e.cpp': '3ca9f6c4aa80c6848b704d9940c968e732fa68b39ddb40dad7dc41582fed75af',
+        }
 
-        executable, symbols_table = compiler.link_executable_using_cache(self.project_structure,
-                                                                         self.artifact_identifier,
-                                                                         objects,
-                                                                         external_libraries,
-                                                                         external_libraries_interfaces,
-                                                                         cache)
+        progress_bar_supplier = ProgressBarSupplierMock(self, expected_resolution=5)
 
-        self.assertEqual(normpath(executable), 
-                         normpath('target/executables/org-art-x32-windows-compmock-debug-1.0.0.exe'))
+        objects = compiler.compile_using_cache(self.project_structure,
+                                               headers,
+                                               sources,
+                                               cache,
+                                               progress_bar_supplier)
 
-        self.assertEqual(normpath(symbols_table),
-                         normpath('target/symbols_tables/org-art-x32-windows-compmock-debug-1.0.0.pdb'))
+        expected_objects = ['target/objects/a.obj', 'target/objects/b.obj', 'target/objects/c.obj', 'target/objects/d.obj']
+
+        self.assertEqual([normpath(o) for o in objects], [normpath(o) for o in expected_objects])
 
         new_files = {
-            'target/objects/a.obj':                       b'object-a.',
-            'target/external/libraries/b.dll':            b'external-library-b.',
-            'target/external/libraries_interfaces/c.lib': b'external-library-interface-c.',
-            'target/executables/org-art-x32-windows-compmock-debug-1.0.0.exe':
-                b'object-a.external-library-b.external-library-interface-c.exe',
-            'target/symbols_tables/org-art-x32-windows-compmock-debug-1.0.0.pdb':
-                b'object-a.external-library-b.external-library-interface-c.pbd'
+            'sources/a.hpp': b'header-a.',
+            'sources/a.cpp': b'source-a.',
+            'sources/b.cpp': b'source-b.',
+            'sources/c.cpp': b'source-c.',
+            'sources/d.cpp': b'source-d.',
+            'target/objects/a.obj': b'header-a.source-a.',
+            'target/objects/b.obj': b'source-b.',
+            'target/objects/c.obj': b'source-c.',
+            'target/objects/d.obj': b'source-d.',
         }
 
-        self.assertEqual(file_system.files, {normpath(p): d for p, d in new_files.items()})
+        records = [normpath(f'target/dependencies/{o}.obj.json') for o in ['b', 'c', 'd']]
 
-        new_cache = {}
+        self.assertEqual({p: d for p, d in file_system.files.items() if p not in records}, 
+                         {normpath(p): data for p, data in new_files.items()})
 
-        self.assertEqual(cache, new_cache)
+        self.assertCountEqual(cache.keys(), sources)
 
-    def test_link_library_using_cache(self):
+    def test_compilation_using_cache_with_invalid_jobs(self):
+        file_system = FileSystemMock()
+
+        self.assertRaises(ValueError, CompilerWrapper, file_system, CompilerMock(file_system), jobs=0)
+
+    def test_compilation_using_cache_with_dependencies_hashing_strategy(self):
         file_system = FileSystemMock(
             directories={
                 self.project_structure.objects_root,
-                self.project_structure.libraries_root,
-                self.project_structure.libraries_interfaces_root,
-                self.project_structure.symbols_tables_root,
-                self.project_structure.external_libraries_root,
-                self.project_structure.external_libraries_interfaces_root
-            },
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
             files={
-                'target/objects/a.obj':                       b'object-a.',
-                'target/external/libraries/b.dll':            b'external-library-b.',
-                'target/external/libraries_interfaces/c.lib': b'external-library-interface-c.'
+                'sources/a.hpp': b'header-a.',
+                'sources/a.cpp': b'source-a.',
+                'sources/b.hpp': b'header-b.',
+                'sources/b.cpp': b'source-b.',
             }
         )
 
-        compiler                      = CompilerWrapper(file_system, CompilerMock(file_system))
-        objects                       = ['target/objects/a.obj']
-        external_libraries            = ['target/external/libraries/b.dll']
-        external_libraries_interfaces = ['target/external/libraries_interfaces/c.lib']
-        cache                         = {}
+        compiler = CompilerWrapper(file_system, 
+                                   CompilerMock(file_system), 
+                                   hashing_strategy=HashingStrategy.dependencies)
+        headers  = ['sources/a.hpp', 'sources/b.hpp']
+        sources  = ['sources/a.cpp', 'sources/b.cpp']
+        cache    = {}
 
-        library, library_interface, symbols_table = compiler.link_library_using_cache(self.project_structure,
-                                                                                      self.artifact_identifier,
-                                                                                      objects,
-                                                                                      external_libraries,
-                                                                                      external_libraries_interfaces,
-                                                                                      cache)
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
 
-        self.assertEqual(normpath(library), 
-                         normpath('target/libraries/org-art-x32-windows-compmock-debug-1.0.0.dll'))
+        self.assertEqual(cache['sources/a.cpp'][1], ['sources/a.cpp', 'sources/a.hpp'])
 
-        self.assertEqual(normpath(library_interface), 
-                         normpath('target/libraries_interfaces/org-art-x32-windows-compmock-debug-1.0.0.lib'))
+        self.assertEqual(cache['sources/b.cpp'][1], ['sources/b.cpp', 'sources/b.hpp'])
 
-        self.assertEqual(normpath(symbols_table),
-                         normpath('target/symbols_tables/org-art-x32-windows-compmock-debug-1.0.0.pdb'))
+        with file_system.open_file('sources/b.hpp', 'wb') as f:
+            f.write(b'updated-header-b.')
 
-        new_files = {
-            'target/objects/a.obj':                       b'object-a.',
-            'target/external/libraries/b.dll':            b'external-library-b.',
-            'target/external/libraries_interfaces/c.lib': b'external-library-interface-c.',
-            'target/libraries/org-art-x32-windows-compmock-debug-1.0.0.dll': 
-                b'object-a.external-library-b.external-library-interface-c.dll',
-            'target/libraries_interfaces/org-art-x32-windows-compmock-debug-1.0.0.lib': 
-                b'object-a.external-library-b.external-library-interface-c.lib',
-            'target/symbols_tables/org-art-x32-windows-compmock-debug-1.0.0.pdb': 
-                b'object-a.external-library-b.external-library-interface-c.pbd'
-        }
+        with file_system.open_file('target/objects/a.obj', 'wb') as f:
+            f.write(b'untouched-object-a.')
 
-        self.assertEqual(file_system.files, {normpath(p): data for p, data in new_files.items()})
+        old_cache = dict(cache)
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.obj')], b'untouched-object-a.')
+
+        self.assertEqual(file_system.files[normpath('target/objects/b.obj')], b'updated-header-b.source-b.')
+
+        self.assertEqual(cache['sources/a.cpp'], old_cache['sources/a.cpp'])
+
+        self.assertNotEqual(cache['sources/b.cpp'], old_cache['sources/b.cpp'])
+
+    def test_compilation_using_cache_with_precompiled_header(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.hpp': b'#include <vector>\n',
+                'sources/a.cpp': b'#include "a.hpp"\n#include <string>\n',
+                'sources/b.cpp': b'#include <vector>\n#include <string>\n',
+            }
+        )
+
+        compiler_mock = PrecompilingCompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, 
+                                        compiler_mock, 
+                                        hashing_strategy=HashingStrategy.dependencies)
+        headers       = ['sources/a.hpp']
+        sources       = ['sources/a.cpp', 'sources/b.cpp']
+        cache         = {}
+
+        compiler.precompiling = True
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(len(compiler_mock.precompilations), 1)
+
+        precompiled_header = compiler_mock.precompilations[0]
+
+        self.assertEqual(directory_name(precompiled_header), normpath('target/precompiled/default'))
+
+        self.assertEqual(file_system.files[normpath(precompiled_header)], b'#include <string>\n#include <vector>\n')
+
+        self.assertEqual(sorted(compiler_mock.compilations), [('sources/a.cpp', precompiled_header),
+                                                              ('sources/b.cpp', precompiled_header)])
+
+        self.assertIn(precompiled_header, cache['sources/b.cpp'][1])
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(len(compiler_mock.precompilations), 1)
+
+        self.assertEqual(len(compiler_mock.compilations), 2)
+
+        file_system.remove_file('sources/a.hpp')
+        with file_system.open_file('sources/a.hpp', 'wb') as f:
+            f.write(b'#include <vector>\n#include <map>\n')
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(compiler_mock.precompilations, [precompiled_header, precompiled_header])
+
+        self.assertEqual(sorted(compiler_mock.compilations[2:]), [('sources/a.cpp', precompiled_header),
+                                                                  ('sources/b.cpp', precompiled_header)])
+
+    def test_compilation_using_cache_with_partially_covering_precompiled_header(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.cpp': b'#include <vector>\n#include <string>\n',
+                'sources/b.cpp': b'#include <vector>\n#include <string>\n',
+                'sources/c.cpp': b'#include <map>\n',
+            }
+        )
+
+        compiler_mock = PrecompilingCompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        sources       = ['sources/a.cpp', 'sources/b.cpp', 'sources/c.cpp']
+
+        compiler.precompiling = True
+
+        compiler.compile_using_cache(self.project_structure,
+                                     [],
+                                     sources,
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=3))
+
+        precompiled_header = compiler_mock.precompilations[0]
+
+        self.assertEqual(sorted(compiler_mock.compilations), [('sources/a.cpp', precompiled_header),
+                                                              ('sources/b.cpp', precompiled_header),
+                                                              ('sources/c.cpp', None)])
+
+        self.assertIn(normpath(precompiled_header + '.pch'), file_system.files)
+
+        file_system.remove_file('sources/b.cpp')
+        with file_system.open_file('sources/b.cpp', 'wb') as f:
+            f.write(b'#include <vector>\n')
+
+        compiler.compile_using_cache(self.project_structure,
+                                     [],
+                                     sources,
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=3))
+
+        self.assertEqual(len(compiler_mock.precompilations), 2)
+
+        self.assertNotIn(normpath(precompiled_header), file_system.files)
+
+        self.assertNotIn(normpath(precompiled_header + '.pch'), file_system.files)
+
+        self.assertEqual(len(file_system.files_in_directory('target/precompiled')), 3)
+
+        compiler.precompiling = False
+
+        compiler.compile_using_cache(self.project_structure,
+                                     [],
+                                     sources,
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=3))
+
+        self.assertEqual(file_system.files_in_directory('target/precompiled'), [])
+
+    def test_compilation_using_cache_with_failing_precompiled_header(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.cpp': b'#include <windows.h>\n',
+                'sources/b.cpp': b'#include <windows.h>\n',
+            }
+        )
+
+        compiler_mock = PrecompilingCompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+
+        def failing_precompile_header(headers_root, external_headers_root, headers, header):
+            raise RuntimeError("windows.h: No such file or directory")
+
+        compiler_mock.precompile_header = failing_precompile_header
+        compiler.precompiling           = True
+
+        objects = compiler.compile_using_cache(self.project_structure,
+                                               [],
+                                               ['sources/a.cpp', 'sources/b.cpp'],
+                                               {},
+                                               ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(len(objects), 2)
+
+        self.assertEqual(sorted(compiler_mock.compilations), [('sources/a.cpp', None), ('sources/b.cpp', None)])
+
+    def test_compilation_using_cache_with_unity(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+                'sources/c.cpp': b'source-c.',
+                'sources/executable.cpp': b'source-executable.',
+            }
+        )
+
+        compiler = CompilerWrapper(file_system, CompilerMock(file_system))
+        sources  = ['sources/a.cpp', 'sources/b.cpp', 'sources/c.cpp', 'sources/executable.cpp']
+        cache    = {}
+
+        compiler.compile_using_cache(self.project_structure,
+                                     [],
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=4))
+
+        self.assertEqual(set(file_system.files_in_directory('target/objects')), 
+                         {normpath('target/objects/a.obj'), 
+                          normpath('target/objects/b.obj'), 
+                          normpath('target/objects/c.obj'),
+                          normpath('target/objects/executable.obj')})
+
+        compiler.unity_batch_size = 2
+
+        objects = compiler.compile_using_cache(self.project_structure,
+                                               [],
+                                               sources,
+                                               cache,
+                                               ProgressBarSupplierMock(self, expected_resolution=6),
+                                               unity='main')
+
+        self.assertEqual(objects, [normpath('target/objects/unity-main-0.obj'),
+                                   normpath('target/objects/unity-main-1.obj'),
+                                   normpath('target/objects/executable.obj')])
+
+        self.assertEqual(set(file_system.files_in_directory('target/objects')), set(objects))
+
+        self.assertEqual(file_system.files[normpath('target/objects/unity-main-1.obj')], 
+                         b'#include "../../sources/c.cpp"\n')
+
+        compiler.unity_batch_size = None
+
+        objects = compiler.compile_using_cache(self.project_structure,
+                                               [],
+                                               sources,
+                                               cache,
+                                               ProgressBarSupplierMock(self, expected_resolution=6),
+                                               unity='main')
+
+        self.assertEqual(set(file_system.files_in_directory('target/objects')), set(objects))
+
+        self.assertEqual(len(objects), 4)
+
+    def test_scan_dependencies_using_cache(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.hpp': b'header-a.',
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        headers       = ['sources/a.hpp']
+        sources       = ['sources/a.cpp', 'sources/b.cpp']
+        cache         = {'sources/c.cpp': ('hash', ['sources/c.cpp'])}
+
+        dependencies = compiler.scan_dependencies_using_cache(self.project_structure,
+                                                              headers,
+                                                              sources,
+                                                              cache,
+                                                              ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(dependencies, {
+            'sources/a.cpp': ['sources/a.cpp', 'sources/a.hpp'],
+            'sources/b.cpp': ['sources/b.cpp']
+        })
+
+        self.assertEqual(set(cache.keys()), {'sources/a.cpp', 'sources/b.cpp'})
+
+        self.assertEqual(compiler_mock.scans, 2)
+
+        file_system.remove_file('sources/a.hpp')
+        with file_system.open_file('sources/a.hpp', 'wb') as f:
+            f.write(b'updated-header-a.')
+
+        compiler.scan_dependencies_using_cache(self.project_structure,
+                                               headers,
+                                               sources,
+                                               cache,
+                                               ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(compiler_mock.scans, 3)
+
+    def test_scan_dependencies_using_recorded_dependencies(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            },
+            files={
+                'sources/a.hpp': b'header-a.',
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        headers       = ['sources/a.hpp']
+        sources       = ['sources/a.cpp', 'sources/b.cpp']
+
+        compiler.save_dependencies(self.project_structure, 'sources/a.cpp', 'target/objects/a.obj', ['sources/a.hpp'])
+
+        recorded     = compiler.load_recorded_dependencies(self.project_structure)
+        dependencies = compiler.scan_dependencies_using_cache(self.project_structure,
+                                                              headers,
+                                                              sources,
+                                                              {},
+                                                              ProgressBarSupplierMock(self, expected_resolution=2),
+                                                              recorded)
+
+        self.assertEqual(dependencies, {
+            'sources/a.cpp': ['sources/a.cpp', 'sources/a.hpp'],
+            'sources/b.cpp': ['sources/b.cpp']
+        })
+
+        self.assertEqual(compiler_mock.scans, 1)
+
+    def test_compilation_using_object_cache(self):
+        file_system = FileSystemMock(
+            directories={
+                'cache',
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.hpp': b'header-a.',
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        object_cache  = ObjectCache(file_system, 'cache', size_limit=1024)
+        compiler      = CompilerWrapper(file_system, compiler_mock, object_cache=object_cache)
+        headers       = ['sources/a.hpp']
+        sources       = ['sources/a.cpp', 'sources/b.cpp']
+        evictions     = []
+        evict         = object_cache.evict
+
+        object_cache.evict = lambda: evictions.append(evict())
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(len(evictions), 1)
+
+        file_system.remove_directory_recursively(self.project_structure.objects_root)
+        file_system.create_directory_if_missing(self.project_structure.objects_root)
+
+        def compile(*args):
+            self.fail("objects should have been fetched from the object cache")
+
+        compiler_mock.compile = compile
+
+        cache = {}
+
+        objects = compiler.compile_using_cache(self.project_structure,
+                                               headers,
+                                               sources,
+                                               cache,
+                                               ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual([normpath(o) for o in objects], [normpath('target/objects/a.obj'), 
+                                                          normpath('target/objects/b.obj')])
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.obj')], b'header-a.source-a.')
+
+        self.assertEqual(file_system.files[normpath('target/objects/b.obj')], b'source-b.')
+
+        self.assertCountEqual(cache.keys(), sources)
+
+        self.assertEqual(len(evictions), 1)
+
+        del compiler_mock.compile
+        compiler.object_cache = None
+        file_system.files[normpath('sources/b.cpp')] = b'source-b-modified.'
+        existing = []
+
+        def compile(headers_root, external_headers_root, headers, source, object_):
+            existing.append(file_system.exists(object_))
+            return CompilerMock.compile(compiler_mock, headers_root, external_headers_root, headers, source, object_)
+
+        compiler_mock.compile = compile
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(existing, [False])
+
+        self.assertEqual(file_system.files[normpath('target/objects/b.obj')], b'source-b-modified.')
+
+        self.assertIn(b'source-b.', [contents for path, contents in file_system.files.items() 
+                                     if path.startswith('cache')])
+
+    def test_compilation_using_cache_with_side_outputs(self):
+        file_system = FileSystemMock(
+            directories={
+                'cache',
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.hpp': b'header-a.',
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+            }
+        )
+
+        compiler_mock = SplittingCompilerMock(file_system)
+        object_cache  = ObjectCache(file_system, 'cache', size_limit=1024)
+        compiler      = CompilerWrapper(file_system, compiler_mock, object_cache=object_cache)
+        headers       = ['sources/a.hpp']
+        sources       = ['sources/a.cpp', 'sources/b.cpp']
+        cache         = {}
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(compiler_mock.compilations, sources)
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.dwo')], b'debug:header-a.source-a.')
+
+        self.assertEqual(file_system.files[normpath('target/objects/b.dwo')], b'debug:source-b.')
+
+        file_system.remove_file(normpath('target/objects/b.dwo'))
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(compiler_mock.compilations, sources)
+
+        self.assertEqual(file_system.files[normpath('target/objects/b.dwo')], b'debug:source-b.')
+
+        file_system.remove_directory_recursively(self.project_structure.objects_root)
+        file_system.create_directory_if_missing(self.project_structure.objects_root)
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(compiler_mock.compilations, sources)
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.dwo')], b'debug:header-a.source-a.')
+
+        self.assertEqual(file_system.files[normpath('target/objects/b.dwo')], b'debug:source-b.')
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     ['sources/a.cpp'],
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertNotIn(normpath('target/objects/b.obj'), file_system.files)
+
+        self.assertNotIn(normpath('target/objects/b.dwo'), file_system.files)
+
+    def test_compilation_using_compile_workers(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.hpp': b'header-a.',
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        headers       = ['sources/a.hpp']
+        sources       = ['sources/a.cpp', 'sources/b.cpp']
+
+        def compile(*args):
+            self.fail("sources should have been compiled by the workers")
+
+        compiler_mock.compile    = compile
+        compiler.compile_workers = CompileWorkerPoolMock(available=True)
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.obj')], b'remote:header-a.source-a.')
+
+        self.assertEqual(file_system.files[normpath('target/objects/b.obj')], b'remote:source-b.')
+
+        del compiler_mock.compile
+        compiler.compile_workers = CompileWorkerPoolMock(available=False)
+        file_system.remove_directory_recursively(self.project_structure.objects_root)
+        file_system.create_directory_if_missing(self.project_structure.objects_root)
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.obj')], b'header-a.source-a.')
+
+        self.assertEqual(file_system.files[normpath('target/objects/b.obj')], b'source-b.')
+
+        compiler.use_split_dwarf(True)
+
+        self.assertTrue(compiler.compile_workers.split_dwarf)
+
+        compiler.use_link_time_optimization(True)
+
+        self.assertTrue(compiler.compile_workers.link_time_optimization)
+
+    def test_compilation_using_compile_workers_without_distribution(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.cpp': b'source-a.'
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+
+        compiler_mock.supports_distribution = lambda: False
+        compiler.compile_workers            = CompileWorkerPoolMock(available=True)
+
+        compiler.compile_using_cache(self.project_structure,
+                                     [],
+                                     ['sources/a.cpp'],
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=1))
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.obj')], b'source-a.')
+
+    def test_compilation_using_compile_workers_with_side_outputs(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.cpp': b'source-a.'
+            }
+        )
+
+        compiler_mock = SplittingCompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+
+        compiler.compile_workers = CompileWorkerPoolMock(available=True)
+
+        compiler.compile_using_cache(self.project_structure,
+                                     [],
+                                     ['sources/a.cpp'],
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=1))
+
+        self.assertEqual(compiler_mock.compilations, ['sources/a.cpp'])
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.obj')], b'source-a.')
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.dwo')], b'debug:source-a.')
+
+    def test_compilation_using_cache_with_profiling(self):
+        file_system = FileSystemMock(
+            directories={
+                'cache',
+                self.project_structure.objects_root,
+                self.project_structure.sources_root,
+                self.project_structure.external_headers_root
+            }, 
+            files={
+                'sources/a.hpp': b'header-a.',
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        object_cache  = ObjectCache(file_system, 'cache', size_limit=1024)
+        compiler      = CompilerWrapper(file_system, compiler_mock, object_cache=object_cache)
+        headers       = ['sources/a.hpp']
+        sources       = ['sources/a.cpp', 'sources/b.cpp']
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     {},
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        file_system.remove_directory_recursively(self.project_structure.objects_root)
+        file_system.create_directory_if_missing(self.project_structure.objects_root)
+
+        compiler.profiling = True
+        cache              = {}
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     sources,
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertTrue(file_system.exists(join('target', 'profiles', 'a.obj.json')))
+
+        self.assertTrue(file_system.exists(join('target', 'profiles', 'b.obj.json')))
+
+        with file_system.open_file(join('target', 'compilation-profile.txt'), 'rb') as f:
+            report = f.read().decode()
+
+        self.assertIn("Compilation profile of 2 translation units", report)
+
+        compiler.compile_using_cache(self.project_structure,
+                                     headers,
+                                     ['sources/a.cpp'],
+                                     cache,
+                                     ProgressBarSupplierMock(self, expected_resolution=2))
+
+        self.assertFalse(file_system.exists(join('target', 'profiles', 'b.obj.json')))
+
+        with file_system.open_file(join('target', 'compilation-profile.txt'), 'rb') as f:
+            report = f.read().decode()
+
+        self.assertIn("Compilation profile of 1 translation units", report)
+
+    def test_parse_make_dependencies(self):
+        contents = 'target/objects/a.o: sources/a.cpp sources/a.hpp \\\n sources/with\\ space.hpp\n'
+
+        dependencies = parse_make_dependencies(contents)
+
+        self.assertEqual(dependencies, ['sources/a.cpp', 'sources/a.hpp', 'sources/with space.hpp'])
+
+    def test_parse_dynamic_symbols(self):
+        output = ('_ZN1a1fEv T 0000000000001139 000000000000000b\n'
+                  '_ZN1a1gEv T 0000000000001144 000000000000000b\n'
+                  '_end B 0000000000004020\n')
+
+        symbols = parse_dynamic_symbols(output)
+
+        self.assertEqual(symbols, '_ZN1a1fEv T\n_ZN1a1gEv T\n_end B')
+
+    def test_parse_show_includes(self):
+        output = ('a.cpp\r\n'
+                  'Note: including file: C:\\project\\sources\\a.hpp\r\n'
+                  'Note: including file:  C:\\project\\sources\\b.hpp\r\n')
+
+        dependencies = parse_show_includes(output)
+
+        self.assertEqual(dependencies, ['C:\\project\\sources\\a.hpp', 'C:\\project\\sources\\b.hpp'])
+
+    def test_link_executable_using_cache(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.executables_root,
+                self.project_structure.symbols_tables_root,
+                self.project_structure.external_libraries_root,
+                self.project_structure.external_libraries_interfaces_root
+            },
+            files={
+                'target/objects/a.obj':                       b'object-a.',
+                'target/external/libraries/b.dll':            b'external-library-b.',
+                'target/external/libraries_interfaces/c.lib': b'external-library-interface-c.'
+            }
+        )
+
+        compiler                      = CompilerWrapper(file_system, CompilerMock(file_system))
+        objects                       = ['target/objects/a.obj']
+        external_libraries            = ['target/external/libraries/b.dll']
+        external_libraries_interfaces = ['target/external/libraries_interfaces/c.lib']
+        cache                         = {}
+
+        executable, symbols_table = compiler.link_executable_using_cache(self.project_structure,
+                                                                         self.artifact_identifier,
+                                                                         objects,
+                                                                         external_libraries,
+                                                                         external_libraries_interfaces,
+                                                                         cache)
+
+        self.assertEqual(normpath(executable), 
+                         normpath('target/executables/org-art-x32-windows-compmock-debug-1.0.0.exe'))
+
+        self.assertEqual(normpath(symbols_table),
+                         normpath('target/symbols_tables/org-art-x32-windows-compmock-debug-1.0.0.pdb'))
+
+        new_files = {
+            'target/objects/a.obj':                       b'object-a.',
+            'target/external/libraries/b.dll':            b'external-library-b.',
+            'target/external/libraries_interfaces/c.lib': b'external-library-interface-c.',
+            'target/executables/org-art-x32-windows-compmock-debug-1.0.0.exe':
+                b'object-a.external-library-b.external-library-interface-c.exe',
+            'target/symbols_tables/org-art-x32-windows-compmock-debug-1.0.0.pdb':
+                b'object-a.external-library-b.external-library-interface-c.pbd'
+        }
+
+        self.assertEqual(file_system.files, {normpath(p): d for p, d in new_files.items()})
+
+        self.assertEqual(list(cache.keys()), ['fingerprint'])
+
+    def test_link_library_using_cache(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.libraries_root,
+                self.project_structure.libraries_interfaces_root,
+                self.project_structure.symbols_tables_root,
+                self.project_structure.external_libraries_root,
+                self.project_structure.external_libraries_interfaces_root
+            },
+            files={
+                'target/objects/a.obj':                       b'object-a.',
+                'target/external/libraries/b.dll':            b'external-library-b.',
+                'target/external/libraries_interfaces/c.lib': b'external-library-interface-c.'
+            }
+        )
+
+        compiler                      = CompilerWrapper(file_system, CompilerMock(file_system))
+        objects                       = ['target/objects/a.obj']
+        external_libraries            = ['target/external/libraries/b.dll']
+        external_libraries_interfaces = ['target/external/libraries_interfaces/c.lib']
+        cache                         = {}
+
+        library, library_interface, symbols_table = compiler.link_library_using_cache(self.project_structure,
+                                                                                      self.artifact_identifier,
+                                                                                      objects,
+                                                                                      external_libraries,
+                                                                                      external_libraries_interfaces,
+                                                                                      cache)
+
+        self.assertEqual(normpath(library), 
+                         normpath('target/libraries/org-art-x32-windows-compmock-debug-1.0.0.dll'))
+
+        self.assertEqual(normpath(library_interface), 
+                         normpath('target/libraries_interfaces/org-art-x32-windows-compmock-debug-1.0.0.lib'))
+
+        self.assertEqual(normpath(symbols_table),
+                         normpath('target/symbols_tables/org-art-x32-windows-compmock-debug-1.0.0.pdb'))
+
+        new_files = {
+            'target/objects/a.obj':                       b'object-a.',
+            'target/external/libraries/b.dll':            b'external-library-b.',
+            'target/external/libraries_interfaces/c.lib': b'external-library-interface-c.',
+            'target/libraries/org-art-x32-windows-compmock-debug-1.0.0.dll': 
+                b'object-a.external-library-b.external-library-interface-c.dll',
+            'target/libraries_interfaces/org-art-x32-windows-compmock-debug-1.0.0.lib': 
+                b'object-a.external-library-b.external-library-interface-c.lib',
+            'target/symbols_tables/org-art-x32-windows-compmock-debug-1.0.0.pdb': 
+                b'object-a.external-library-b.external-library-interface-c.pbd'
+        }
+
+        self.assertEqual(file_system.files, {normpath(p): data for p, data in new_files.items()})
+
+        self.assertEqual(list(cache.keys()), ['fingerprint'])
+
+    def test_link_executable_using_cache_avoids_relinking(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.executables_root,
+                self.project_structure.symbols_tables_root
+            },
+            files={
+                'target/objects/a.obj': b'object-a.'
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        objects       = ['target/objects/a.obj']
+        executable    = 'target/executables/org-art-x32-windows-compmock-debug-1.0.0.exe'
+        cache         = {}
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        self.assertEqual(compiler_mock.links, 1)
+
+        file_system.remove_file('target/objects/a.obj')
+        file_system.create_file_if_missing('target/objects/a.obj', b'object-a-modified.')
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        self.assertEqual(compiler_mock.links, 2)
+
+        self.assertEqual(file_system.files[normpath(executable)], b'object-a-modified.exe')
+
+        file_system.remove_file(executable)
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        self.assertEqual(compiler_mock.links, 3)
+
+    def test_link_executable_using_cache_with_object_changed_by_another_process(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.executables_root,
+                self.project_structure.symbols_tables_root
+            },
+            files={
+                'target/objects/a.obj': b'object-a.'
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        objects       = ['target/objects/a.obj']
+        executable    = 'target/executables/org-art-x32-windows-compmock-debug-1.0.0.exe'
+        cache         = {}
+
+        compiler.objects_hashes['target/objects/a.obj'] = ((9, 0), hash_binary(b'object-a.'))
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        file_system.files[normpath('target/objects/a.obj')] = b'object-b.'
+        file_system.touch('target/objects/a.obj')
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        self.assertEqual(compiler_mock.links, 2)
+
+        self.assertEqual(file_system.files[normpath(executable)], b'object-b.exe')
+
+        self.assertNotIn('target/objects/a.obj', compiler.objects_hashes)
+
+    def test_link_executable_using_cache_with_changed_linker(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.executables_root,
+                self.project_structure.symbols_tables_root
+            },
+            files={
+                'target/objects/a.obj': b'object-a.'
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        objects       = ['target/objects/a.obj']
+        cache         = {}
+
+        compiler_mock.select_linker = lambda linker: f'{linker}-identity'
+
+        compiler.use_linker(Linker.ld)
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        compiler.use_linker(Linker.ld)
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        self.assertEqual(compiler_mock.links, 1)
+
+        compiler.use_linker(Linker.mold)
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        self.assertEqual(compiler_mock.links, 2)
+
+    def test_link_executable_using_cache_with_link_time_optimization(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.executables_root,
+                self.project_structure.symbols_tables_root
+            },
+            files={
+                'target/objects/a.obj': b'object-a.'
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        objects       = ['target/objects/a.obj']
+        cache         = {}
+        link_caches   = []
+
+        compiler_mock.use_link_cache = link_caches.append
+
+        compiler.use_link_time_optimization(False)
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        def enable_link_time_optimization():
+            compiler_mock.get_fingerprint = lambda: 'compmock-lto'
+
+        compiler_mock.enable_link_time_optimization = enable_link_time_optimization
+
+        compiler.use_link_time_optimization(True)
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        compiler.link_executable_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], cache)
+
+        self.assertEqual(compiler_mock.links, 2)
+
+        self.assertEqual(link_caches, [join('target', 'link_cache')] * 2)
+
+    def test_find_linker(self):
+        available   = {'ld', 'ld.lld', 'ld.gold'}
+        file_system = FileSystemMock(on_which=lambda thing: f'/usr/bin/{thing}' if thing in available else None)
+        executables = {Linker.ld: 'ld', Linker.mold: 'mold', Linker.lld: 'ld.lld', Linker.gold: 'ld.gold'}
+
+        self.assertEqual(find_linker(file_system, Linker.auto, executables), (Linker.lld, 'ld.lld'))
+
+        self.assertEqual(find_linker(file_system, Linker.gold, executables), (Linker.gold, 'ld.gold'))
+
+        self.assertEqual(find_linker(file_system, Linker.ld, executables), (Linker.ld, 'ld'))
+
+        self.assertRaises(LinkerNotFoundError, find_linker, file_system, Linker.mold, executables)
+
+        available.clear()
+
+        self.assertEqual(find_linker(file_system, Linker.auto, executables), (Linker.ld, 'ld'))
+
+        self.assertRaises(LinkerNotFoundError, find_linker, file_system, Linker.gold, {Linker.ld: 'ld'})
+
+    def test_identify_linker(self):
+        file_system = FileSystemMock(directories={'/usr/bin'}, 
+                                     files={'/usr/bin/ld.lld': b'lld'}, 
+                                     on_which=lambda thing: f'/usr/bin/{thing}')
+        probes      = []
+
+        def execute(command):
+            probes.append(command)
+            return (0, b'LLD 17.0.6', b'')
+
+        file_system.execute = execute
+
+        self.assertEqual(identify_linker(file_system, Linker.ld, 'ld'), hash_binary(b'ld'))
+
+        self.assertEqual(probes, [])
+
+        identity = identify_linker(file_system, Linker.lld, 'ld.lld')
+
+        self.assertEqual(identity, hash_binary(b'lld LLD 17.0.6'))
+
+        self.assertEqual(identify_linker(file_system, Linker.lld, 'ld.lld'), identity)
+
+        self.assertEqual(probes, [['ld.lld', '--version']])
+
+        file_system.touch('/usr/bin/ld.lld')
+
+        identify_linker(file_system, Linker.lld, 'ld.lld')
+
+        self.assertEqual(len(probes), 2)
+
+    def test_select_linker_without_linker_support(self):
+        compiler_mock = CompilerMock(FileSystemMock())
+
+        self.assertIsNone(compiler_mock.select_linker(Linker.auto))
+
+        self.assertRaises(LinkerNotFoundError, compiler_mock.select_linker, Linker.mold)
+
+    def test_link_library_using_object_cache(self):
+        file_system = FileSystemMock(
+            directories={
+                'cache',
+                self.project_structure.objects_root,
+                self.project_structure.libraries_root,
+                self.project_structure.libraries_interfaces_root,
+                self.project_structure.symbols_tables_root
+            },
+            files={
+                'target/objects/a.obj': b'object-a.'
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        object_cache  = ObjectCache(file_system, 'cache', 1024)
+        compiler      = CompilerWrapper(file_system, compiler_mock, object_cache=object_cache)
+        objects       = ['target/objects/a.obj']
+        library       = 'target/libraries/org-art-x32-windows-compmock-debug-1.0.0.dll'
+
+        compiler.link_library_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], {})
+
+        file_system.remove_file(library)
+
+        compiler.link_library_using_cache(self.project_structure, self.artifact_identifier, objects, [], [], {})
+
+        self.assertEqual(compiler_mock.links, 1)
+
+        self.assertEqual(file_system.files[normpath(library)], b'object-a.dll')
+
+    def test_link_executable_using_cache_with_unchanged_outputs(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.sources_root,
+                self.project_structure.objects_root,
+                self.project_structure.executables_root,
+                self.project_structure.symbols_tables_root,
+                self.project_structure.external_libraries_root
+            },
+            files={
+                'sources/a.cpp': b'a() {} // first',
+                'target/external/libraries/b.dll': b'b();implementation-b.'
+            }
+        )
+
+        compiler_mock      = CompilerMock(file_system)
+        compiler           = CompilerWrapper(file_system, 
+                                             compiler_mock, 
+                                             hashing_strategy=HashingStrategy.directives_only)
+        sources            = ['sources/a.cpp']
+        external_libraries = ['target/external/libraries/b.dll']
+        compile_cache      = {}
+        link_cache         = {}
+
+        def build():
+            objects = compiler.compile_using_cache(self.project_structure,
+                                                   [],
+                                                   sources,
+                                                   compile_cache,
+                                                   ProgressBarSupplierMock(self, expected_resolution=1))
+            compiler.link_executable_using_cache(self.project_structure,
+                                                 self.artifact_identifier,
+                                                 objects,
+                                                 external_libraries,
+                                                 [],
+                                                 link_cache)
+
+        def preprocess(headers_root, external_headers_root, headers, source, directives_only=False):
+            with file_system.open_file(source, 'rb') as f:
+                return f.read() if directives_only else f.read().split(b' //')[0]
+
+        compiler_mock.preprocess = preprocess
+
+        build()
+
+        file_system.remove_file('sources/a.cpp')
+        file_system.create_file_if_missing('sources/a.cpp', b'a() {} // second')
+
+        file_system.remove_file('target/external/libraries/b.dll')
+        file_system.create_file_if_missing('target/external/libraries/b.dll', b'b();rebuilt-implementation-b.')
+
+        build()
+
+        self.assertEqual(compiler_mock.links, 1)
+
+        file_system.remove_file('target/external/libraries/b.dll')
+        file_system.create_file_if_missing('target/external/libraries/b.dll', b'b() c();implementation-b.')
+
+        build()
+
+        self.assertEqual(compiler_mock.links, 2)
+
+    def test_compilation_using_cache_with_changed_flags(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root
+            },
+            files={
+                'sources/a.cpp': b'source-a.'
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        cache         = {}
+
+        compiler.compile_using_cache(self.project_structure, 
+                                     [], 
+                                     ['sources/a.cpp'], 
+                                     cache, 
+                                     ProgressBarSupplierMock(self, expected_resolution=1))
+
+        old_cache = dict(cache)
+
+        compiler_mock.get_fingerprint = lambda: 'compmock -O3'
+
+        compiler.compile_using_cache(self.project_structure, 
+                                     [], 
+                                     ['sources/a.cpp'], 
+                                     cache, 
+                                     ProgressBarSupplierMock(self, expected_resolution=1))
+
+        self.assertNotEqual(cache['sources/a.cpp'], old_cache['sources/a.cpp'])
+
+    def test_compilation_using_cache_with_failing_source(self):
+        file_system = FileSystemMock(
+            directories={
+                self.project_structure.objects_root,
+                self.project_structure.sources_root
+            },
+            files={
+                'sources/a.cpp': b'source-a.',
+                'sources/b.cpp': b'source-b.',
+                'sources/c.cpp': b'error'
+            }
+        )
+
+        compiler_mock = CompilerMock(file_system)
+        compile       = compiler_mock.compile
+        compiler      = CompilerWrapper(file_system, compiler_mock)
+        sources       = ['sources/a.cpp', 'sources/b.cpp', 'sources/c.cpp']
+        cache         = {}
+
+        def failing_compile(headers_root, external_headers_root, headers, source, object_):
+            if compiler_mock.preprocess(headers_root, external_headers_root, headers, source) == b'error':
+                raise RuntimeError(f"failed compiling source {source}")
+            return compile(headers_root, external_headers_root, headers, source, object_)
+
+        compiler_mock.compile = failing_compile
+
+        self.assertRaises(RuntimeError, 
+                          compiler.compile_using_cache, 
+                          self.project_structure, 
+                          [], 
+                          sources, 
+                          cache, 
+                          ProgressBarSupplierMock(self, expected_resolution=3))
+
+        self.assertEqual(set(cache.keys()), {'sources/a.cpp', 'sources/b.cpp'})
+
+        file_system.remove_file('sources/c.cpp')
+        file_system.create_file_if_missing('sources/c.cpp', b'source-c.')
+
+        file_system.remove_file('target/objects/a.obj')
+        file_system.create_file_if_missing('target/objects/a.obj', b'untouched-object-a.')
+
+        compiler.compile_using_cache(self.project_structure, 
+                                     [], 
+                                     sources, 
+                                     cache, 
+                                     ProgressBarSupplierMock(self, expected_resolution=3))
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.obj')], b'untouched-object-a.')
 
-        new_cache = {}
+        self.assertEqual(file_system.files[normpath('target/objects/c.obj')], b'source-c.')
 
-        self.assertEqual(cache, new_cache)
+        self.assertEqual(set(cache.keys()), set(sources))
@@ -1,8 +1,12 @@
-from praline.common import (Architecture, ArtifactManifest, Compiler, ExportedSymbols, Mode, Platform,
+from praline.common import (Architecture, ArtifactManifest, Compiler, ExportedSymbols, Linker, Mode, Platform,
                             get_artifact_logging_level_code)
-from praline.common.compiling.compiler import ICompiler, CompilerInstantionError, ICompilerSupplier, IYieldDescriptor
-from praline.common.file_system import basename, FileSystem, join
-from typing import List
+from praline.common.compiling.compiler import (ICompiler, CompilerInstantionError, ICompilerSupplier, IYieldDescriptor,
+                                               find_linker, identify_linker, parse_dynamic_symbols,
+                                               parse_make_dependencies)
+from praline.common.compiling.profiling import CompilationProfile, parse_time_report
+from praline.common.file_system import basename, FileSystem, join, normalized_path
+from praline.common.hashing import hash_binary
+from typing import Callable, List, Tuple
 
 import logging
 
@@ -10,7 +14,21 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+gcc_linkers = {
+    Linker.ld  : 'ld',
+    Linker.mold: 'mold',
+    Linker.lld : 'ld.lld',
+    Linker.gold: 'ld.gold'
+}
+
+
+gcc_symbols_table_packagers = ['llvm-dwp', 'dwp']
+
+
 class GccYieldDescriptor(IYieldDescriptor):    
+    def __init__(self, symbols_tables: bool = True):
+        self.symbols_tables = symbols_tables
+
     def get_object(self, sources_root: str, objects_root: str, source: str) -> str:
         return super().get_object(sources_root, objects_root, source) + '.o'
 
@@ -24,14 +42,21 @@ class GccYieldDescriptor(IYieldDescriptor):
         return None
 
     def get_symbols_table(self, symbols_tables_root: str, name: str) -> str:
-        return None
+        return join(symbols_tables_root, f'{name}.dwp') if self.symbols_tables else None
 
 
 class GccCompiler(ICompiler):
     def __init__(self, file_system: FileSystem, artifact_manifest: ArtifactManifest):
-        self.file_system       = file_system
-        self.artifact_manifest = artifact_manifest
-        logging_level_code     = get_artifact_logging_level_code(artifact_manifest.artifact_logging_level)
+        self.file_system         = file_system
+        self.artifact_manifest   = artifact_manifest
+        self.fingerprint         = None
+        self.precompiled_header  = None
+        self.precompiled_sources = set()
+        self.link_flags          = []
+        self.linker              = Linker.ld
+        self.split_dwarf         = False
+        self.packager            = None
+        logging_level_code       = get_artifact_logging_level_code(artifact_manifest.artifact_logging_level)
 
         if artifact_manifest.exported_symbols == ExportedSymbols.explicit:
             visibility = 'hidden'
@@ -61,14 +86,24 @@ class GccCompiler(ICompiler):
             raise CompilerInstantionError(f"the gcc compiler could not find the g++ executable in the PATH")
 
     def get_yield_descriptor(self) -> IYieldDescriptor:
-        return GccYieldDescriptor()
+        return GccYieldDescriptor(self.packager != None)
+
+    def get_fingerprint(self) -> str:
+        if self.fingerprint == None:
+            _, version, _ = self.file_system.execute(['g++', '--version'])
+            self.fingerprint = hash_binary(version + ' '.join(self.flags).encode())
+        return self.fingerprint
 
     def preprocess(self,
                    headers_root: str,
                    external_headers_root: str,
                    headers: List[str],
-                   source: str) -> bytes:
-        status, stdout, stderror = self.file_system.execute(['g++', '-E', '-P', source] + self.flags + 
+                   source: str,
+                   directives_only: bool = False) -> bytes:
+        directives  = ['-fdirectives-only'] if directives_only else []
+        precompiled = self.get_precompiled_header_flags(source, compiling=False)
+        status, stdout, stderror = self.file_system.execute(['g++', '-E', '-P', source] + directives + self.flags + 
+                                                            precompiled + 
                                                             [f'-I{headers_root}', f'-I{external_headers_root}'])
         if stderror:
             logger.error(stderror.decode())
@@ -76,14 +111,151 @@ class GccCompiler(ICompiler):
             raise RuntimeError(f"failed preprocessing source {source} -- process exited with status code {status}")
         return stdout
 
+    def preprocess_streaming(self,
+                             headers_root: str,
+                             external_headers_root: str,
+                             headers: List[str],
+                             source: str,
+                             consume: Callable[[bytes], None],
+                             directives_only: bool = False) -> None:
+        directives  = ['-fdirectives-only'] if directives_only else []
+        precompiled = self.get_precompiled_header_flags(source, compiling=False)
+        status, stderror = self.file_system.execute_streaming(['g++', '-E', '-P', source] + directives + self.flags + 
+                                                              precompiled + 
+                                                              [f'-I{headers_root}', f'-I{external_headers_root}'],
+                                                              consume)
+        if stderror:
+            logger.error(stderror.decode())
+        if status != 0:
+            raise RuntimeError(f"failed preprocessing source {source} -- process exited with status code {status}")
+
     def compile(self,
                 headers_root: str,
                 external_headers_root: str,
                 headers: List[str],
                 source: str,
-                object_: str):
-        self.file_system.execute_and_fail_on_bad_return(['g++', '-o', object_, '-c', source] + self.flags + 
+                object_: str) -> List[str]:
+        dependencies_file = object_ + '.d'
+        self.file_system.execute_and_fail_on_bad_return(['g++', '-o', object_, '-c', source, 
+                                                         '-MMD', '-MF', dependencies_file] + self.flags + 
+                                                        self.get_precompiled_header_flags(source, compiling=True) + 
+                                                        [f'-I{headers_root}', f'-I{external_headers_root}'])
+        with self.file_system.open_file(dependencies_file, 'r') as f:
+            dependencies = parse_make_dependencies(f.read())
+        self.file_system.remove_file(dependencies_file)
+        return dependencies
+
+    def scan_dependencies(self,
+                          headers_root: str,
+                          external_headers_root: str,
+                          headers: List[str],
+                          source: str) -> List[str]:
+        status, stdout, stderror = self.file_system.execute(['g++', '-MM', source] + self.flags + 
+                                                            [f'-I{headers_root}', f'-I{external_headers_root}'])
+        if stderror:
+            logger.error(stderror.decode())
+        if status != 0:
+            raise RuntimeError(f"failed scanning dependencies of source {source} -- process exited with status code "
+                               f"{status}")
+        return parse_make_dependencies(stdout.decode())
+
+    def precompile_header(self,
+                          headers_root: str,
+                          external_headers_root: str,
+                          headers: List[str],
+                          header: str) -> List[str]:
+        dependencies_file = header + '.d'
+        self.file_system.execute_and_fail_on_bad_return(['g++', '-x', 'c++-header', '-o', header + '.gch', header, 
+                                                         '-MMD', '-MF', dependencies_file] + self.flags + 
                                                         [f'-I{headers_root}', f'-I{external_headers_root}'])
+        with self.file_system.open_file(dependencies_file, 'r') as f:
+            dependencies = parse_make_dependencies(f.read())
+        self.file_system.remove_file(dependencies_file)
+        return dependencies
+
+    def use_precompiled_header(self, header: str, sources: List[str]) -> None:
+        self.precompiled_header  = header
+        self.precompiled_sources = {normalized_path(s) for s in sources}
+
+    def enable_split_dwarf(self) -> None:
+        if self.artifact_manifest.mode != Mode.debug or self.split_dwarf:
+            return
+        self.split_dwarf = True
+        self.flags.append('-gsplit-dwarf')
+        self.fingerprint = None
+        self.packager    = next((p for p in gcc_symbols_table_packagers if self.file_system.which(p)), None)
+        if self.packager == None:
+            logger.warning(f"none of {', '.join(gcc_symbols_table_packagers)} was found in the PATH -- split debug "
+                           "information won't be packaged in symbols tables")
+
+    def get_side_outputs(self, object_: str) -> List[str]:
+        return [object_[:-len('.o')] + '.dwo'] if self.split_dwarf else []
+
+    def get_split_dwarf_link_flags(self) -> List[str]:
+        return ['-Wl,--gdb-index'] if self.split_dwarf and self.linker != Linker.ld else []
+
+    def package_symbols_table(self, linked: str, symbols_table: str) -> None:
+        if symbols_table != None and self.packager != None:
+            self.file_system.execute_and_fail_on_bad_return([self.packager, '-e', linked, '-o', symbols_table])
+
+    def enable_link_time_optimization(self) -> None:
+        if self.artifact_manifest.mode != Mode.release or '-flto=auto' in self.flags:
+            return
+        self.flags.append('-flto=auto')
+        self.fingerprint = None
+
+    def get_precompiled_header_flags(self, source: str, compiling: bool) -> List[str]:
+        if self.precompiled_header == None or normalized_path(source) not in self.precompiled_sources:
+            return []
+        return ['-include', self.precompiled_header]
+
+    def compile_and_profile(self,
+                            headers_root: str,
+                            external_headers_root: str,
+                            headers: List[str],
+                            source: str,
+                            object_: str) -> Tuple[List[str], CompilationProfile]:
+        dependencies_file = object_ + '.d'
+        command           = (['g++', '-o', object_, '-c', source, '-MMD', '-MF', dependencies_file, '-ftime-report'] + 
+                             self.flags + self.get_precompiled_header_flags(source, compiling=True) + 
+                             [f'-I{headers_root}', f'-I{external_headers_root}'])
+        status, _, stderror, usage = self.file_system.execute_and_measure(command)
+        if status != 0:
+            logger.error(stderror.decode())
+            raise RuntimeError(f"command exited with return code {status}")
+        with self.file_system.open_file(dependencies_file, 'r') as f:
+            dependencies = parse_make_dependencies(f.read())
+        self.file_system.remove_file(dependencies_file)
+        phases = parse_time_report(stderror.decode())
+        return (dependencies, CompilationProfile(source, usage.wall_time, usage.peak_memory, phases, {}, {}))
+
+    def supports_distribution(self) -> bool:
+        return True
+
+    def preprocess_for_distribution(self,
+                                    headers_root: str,
+                                    external_headers_root: str,
+                                    headers: List[str],
+                                    source: str,
+                                    object_: str) -> Tuple[bytes, List[str]]:
+        dependencies_file = object_ + '.d'
+        precompiled       = self.get_precompiled_header_flags(source, compiling=False)
+        status, stdout, stderror = self.file_system.execute(['g++', '-E', source, 
+                                                             '-MMD', '-MF', dependencies_file] + self.flags + 
+                                                            precompiled + 
+                                                            [f'-I{headers_root}', f'-I{external_headers_root}'])
+        if stderror:
+            logger.error(stderror.decode())
+        if status != 0:
+            raise RuntimeError(f"failed preprocessing source {source} -- process exited with status code {status}")
+        with self.file_system.open_file(dependencies_file, 'r') as f:
+            dependencies = parse_make_dependencies(f.read())
+        self.file_system.remove_file(dependencies_file)
+        return (stdout, dependencies)
+
+    def compile_preprocessed(self, preprocessed_source: str, object_: str) -> None:
+        self.file_system.execute_and_fail_on_bad_return(['g++', '-o', object_, '-c', preprocessed_source] + 
+                                                        self.flags)
 
     def link_executable(self,
                         external_libraries_root: str,
@@ -96,8 +268,11 @@ class GccCompiler(ICompiler):
         self.file_system.execute_and_fail_on_bad_return(['g++', '-o', executable,
                                                          '-Wl,-rpath,$ORIGIN/../libraries',
                                                          '-Wl,-rpath,$ORIGIN/../external/libraries'] +
-                                                        self.flags + objects + [f'-L{external_libraries_root}'] +
+                                                        self.flags + self.link_flags + 
+                                                        self.get_split_dwarf_link_flags() + objects + 
+                                                        [f'-L{external_libraries_root}'] +
                                                         [f'-l{basename(lib)[3:-3]}' for lib in external_libraries])
+        self.package_symbols_table(executable, symbols_table)
 
     def link_library(self,
                      external_libraries_root: str,
@@ -109,8 +284,21 @@ class GccCompiler(ICompiler):
                      library_interface: str,
                      symbols_table: str):
         self.file_system.execute_and_fail_on_bad_return(['g++', '-o', library, '-shared'] +
-                                                        self.flags + objects + [f'-L{external_libraries_root}'] +
+                                                        self.flags + self.link_flags + 
+                                                        self.get_split_dwarf_link_flags() + objects + 
+                                                        [f'-L{external_libraries_root}'] +
                                                         [f'-l{basename(lib)[3:-3]}' for lib in external_libraries])
+        self.package_symbols_table(library, symbols_table)
+
+    def select_linker(self, linker: Linker) -> str:
+        linker, executable = find_linker(self.file_system, linker, gcc_linkers)
+        self.link_flags    = [f'-fuse-ld={linker}'] if linker != Linker.ld else []
+        self.linker        = linker
+        return identify_linker(self.file_system, linker, executable)
+
+    def get_exported_symbols(self, library: str) -> str:
+        status, stdout, _ = self.file_system.execute(['nm', '-D', '--defined-only', '-P', library])
+        return parse_dynamic_symbols(stdout.decode()) if status == 0 else None
 
 
 class GccCompilerSupplier(ICompilerSupplier):
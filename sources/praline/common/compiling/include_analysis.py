@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass(frozen=True)
+class HeaderImpact:
+    header: str
+    translation_units: int
+    rebuild_time: float
+    unprofiled_translation_units: int
+    fan_out: bool
+
+
+def analyze_header_impact(headers: List[str],
+                          dependencies: Dict[str, List[str]],
+                          compile_times: Dict[str, float],
+                          fan_out_ratio: float = 0.25) -> List[HeaderImpact]:
+    includers = {header: [] for header in headers}
+    for source, source_dependencies in dependencies.items():
+        for dependency in source_dependencies:
+            if dependency in includers:
+                includers[dependency].append(source)
+
+    impacts = []
+    for header, sources in includers.items():
+        times   = [compile_times[source] for source in sources if source in compile_times]
+        fan_out = len(sources) > 1 and len(sources) >= fan_out_ratio * len(dependencies)
+        impacts.append(HeaderImpact(header, len(sources), sum(times), len(sources) - len(times), fan_out))
+    return sorted(impacts, key=lambda i: (-i.rebuild_time, -i.translation_units, i.header))
+
+
+def format_include_report(impacts: List[HeaderImpact], translation_units: int, profiled_translation_units: int) -> str:
+    lines = [f"Impact of {len(impacts)} headers on {translation_units} translation units, with compile times from "
+             f"{profiled_translation_units} profiled translation units", '',
+             "      units   rebuild time  header"]
+    for impact in impacts:
+        unprofiled = '*' if impact.unprofiled_translation_units else ' '
+        fan_out    = '  [fan-out]' if impact.fan_out else ''
+        lines.append(f"  {impact.translation_units:9}  {impact.rebuild_time:12.2f}s{unprofiled} {impact.header}{fan_out}")
+
+    if any(impact.unprofiled_translation_units for impact in impacts):
+        lines += ['', "* some including translation units have no compilation profile, build with "
+                      "--profile-compilation to account for them"]
+
+    fan_outs = [impact.header for impact in impacts if impact.fan_out]
+    if fan_outs:
+        lines += ['', "Fan-out points where forward declarations or pimpl would cut incremental build times"]
+        lines += [f"  {header}" for header in fan_outs]
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,40 @@
+from praline.common.compiling.include_analysis import HeaderImpact, analyze_header_impact, format_include_report
+
+from unittest import TestCase
+
+
+class IncludeAnalysisTest(TestCase):
+    def test_analyze_header_impact(self):
+        headers      = ['sources/a.hpp', 'sources/b.hpp', 'sources/c.hpp']
+        dependencies = {
+            'sources/a.cpp': ['sources/a.cpp', 'sources/a.hpp', 'sources/b.hpp'],
+            'sources/b.cpp': ['sources/b.cpp', 'sources/b.hpp'],
+            'sources/c.cpp': ['sources/c.cpp', 'sources/b.hpp', 'external/d.hpp'],
+        }
+        compile_times = {'sources/a.cpp': 2.0, 'sources/b.cpp': 1.0}
+
+        impacts = analyze_header_impact(headers, dependencies, compile_times, fan_out_ratio=0.5)
+
+        self.assertEqual(impacts, [
+            HeaderImpact('sources/b.hpp', 3, 3.0, 1, True),
+            HeaderImpact('sources/a.hpp', 1, 2.0, 0, False),
+            HeaderImpact('sources/c.hpp', 0, 0.0, 0, False)
+        ])
+
+    def test_format_include_report(self):
+        impacts = [
+            HeaderImpact('sources/b.hpp', 3, 3.0, 1, True),
+            HeaderImpact('sources/a.hpp', 1, 2.0, 0, False)
+        ]
+
+        report = format_include_report(impacts, 3, 2).splitlines()
+
+        self.assertEqual(report[0], "Impact of 2 headers on 3 translation units, with compile times from 2 profiled "
+                                    "translation units")
+
+        self.assertEqual(report[3:5], ["          3          3.00s* sources/b.hpp  [fan-out]",
+                                       "          1          2.00s  sources/a.hpp"])
+
+        self.assertTrue(report[6].startswith("* some including translation units have no compilation profile"))
+
+        self.assertEqual(report[9], "  sources/b.hpp")
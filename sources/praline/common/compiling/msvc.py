@@ -1,7 +1,9 @@
 from praline.common import (Architecture, ArtifactManifest, Compiler, ExportedSymbols, Mode, Platform,
                             get_artifact_logging_level_code)
-from praline.common.compiling.compiler import ICompiler, CompilerInstantionError, ICompilerSupplier, IYieldDescriptor
+from praline.common.compiling.compiler import (ICompiler, CompilerInstantionError, ICompilerSupplier, IYieldDescriptor,
+                                               parse_show_includes)
 from praline.common.file_system import FileSystem, join
+from praline.common.hashing import hash_binary
 from typing import List
 
 import logging
@@ -56,6 +58,7 @@ class MsvcCompiler(ICompiler):
         self.artifact_manifest = artifact_manifest
         self.environment_file  = get_environment_file(artifact_manifest.architecture)
         self.machine           = get_msvc_machine(artifact_manifest.architecture)
+        self.fingerprint       = None
         logging_level_code     = get_artifact_logging_level_code(artifact_manifest.artifact_logging_level)
         
         self.compiler_flags  = ['/analyze-', '/permissive-', '/GS', '/Gd', '/FC', '/sdl', '/fp:precise',
@@ -97,11 +100,19 @@ class MsvcCompiler(ICompiler):
     def get_yield_descriptor(self) -> IYieldDescriptor:
         return MsvcYieldDescriptor()
 
+    def get_fingerprint(self) -> str:
+        if self.fingerprint == None:
+            _, _, banner     = self.file_system.execute([self.environment_file, '>nul', '2>&1', '&&', 'cl'])
+            identity         = [self.environment_file, self.file_system.which('cl'), self.machine] + self.compiler_flags
+            self.fingerprint = hash_binary(banner + ' '.join(identity).encode())
+        return self.fingerprint
+
     def preprocess(self,
                    headers_root: str,
                    external_headers_root: str,
                    headers: List[str],
-                   source: str) -> bytes:
+                   source: str,
+                   directives_only: bool = False) -> bytes:
         status, stdout, stderror = self.file_system.execute([self.environment_file, '>nul', '2>&1', '&&',
                                                              'cl', '/EP', source] + self.compiler_flags +
                                                             ['/I', headers_root, '/I', external_headers_root])
@@ -115,15 +126,16 @@ class MsvcCompiler(ICompiler):
                 external_headers_root: str,
                 headers: List[str],
                 source: str,
-                object_: str) -> None:
+                object_: str) -> List[str]:
         status, stdout, stderror = self.file_system.execute([self.environment_file, '>nul', '2>&1', '&&', 
-                                                             'cl', f'/Fo{object_}', '/c', source] + 
+                                                             'cl', f'/Fo{object_}', '/c', '/showIncludes', source] + 
                                                             self.compiler_flags +
                                                             ['/I', headers_root, '/I', external_headers_root])
         if status != 0:
             logger.info(stdout.decode())
             logger.error(stderror.decode())
             raise RuntimeError(f"command exited with return code {status}")
+        return parse_show_includes(stdout.decode())
 
     def link_executable(self,
                         external_libraries_root: str,
@@ -0,0 +1,85 @@
+from praline.common.file_system import FileSystem, basename, directory_name, join
+from praline.common.tracing import trace
+
+import json
+from logging import getLogger
+from typing import Any, Tuple
+from uuid import uuid4
+
+
+logger = getLogger(__name__)
+
+
+metadata_suffix = '.metadata'
+
+
+class ObjectCache:
+    def __init__(self, file_system: FileSystem, directory: str, size_limit: int):
+        if size_limit <= 0:
+            raise ValueError("object cache size limit must be greater than 0")
+
+        self.file_system = file_system
+        self.directory   = directory
+        self.size_limit  = size_limit
+
+    def __repr__(self) -> str:
+        return f'ObjectCache({self.directory})'
+
+    def get_entry(self, key: str) -> str:
+        return join(self.directory, key[:2], key)
+
+    def fetch(self, key: str, object_: str) -> Tuple[bool, Any]:
+        entry = self.get_entry(key)
+        try:
+            with self.file_system.open_file(entry + metadata_suffix, 'rb') as f:
+                metadata = json.loads(f.read().decode())
+            self.file_system.remove_file_if_it_exists(object_)
+            self.file_system.link_or_copy_file(entry, object_)
+            self.file_system.touch(entry)
+        except FileNotFoundError:
+            return (False, None)
+        except ValueError:
+            logger.warning(f"ignoring object cache entry {key} with unreadable metadata")
+            return (False, None)
+        logger.debug(f"object cache hit for '{object_}' with key {key}")
+        return (True, metadata)
+
+    def get_temporary(self, key: str) -> str:
+        entry = self.get_entry(key)
+        self.file_system.create_directory_if_missing(directory_name(entry))
+        return f'{entry}.{uuid4().hex}'
+
+    def commit(self, key: str, object_temporary: str, metadata_temporary: str) -> None:
+        entry = self.get_entry(key)
+        self.file_system.rename(object_temporary, entry)
+        self.file_system.rename(metadata_temporary, entry + metadata_suffix)
+
+    def store(self, key: str, object_: str, metadata: Any = None) -> None:
+        object_temporary   = self.get_temporary(key)
+        metadata_temporary = self.get_temporary(key)
+        self.file_system.copy_file(object_, object_temporary)
+        with self.file_system.open_file(metadata_temporary, 'wb') as f:
+            f.write(json.dumps(metadata).encode())
+        self.commit(key, object_temporary, metadata_temporary)
+
+    @trace
+    def evict(self) -> None:
+        if not self.file_system.exists(self.directory):
+            return
+        entries = []
+        total   = 0
+        for path in self.file_system.files_in_directory(self.directory):
+            if '.' in basename(path):
+                continue
+            try:
+                size = self.file_system.get_size(path)
+                entries.append((self.file_system.get_modification_time(path), size, path))
+                total += size
+            except FileNotFoundError:
+                pass
+        for _, size, path in sorted(entries):
+            if total <= self.size_limit:
+                break
+            self.file_system.remove_file_if_it_exists(path + metadata_suffix)
+            self.file_system.remove_file_if_it_exists(path)
+            total -= size
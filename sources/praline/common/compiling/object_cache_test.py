@@ -0,0 +1,115 @@
+from praline.common.compiling.object_cache import ObjectCache
+from praline.common.testing.file_system_mock import FileSystemMock
+
+from os.path import join, normpath
+from unittest import TestCase
+
+
+class ObjectCacheTest(TestCase):
+    def test_store_and_fetch(self):
+        file_system = FileSystemMock(
+            directories={
+                'cache',
+                'target/objects'
+            },
+            files={
+                'target/objects/a.o': b'object-a.'
+            }
+        )
+
+        object_cache = ObjectCache(file_system, 'cache', size_limit=1024)
+
+        object_cache.store('abcd', 'target/objects/a.o', ['sources/a.hpp'])
+
+        file_system.remove_file('target/objects/a.o')
+
+        hit, metadata = object_cache.fetch('abcd', 'target/objects/a.o')
+
+        self.assertTrue(hit)
+
+        self.assertEqual(metadata, ['sources/a.hpp'])
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.o')], b'object-a.')
+
+        self.assertEqual(file_system.files[normpath(join('cache', 'ab', 'abcd'))], b'object-a.')
+
+    def test_fetch_with_missing_entry(self):
+        file_system = FileSystemMock(
+            directories={
+                'cache',
+                'target/objects'
+            },
+            files={
+                'target/objects/a.o': b'stale-object-a.'
+            }
+        )
+
+        object_cache = ObjectCache(file_system, 'cache', size_limit=1024)
+
+        hit, metadata = object_cache.fetch('abcd', 'target/objects/a.o')
+
+        self.assertFalse(hit)
+
+        self.assertIsNone(metadata)
+
+        self.assertEqual(file_system.files[normpath('target/objects/a.o')], b'stale-object-a.')
+
+    def test_evict_least_recently_used(self):
+        file_system = FileSystemMock(
+            directories={
+                'cache',
+                'target/objects'
+            },
+            files={
+                'target/objects/a.o': b'aaaa',
+                'target/objects/b.o': b'bbbb',
+                'target/objects/c.o': b'cccc'
+            }
+        )
+
+        object_cache = ObjectCache(file_system, 'cache', size_limit=8)
+
+        object_cache.store('aa00', 'target/objects/a.o')
+        object_cache.store('bb00', 'target/objects/b.o')
+        object_cache.store('cc00', 'target/objects/c.o')
+
+        file_system.touch(join('cache', 'aa', 'aa00'))
+        file_system.touch(join('cache', 'bb', 'bb00'))
+        file_system.touch(join('cache', 'cc', 'cc00'))
+
+        object_cache.fetch('aa00', 'target/objects/a.o')
+
+        object_cache.evict()
+
+        self.assertTrue(file_system.exists(join('cache', 'aa', 'aa00')))
+
+        self.assertFalse(file_system.exists(join('cache', 'bb', 'bb00')))
+
+        self.assertFalse(file_system.exists(join('cache', 'bb', 'bb00.metadata')))
+
+        self.assertTrue(file_system.exists(join('cache', 'cc', 'cc00')))
+
+    def test_evict_ignores_temporaries(self):
+        file_system = FileSystemMock(
+            directories={
+                'cache/aa',
+                'target/objects'
+            },
+            files={
+                'target/objects/a.o': b'aaaa',
+                'cache/aa/aa11.0123456789abcdef0123456789abcdef': b'in-flight-object'
+            }
+        )
+
+        object_cache = ObjectCache(file_system, 'cache', size_limit=8)
+
+        object_cache.store('aa00', 'target/objects/a.o')
+
+        object_cache.evict()
+
+        self.assertTrue(file_system.exists(join('cache', 'aa', 'aa00')))
+
+        self.assertTrue(file_system.exists(join('cache', 'aa', 'aa11.0123456789abcdef0123456789abcdef')))
+
+    def test_invalid_size_limit(self):
+        self.assertRaises(ValueError, ObjectCache, FileSystemMock(), 'cache', 0)
@@ -0,0 +1,97 @@
+from praline.common.file_system import FileSystem, directory_name, get_separator, join, normalized_path, relative_path
+
+from os.path import pardir
+from typing import Dict, List, Set
+
+import re
+
+
+directive_pattern = re.compile(r'^\s*#\s*(?P<directive>\w+)\s*(?P<argument>.*?)\s*$')
+
+include_pattern = re.compile(r'^(?P<include>"[^"]+"|<[^>]+>)')
+
+
+def parse_includes(contents: str) -> List[str]:
+    includes   = []
+    directives = []
+    depth      = 0
+    base_depth = 0
+    for line in contents.splitlines():
+        match = directive_pattern.match(line)
+        if not match:
+            continue
+        directive = match['directive']
+        argument  = match['argument']
+        directives.append((directive, argument))
+        if len(directives) == 2 and directives[0] == ('ifndef', argument) and directive == 'define':
+            base_depth = 1
+        if directive in ['if', 'ifdef', 'ifndef']:
+            depth += 1
+        elif directive == 'endif':
+            depth -= 1
+        elif directive == 'include' and depth == base_depth:
+            include = include_pattern.match(argument)
+            if include:
+                includes.append(include['include'])
+    return includes
+
+
+def collect_includes(file_system: FileSystem, include_roots: List[str], sources: List[str]) -> Dict[str, Set[str]]:
+    parsed = {}
+
+    def get_includes(path: str) -> List[str]:
+        if path not in parsed:
+            with file_system.open_file(path, 'rb') as f:
+                parsed[path] = parse_includes(f.read().decode(errors='replace'))
+        return parsed[path]
+
+    def resolve(include: str, includer: str) -> str:
+        name  = include[1:-1]
+        roots = ([directory_name(includer)] if include.startswith('"') else []) + include_roots
+        for root in roots:
+            path = normalized_path(join(root, name))
+            if file_system.is_file(path):
+                return path
+        return None
+
+    def spell(include: str, path: str) -> str:
+        if path == None:
+            return include
+        for root in include_roots:
+            spelling = relative_path(path, root)
+            if spelling.split(get_separator())[0] != pardir:
+                return f'"{spelling.replace(get_separator(), "/")}"'
+        return None
+
+    collected = {}
+    for source in sources:
+        reached = set()
+        visited = set()
+        pending = [normalized_path(source)]
+        while pending:
+            includer = pending.pop()
+            for include in get_includes(includer):
+                path     = resolve(include, includer)
+                spelling = spell(include, path)
+                if spelling:
+                    reached.add(spelling)
+                if path and path not in visited:
+                    visited.add(path)
+                    pending.append(path)
+        collected[source] = reached
+    return collected
+
+
+def select_precompiled_includes(includes: Dict[str, Set[str]], minimum_ratio: float = 0.5) -> List[str]:
+    counts = {}
+    for reached in includes.values():
+        for spelling in reached:
+            counts[spelling] = counts.get(spelling, 0) + 1
+
+    threshold = max(2, minimum_ratio * len(includes))
+    selected  = [spelling for spelling, count in counts.items() if count >= threshold]
+    return sorted(selected, key=lambda spelling: (spelling.startswith('"'), spelling))
+
+
+def format_precompiled_header(includes: List[str]) -> str:
+    return ''.join(f'#include {include}\n' for include in includes)
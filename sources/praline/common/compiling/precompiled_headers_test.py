@@ -0,0 +1,64 @@
+from praline.common.compiling.precompiled_headers import (collect_includes, format_precompiled_header, parse_includes,
+                                                          select_precompiled_includes)
+from praline.common.testing.file_system_mock import FileSystemMock
+
+from unittest import TestCase
+
+
+class PrecompiledHeadersTest(TestCase):
+    def test_parse_includes(self):
+        contents = ('#ifndef ORG_ART_A_HPP\n'
+                    '#define ORG_ART_A_HPP\n'
+                    '#include <vector>\n'
+                    '  #  include "org/art/b.hpp" // comment\n'
+                    '#ifdef _WIN32\n'
+                    '#include <windows.h>\n'
+                    '#endif\n'
+                    '#include MACRO_HEADER\n'
+                    '#endif\n')
+
+        self.assertEqual(parse_includes(contents), ['<vector>', '"org/art/b.hpp"'])
+
+    def test_parse_includes_without_include_guard(self):
+        contents = ('#pragma once\n'
+                    '#include <map>\n'
+                    '#if defined(DEBUG)\n'
+                    '#include <cassert>\n'
+                    '#endif\n'
+                    '#include <string>\n')
+
+        self.assertEqual(parse_includes(contents), ['<map>', '<string>'])
+
+    def test_select_precompiled_includes(self):
+        file_system = FileSystemMock(
+            directories={'sources/org/art', 'external/headers/org/dep'},
+            files={
+                'sources/org/art/a.hpp': b'#pragma once\n#include <vector>\n#include "org/dep/d.hpp"\n',
+                'sources/org/art/a.cpp': b'#include "a.hpp"\n#include <map>\n',
+                'sources/org/art/b.cpp': b'#include "org/art/a.hpp"\n#include <string>\n',
+                'sources/org/art/c.cpp': b'#include <vector>\n#include <string>\n',
+                'sources/org/art/e.cpp': b'#include <regex>\n',
+                'external/headers/org/dep/d.hpp': b'#pragma once\n#include <memory>\n#include "d.hpp"\n'
+            }
+        )
+
+        includes = collect_includes(file_system, 
+                                    ['sources', 'external/headers'],
+                                    ['sources/org/art/a.cpp',
+                                     'sources/org/art/b.cpp',
+                                     'sources/org/art/c.cpp',
+                                     'sources/org/art/e.cpp'])
+
+        self.assertEqual(includes, {
+            'sources/org/art/a.cpp': {'"org/art/a.hpp"', '<vector>', '"org/dep/d.hpp"', '<memory>', '<map>'},
+            'sources/org/art/b.cpp': {'"org/art/a.hpp"', '<vector>', '"org/dep/d.hpp"', '<memory>', '<string>'},
+            'sources/org/art/c.cpp': {'<vector>', '<string>'},
+            'sources/org/art/e.cpp': {'<regex>'}
+        })
+
+        self.assertEqual(select_precompiled_includes(includes),
+                         ['<memory>', '<string>', '<vector>', '"org/art/a.hpp"', '"org/dep/d.hpp"'])
+
+    def test_format_precompiled_header(self):
+        self.assertEqual(format_precompiled_header(['<vector>', '"org/art/a.hpp"']),
+                         '#include <vector>\n#include "org/art/a.hpp"\n')
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import json
+import re
+
+
+time_report_pattern = re.compile(r'^\s*\|?(?P<name>[^:]+?)\s*:\s*[\d.]+\s*\(\s*\d+%\)\s*[\d.]+\s*\(\s*\d+%\)\s*'
+                                 r'(?P<wall>[\d.]+)\s*\(\s*\d+%\)')
+
+
+@dataclass(frozen=True)
+class CompilationProfile:
+    source: str
+    wall_time: float
+    peak_memory: int
+    phases: Dict[str, float]
+    headers: Dict[str, float]
+    instantiations: Dict[str, float]
+
+
+def parse_time_report(output: str) -> Dict[str, float]:
+    phases = {}
+    for line in output.splitlines():
+        match = time_report_pattern.match(line)
+        if match and match['name'] != 'TOTAL':
+            phases[match['name']] = phases.get(match['name'], 0.0) + float(match['wall'])
+    return phases
+
+
+def parse_time_trace(contents: str) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, float]]:
+    phases         = {}
+    headers        = {}
+    instantiations = {}
+    for event in json.loads(contents).get('traceEvents', []):
+        if event.get('ph') != 'X':
+            continue
+        name     = event.get('name', '')
+        duration = event.get('dur', 0) / 1e6
+        detail   = event.get('args', {}).get('detail')
+        if name.startswith('Total '):
+            phases[name[len('Total '):]] = duration
+        elif name == 'Source' and detail:
+            headers[detail] = headers.get(detail, 0.0) + duration
+        elif name in ['InstantiateClass', 'InstantiateFunction'] and detail:
+            instantiations[detail] = instantiations.get(detail, 0.0) + duration
+    return (phases, headers, instantiations)
+
+
+def save_compilation_profile(profile: CompilationProfile) -> str:
+    return json.dumps(vars(profile), indent=2)
+
+
+def load_compilation_profile(contents: str) -> CompilationProfile:
+    return CompilationProfile(**json.loads(contents))
+
+
+def format_compilation_report(profiles: List[CompilationProfile], limit: int = 20) -> str:
+    def summed(attribute: str) -> List[Tuple[str, float, int]]:
+        totals = {}
+        for profile in profiles:
+            for name, duration in getattr(profile, attribute).items():
+                total, count = totals.get(name, (0.0, 0))
+                totals[name] = (total + duration, count + 1)
+        return sorted(((n, t, c) for n, (t, c) in totals.items()), key=lambda e: (-e[1], e[0]))[:limit]
+
+    def memory(peak_memory: int) -> str:
+        return f'{peak_memory / 1024:.1f} MiB' if peak_memory != None else 'unknown'
+
+    lines = [f"Compilation profile of {len(profiles)} translation units, "
+             f"{sum(p.wall_time for p in profiles):.2f}s of compilation in total", '']
+
+    lines.append("Slowest translation units")
+    for profile in sorted(profiles, key=lambda p: (-p.wall_time, p.source))[:limit]:
+        lines.append(f"  {profile.wall_time:9.2f}s  {memory(profile.peak_memory):>12}  {profile.source}")
+    lines.append('')
+
+    lines.append("Most expensive headers (inclusive parse time summed over translation units)")
+    headers = summed('headers')
+    if not headers:
+        lines.append("  not reported by this compiler")
+    for name, total, count in headers:
+        lines.append(f"  {total:9.2f}s  {count:6} includes  {name}")
+    lines.append('')
+
+    lines.append("Template instantiation hot spots")
+    instantiations = summed('instantiations')
+    if instantiations:
+        for name, total, count in instantiations:
+            lines.append(f"  {total:9.2f}s  {count:6} units  {name}")
+    else:
+        ranked = [p for p in profiles if p.phases.get('template instantiation')]
+        if not ranked:
+            lines.append("  not reported by this compiler")
+        for profile in sorted(ranked, key=lambda p: (-p.phases['template instantiation'], p.source))[:limit]:
+            lines.append(f"  {profile.phases['template instantiation']:9.2f}s  {profile.source}")
+    lines.append('')
+
+    lines.append("Compiler phases (summed over translation units)")
+    phases = summed('phases')
+    if not phases:
+        lines.append("  not reported by this compiler")
+    for name, total, _ in phases:
+        lines.append(f"  {total:9.2f}s  {name}")
+
+    return '\n'.join(lines) + '\n'
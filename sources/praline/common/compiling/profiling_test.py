@@ -0,0 +1,83 @@
+from praline.common.compiling.profiling import (CompilationProfile, format_compilation_report, load_compilation_profile,
+                                                parse_time_report, parse_time_trace, save_compilation_profile)
+
+from unittest import TestCase
+
+import json
+
+
+class ProfilingTest(TestCase):
+    def test_parse_time_report(self):
+        output = ('sources/a.cpp:3:5: warning: unused variable\n'
+                  'Time variable                                   usr           sys          wall           GGC\n'
+                  ' phase parsing                      :   0.96 ( 24%)   0.51 ( 44%)   1.52 ( 29%)    77M ( 34%)\n'
+                  ' |name lookup                       :   0.27 (  7%)   0.07 (  6%)   0.38 (  7%)  5094k (  2%)\n'
+                  ' template instantiation             :   0.89 ( 22%)   0.33 ( 28%)   1.22 ( 23%)    66M ( 29%)\n'
+                  ' TOTAL                              :   3.56          0.99          4.61          227M\n')
+
+        self.assertEqual(parse_time_report(output), {
+            'phase parsing': 1.52,
+            'name lookup': 0.38,
+            'template instantiation': 1.22
+        })
+
+    def test_parse_time_trace(self):
+        contents = json.dumps({
+            'traceEvents': [
+                {'ph': 'X', 'name': 'Source', 'dur': 250000, 'args': {'detail': 'sources/a.hpp'}},
+                {'ph': 'X', 'name': 'Source', 'dur': 500000, 'args': {'detail': '/usr/include/c++/regex'}},
+                {'ph': 'X', 'name': 'Source', 'dur': 100000, 'args': {'detail': 'sources/a.hpp'}},
+                {'ph': 'X', 'name': 'InstantiateClass', 'dur': 300000, 'args': {'detail': 'std::vector<int>'}},
+                {'ph': 'X', 'name': 'InstantiateFunction', 'dur': 200000, 'args': {'detail': 'std::sort<int *>'}},
+                {'ph': 'X', 'name': 'Total Frontend', 'dur': 2000000},
+                {'ph': 'M', 'name': 'process_name', 'args': {'name': 'clang'}}
+            ]
+        })
+
+        phases, headers, instantiations = parse_time_trace(contents)
+
+        self.assertEqual(phases, {'Frontend': 2.0})
+
+        self.assertEqual(headers, {'sources/a.hpp': 0.35, '/usr/include/c++/regex': 0.5})
+
+        self.assertEqual(instantiations, {'std::vector<int>': 0.3, 'std::sort<int *>': 0.2})
+
+    def test_compilation_profile_round_trip(self):
+        profile = CompilationProfile('sources/a.cpp', 1.5, 2048, {'phase parsing': 1.0}, {}, {'std::vector<int>': 0.3})
+
+        self.assertEqual(load_compilation_profile(save_compilation_profile(profile)), profile)
+
+    def test_format_compilation_report(self):
+        profiles = [
+            CompilationProfile('sources/a.cpp', 1.5, 2048, {'Frontend': 1.0}, {'sources/a.hpp': 0.5},
+                               {'std::vector<int>': 0.3}),
+            CompilationProfile('sources/b.cpp', 4.0, None, {'Frontend': 3.0}, {'sources/a.hpp': 0.25},
+                               {'std::vector<int>': 0.1, 'std::map<int, int>': 0.7})
+        ]
+
+        report = format_compilation_report(profiles).splitlines()
+
+        self.assertEqual(report[0], "Compilation profile of 2 translation units, 5.50s of compilation in total")
+
+        self.assertEqual(report[3:5], ["       4.00s       unknown  sources/b.cpp",
+                                       "       1.50s       2.0 MiB  sources/a.cpp"])
+
+        self.assertEqual(report[7], "       0.75s       2 includes  sources/a.hpp")
+
+        self.assertEqual(report[10:12], ["       0.70s       1 units  std::map<int, int>",
+                                         "       0.40s       2 units  std::vector<int>"])
+
+        self.assertEqual(report[14], "       4.00s  Frontend")
+
+    def test_format_compilation_report_with_template_instantiation_phase(self):
+        profiles = [
+            CompilationProfile('sources/a.cpp', 1.5, 2048, {'template instantiation': 0.5}, {}, {}),
+            CompilationProfile('sources/b.cpp', 1.0, 1024, {'template instantiation': 0.75}, {}, {})
+        ]
+
+        report = format_compilation_report(profiles).splitlines()
+
+        self.assertEqual(report[7], "  not reported by this compiler")
+
+        self.assertEqual(report[10:12], ["       0.75s  sources/b.cpp",
+                                         "       0.50s  sources/a.cpp"])
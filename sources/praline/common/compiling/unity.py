@@ -0,0 +1,83 @@
+from praline.common.file_system import FileSystem, basename, get_separator, join, normalized_path, relative_path
+
+from typing import Dict, List
+
+import re
+
+
+unity_include_pattern = re.compile(r'^#include "(?P<path>[^"]+)"$')
+
+
+def get_unity_source(unity_root: str, name: str, index: int) -> str:
+    return join(unity_root, f'unity-{name}-{index}.cpp')
+
+
+def parse_unity_source(unity_root: str, contents: str) -> List[str]:
+    sources = []
+    for line in contents.splitlines():
+        match = unity_include_pattern.match(line)
+        if match:
+            sources.append(normalized_path(join(unity_root, match['path'])))
+    return sources
+
+
+def format_unity_source(unity_root: str, sources: List[str]) -> str:
+    return ''.join(f'#include "{relative_path(s, unity_root).replace(get_separator(), "/")}"\n' for s in sources)
+
+
+def assign_unity_batches(previous: Dict[int, List[str]], sources: List[str], batch_size: int) -> Dict[int, List[str]]:
+    remaining = {normalized_path(source) for source in sources}
+    batches   = {}
+    for index, batch in sorted(previous.items()):
+        kept = [source for source in batch if source in remaining][:batch_size]
+        remaining.difference_update(kept)
+        if kept:
+            batches[index] = kept
+
+    for source in sorted(remaining):
+        open_batches = [index for index, batch in batches.items() if len(batch) < batch_size]
+        if open_batches:
+            index = min(open_batches, key=lambda i: (len(batches[i]), i))
+        else:
+            index = next(i for i in range(len(batches) + 1) if i not in batches)
+            batches[index] = []
+        batches[index].append(source)
+    return batches
+
+
+def update_unity_sources(file_system: FileSystem,
+                         unity_root: str,
+                         name: str,
+                         sources: List[str],
+                         batch_size: int) -> List[str]:
+    if batch_size <= 0:
+        raise ValueError("unity batch size must be greater than 0")
+
+    pattern  = re.compile(rf'^unity-{re.escape(name)}-(?P<index>\d+)\.cpp$')
+    existing = {}
+    previous = {}
+    if file_system.exists(unity_root):
+        for path in file_system.files_in_directory(unity_root):
+            match = pattern.match(basename(path))
+            if match:
+                existing[int(match['index'])] = path
+                with file_system.open_file(path, 'rb') as f:
+                    previous[int(match['index'])] = parse_unity_source(unity_root, f.read().decode())
+
+    batches = assign_unity_batches(previous, sources, batch_size)
+
+    file_system.create_directory_if_missing(unity_root)
+    unity_sources = []
+    for index, batch in sorted(batches.items()):
+        unity_source = get_unity_source(unity_root, name, index)
+        if previous.get(index) != batch:
+            file_system.remove_file_if_it_exists(unity_source)
+            with file_system.open_file(unity_source, 'wb') as f:
+                f.write(format_unity_source(unity_root, batch).encode())
+        unity_sources.append(unity_source)
+
+    for index, path in existing.items():
+        if index not in batches:
+            file_system.remove_file(path)
+
+    return unity_sources
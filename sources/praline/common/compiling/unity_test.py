@@ -0,0 +1,67 @@
+from praline.common.compiling.unity import assign_unity_batches, update_unity_sources
+from praline.common.testing.file_system_mock import FileSystemMock
+
+from os.path import normpath
+from unittest import TestCase
+
+
+class UnityTest(TestCase):
+    def test_assign_unity_batches(self):
+        batches = assign_unity_batches({}, ['e.cpp', 'a.cpp', 'c.cpp', 'b.cpp', 'd.cpp'], 2)
+
+        self.assertEqual(batches, {0: ['a.cpp', 'b.cpp'], 1: ['c.cpp', 'd.cpp'], 2: ['e.cpp']})
+
+    def test_assign_unity_batches_keeps_membership(self):
+        previous = {0: ['a.cpp', 'd.cpp'], 1: ['b.cpp', 'e.cpp'], 2: ['c.cpp']}
+
+        batches = assign_unity_batches(previous, ['a.cpp', 'b.cpp', 'c.cpp', 'e.cpp', 'f.cpp', 'g.cpp'], 2)
+
+        self.assertEqual(batches, {0: ['a.cpp', 'f.cpp'], 1: ['b.cpp', 'e.cpp'], 2: ['c.cpp', 'g.cpp']})
+
+        batches = assign_unity_batches(previous, ['b.cpp', 'e.cpp'], 2)
+
+        self.assertEqual(batches, {1: ['b.cpp', 'e.cpp']})
+
+    def test_assign_unity_batches_with_smaller_batch_size(self):
+        batches = assign_unity_batches({0: ['a.cpp', 'b.cpp', 'c.cpp']}, ['a.cpp', 'b.cpp', 'c.cpp'], 2)
+
+        self.assertEqual(batches, {0: ['a.cpp', 'b.cpp'], 1: ['c.cpp']})
+
+    def test_update_unity_sources(self):
+        file_system = FileSystemMock(
+            directories={'project/sources/org/art', 'project/target'},
+            files={
+                'project/sources/org/art/a.cpp': b'',
+                'project/sources/org/art/b.cpp': b'',
+                'project/sources/org/art/c.cpp': b''
+            }
+        )
+
+        unity_root = normpath('project/target/unity')
+        sources    = [normpath(f'project/sources/org/art/{name}.cpp') for name in ['a', 'b', 'c']]
+
+        unity_sources = update_unity_sources(file_system, unity_root, 'main', sources, 2)
+
+        self.assertEqual(unity_sources, [normpath('project/target/unity/unity-main-0.cpp'),
+                                         normpath('project/target/unity/unity-main-1.cpp')])
+
+        self.assertEqual(file_system.files[unity_sources[0]], b'#include "../../sources/org/art/a.cpp"\n'
+                                                              b'#include "../../sources/org/art/b.cpp"\n')
+
+        self.assertEqual(file_system.files[unity_sources[1]], b'#include "../../sources/org/art/c.cpp"\n')
+
+        unity_sources = update_unity_sources(file_system, unity_root, 'main', sources[1:], 2)
+
+        self.assertEqual(unity_sources, [normpath('project/target/unity/unity-main-0.cpp'),
+                                         normpath('project/target/unity/unity-main-1.cpp')])
+
+        self.assertEqual(file_system.files[unity_sources[0]], b'#include "../../sources/org/art/b.cpp"\n')
+
+        unity_sources = update_unity_sources(file_system, unity_root, 'main', sources[2:], 2)
+
+        self.assertEqual(unity_sources, [normpath('project/target/unity/unity-main-1.cpp')])
+
+        self.assertNotIn(normpath('project/target/unity/unity-main-0.cpp'), file_system.files)
+
+    def test_update_unity_sources_with_invalid_batch_size(self):
+        self.assertRaises(ValueError, update_unity_sources, FileSystemMock(), 'unity', 'main', [], 0)
@@ -0,0 +1,123 @@
+from praline.common import ArtifactManifest
+
+from logging import getLogger
+from threading import Lock
+from typing import Callable, List, Tuple
+
+import json
+import socket
+import time
+
+
+logger = getLogger(__name__)
+
+
+accepted_reply = b'\x01'
+
+
+busy_reply = b'\x00'
+
+
+succeeded_reply = b'\x01'
+
+
+failed_reply = b'\x00'
+
+
+def parse_worker_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(':')
+    if not host or not port.isdigit():
+        raise ValueError(f"invalid compile worker address '{address}' -- expected host:port")
+    return (host, int(port))
+
+
+def receive_all(connection: socket.socket) -> bytes:
+    chunks = []
+    while chunk := connection.recv(65536):
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+class CompileWorkerPool:
+    def __init__(self,
+                 addresses: List[str],
+                 artifact_manifest: ArtifactManifest,
+                 connection_timeout: float = 1.0,
+                 timeout: float = 600.0,
+                 retry_delay: float = 30.0):
+        self.addresses          = [parse_worker_address(address) for address in addresses]
+        self.connection_timeout = connection_timeout
+        self.timeout            = timeout
+        self.retry_delay        = retry_delay
+        self.unavailable_until  = {}
+        self.next               = 0
+        self.lock               = Lock()
+        self.header             = {
+            'compiler'              : artifact_manifest.compiler,
+            'mode'                  : artifact_manifest.mode,
+            'architecture'          : artifact_manifest.architecture,
+            'platform'              : artifact_manifest.platform,
+            'exported_symbols'      : artifact_manifest.exported_symbols,
+            'artifact_logging_level': artifact_manifest.artifact_logging_level,
+            'split_dwarf'           : False,
+            'link_time_optimization': False
+        }
+
+    def __repr__(self) -> str:
+        return f'CompileWorkerPool({self.addresses})'
+
+    def enable_split_dwarf(self) -> None:
+        self.header['split_dwarf'] = True
+
+    def enable_link_time_optimization(self) -> None:
+        self.header['link_time_optimization'] = True
+
+    def reserve(self) -> socket.socket:
+        with self.lock:
+            start     = self.next
+            self.next = (self.next + 1) % max(len(self.addresses), 1)
+
+        for index in range(len(self.addresses)):
+            address = self.addresses[(start + index) % len(self.addresses)]
+            if self.unavailable_until.get(address, 0) > time.monotonic():
+                continue
+            try:
+                connection = socket.create_connection(address, timeout=self.connection_timeout)
+            except OSError as exception:
+                logger.warning(f"compile worker {address} is unavailable -- {exception}")
+                self.unavailable_until[address] = time.monotonic() + self.retry_delay
+                continue
+            try:
+                reply = connection.recv(1)
+            except OSError:
+                reply = None
+            if reply == accepted_reply:
+                connection.settimeout(self.timeout)
+                return connection
+            connection.close()
+        return None
+
+    def compile(self, fingerprint: str, preprocess: Callable[[], bytes]) -> bytes:
+        connection = self.reserve()
+        if connection == None:
+            return None
+
+        with connection:
+            address      = connection.getpeername()
+            preprocessed = preprocess()
+            if preprocessed == None:
+                return None
+            header = json.dumps({**self.header, 'fingerprint': fingerprint}).encode()
+            try:
+                connection.sendall(header + b'\n' + preprocessed)
+                connection.shutdown(socket.SHUT_WR)
+                response = receive_all(connection)
+            except OSError as exception:
+                logger.warning(f"compile worker {address} dropped the connection -- {exception}")
+                return None
+
+        if response[:1] != succeeded_reply:
+            logger.warning(f"compile worker {address} failed -- {response[1:].decode(errors='replace')}")
+            return None
+        return response[1:]
+
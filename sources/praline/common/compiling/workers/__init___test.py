@@ -0,0 +1,177 @@
+from praline.common import (Architecture, ArtifactLoggingLevel, ArtifactManifest, ArtifactType, Compiler,
+                            ExportedSymbols, Mode, Platform)
+from praline.common.compiling.workers import CompileWorkerPool, parse_worker_address
+from praline.common.compiling.workers.server import CompileServer, CompileWorker
+from praline.common.testing.file_system_mock import FileSystemMock
+
+from threading import Thread
+from typing import List, Tuple
+from unittest import TestCase
+
+import socket
+
+
+class CompilerStub:
+    def __init__(self, file_system: FileSystemMock, fingerprint: str, distribution: bool):
+        self.file_system  = file_system
+        self.fingerprint  = fingerprint
+        self.distribution = distribution
+        self.split_dwarf  = False
+        self.compiled     = 0
+
+    def get_fingerprint(self) -> str:
+        return self.fingerprint
+
+    def supports_distribution(self) -> bool:
+        return self.distribution
+
+    def enable_split_dwarf(self) -> None:
+        self.split_dwarf = True
+        self.fingerprint += ' -gsplit-dwarf'
+
+    def get_side_outputs(self, object_: str) -> List[str]:
+        return [object_[:-len('.o')] + '.dwo'] if self.split_dwarf else []
+
+    def enable_link_time_optimization(self) -> None:
+        self.fingerprint += ' -flto=auto'
+
+    def compile_preprocessed(self, preprocessed_source: str, object_: str) -> None:
+        with self.file_system.open_file(preprocessed_source, 'rb') as f:
+            preprocessed = f.read()
+        with self.file_system.open_file(object_, 'wb') as f:
+            f.write(b'object:' + preprocessed)
+        self.compiled += 1
+
+
+class CompileWorkersTest(TestCase):
+    def setUp(self):
+        self.artifact_manifest = ArtifactManifest(organization='org',
+                                                  artifact='art',
+                                                  version=None,
+                                                  mode=Mode.release,
+                                                  architecture=Architecture.x64,
+                                                  platform=Platform.linux,
+                                                  compiler=Compiler.gcc,
+                                                  exported_symbols=ExportedSymbols.explicit,
+                                                  artifact_type=ArtifactType.library,
+                                                  artifact_logging_level=ArtifactLoggingLevel.info,
+                                                  dependencies=[])
+        self.servers = []
+
+    def tearDown(self):
+        for server, thread in self.servers:
+            server.shutdown()
+            thread.join()
+            server.server_close()
+
+    def start_worker(self, 
+                     jobs: int = 2, 
+                     fingerprint: str = 'stub', 
+                     distribution: bool = True) -> Tuple[CompileWorker, List[CompilerStub]]:
+        file_system = FileSystemMock(directories={'worker'})
+        compilers   = []
+
+        def instantiate_compiler(manifest: ArtifactManifest) -> CompilerStub:
+            self.assertEqual(manifest.mode, Mode.release)
+            self.assertEqual(manifest.compiler, Compiler.gcc)
+            compilers.append(CompilerStub(file_system, fingerprint, distribution))
+            return compilers[-1]
+
+        worker = CompileWorker(file_system, 'worker', jobs, instantiate_compiler)
+        server = CompileServer('127.0.0.1', 0, worker)
+        thread = Thread(target=server.serve_forever, args=(0.05,))
+        thread.start()
+        self.servers.append((server, thread))
+        return (worker, compilers)
+
+    def get_address(self, index: int) -> str:
+        host, port = self.servers[index][0].server_address
+        return f'{host}:{port}'
+
+    def get_unused_address(self) -> str:
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            return f'127.0.0.1:{s.getsockname()[1]}'
+
+    def test_parse_worker_address(self):
+        self.assertEqual(parse_worker_address('build-node-1:5052'), ('build-node-1', 5052))
+
+        self.assertRaises(ValueError, parse_worker_address, 'build-node-1')
+
+    def test_compile_on_several_workers(self):
+        workers = [self.start_worker(), self.start_worker()]
+        pool    = CompileWorkerPool([self.get_address(0), self.get_address(1)], self.artifact_manifest)
+
+        objects = [pool.compile('stub', lambda: f'source {i}'.encode()) for i in range(4)]
+
+        self.assertEqual(objects, [f'object:source {i}'.encode() for i in range(4)])
+
+        self.assertEqual([compilers[0].compiled for _, compilers in workers], [2, 2])
+
+        self.assertEqual([worker.file_system.files for worker, _ in workers], [{}, {}])
+
+    def test_compile_with_unavailable_worker(self):
+        self.start_worker()
+        unused = self.get_unused_address()
+        pool   = CompileWorkerPool([unused, self.get_address(0)], self.artifact_manifest)
+
+        self.assertEqual(pool.compile('stub', lambda: b'source'), b'object:source')
+
+        self.assertEqual(pool.compile('stub', lambda: b'source'), b'object:source')
+
+        self.assertIn(parse_worker_address(unused), pool.unavailable_until)
+
+    def test_compile_with_busy_worker(self):
+        worker, _ = self.start_worker(jobs=1)
+        pool      = CompileWorkerPool([self.get_address(0)], self.artifact_manifest)
+
+        worker.slots.acquire()
+        preprocessed = []
+        object_      = pool.compile('stub', lambda: preprocessed.append(True) or b'source')
+        worker.slots.release()
+
+        self.assertIsNone(object_)
+
+        self.assertEqual(preprocessed, [])
+
+    def test_compile_with_mismatching_compiler(self):
+        self.start_worker(fingerprint='other')
+        pool = CompileWorkerPool([self.get_address(0)], self.artifact_manifest)
+
+        self.assertIsNone(pool.compile('stub', lambda: b'source'))
+
+    def test_compile_with_compiler_without_distribution(self):
+        _, compilers = self.start_worker(distribution=False)
+        pool         = CompileWorkerPool([self.get_address(0)], self.artifact_manifest)
+
+        self.assertIsNone(pool.compile('stub', lambda: b'source'))
+
+        self.assertEqual(compilers[0].compiled, 0)
+
+    def test_compile_without_workers(self):
+        pool = CompileWorkerPool([self.get_unused_address()], self.artifact_manifest)
+
+        self.assertIsNone(pool.compile('stub', lambda: b'source'))
+
+    def test_compile_with_link_time_optimization(self):
+        _, compilers = self.start_worker()
+        pool         = CompileWorkerPool([self.get_address(0)], self.artifact_manifest)
+
+        self.assertIsNone(pool.compile('stub -flto=auto', lambda: b'source'))
+
+        pool.enable_link_time_optimization()
+
+        self.assertEqual(pool.compile('stub -flto=auto', lambda: b'source'), b'object:source')
+
+        self.assertEqual([compiler.fingerprint for compiler in compilers], ['stub', 'stub -flto=auto'])
+
+    def test_compile_with_split_dwarf(self):
+        _, compilers = self.start_worker()
+        pool         = CompileWorkerPool([self.get_address(0)], self.artifact_manifest)
+
+        pool.enable_split_dwarf()
+
+        self.assertIsNone(pool.compile('stub -gsplit-dwarf', lambda: b'source'))
+
+        self.assertEqual([(compiler.fingerprint, compiler.compiled) for compiler in compilers], 
+                         [('stub -gsplit-dwarf', 0)])
@@ -0,0 +1,126 @@
+from praline.common import (Architecture, ArtifactLoggingLevel, ArtifactManifest, Compiler, ExportedSymbols, Mode,
+                            Platform)
+from praline.common.compiling.compiler import ICompiler, get_compiler_supplier
+from praline.common.compiling.workers import accepted_reply, busy_reply, failed_reply, succeeded_reply
+from praline.common.file_system import FileSystem, join
+
+from logging import getLogger
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Dict
+from uuid import uuid4
+
+import json
+import socketserver
+
+
+logger = getLogger(__name__)
+
+
+class CompilerMismatchError(Exception):
+    pass
+
+
+class UnsupportedSideOutputsError(Exception):
+    pass
+
+
+class DistributionNotSupportedError(Exception):
+    pass
+
+
+class CompileWorker:
+    def __init__(self,
+                 file_system: FileSystem,
+                 directory: str,
+                 jobs: int,
+                 instantiate_compiler: Callable[[ArtifactManifest], ICompiler] = None):
+        if jobs <= 0:
+            raise ValueError("number of compile worker jobs must be greater than 0")
+
+        self.file_system          = file_system
+        self.directory            = directory
+        self.slots                = BoundedSemaphore(jobs)
+        self.compilers            = {}
+        self.lock                 = Lock()
+        self.instantiate_compiler = instantiate_compiler or (
+            lambda manifest: get_compiler_supplier(manifest.compiler).instantiate_compiler(file_system, manifest))
+
+    def get_compiler(self, header: Dict[str, Any]) -> ICompiler:
+        key = tuple((k, v) for k, v in header.items() if k != 'fingerprint')
+        with self.lock:
+            if key not in self.compilers:
+                manifest = ArtifactManifest(organization=None,
+                                            artifact=None,
+                                            version=None,
+                                            mode=Mode(header['mode']),
+                                            architecture=Architecture(header['architecture']),
+                                            platform=Platform(header['platform']),
+                                            compiler=Compiler(header['compiler']),
+                                            exported_symbols=ExportedSymbols(header['exported_symbols']),
+                                            artifact_type=None,
+                                            artifact_logging_level=ArtifactLoggingLevel(header['artifact_logging_level']),
+                                            dependencies=[])
+                logger.info(f"instantiating compiler for {key}")
+                compiler = self.instantiate_compiler(manifest)
+                if header.get('split_dwarf'):
+                    compiler.enable_split_dwarf()
+                if header.get('link_time_optimization'):
+                    compiler.enable_link_time_optimization()
+                self.compilers[key] = compiler
+            return self.compilers[key]
+
+    def compile(self, header: Dict[str, Any], preprocessed: bytes) -> bytes:
+        compiler = self.get_compiler(header)
+        if not compiler.supports_distribution():
+            raise DistributionNotSupportedError(f"the {header['compiler']} compiler can't compile remotely")
+        if compiler.get_fingerprint() != header['fingerprint']:
+            raise CompilerMismatchError("the worker's compiler version or flags differ from the client's")
+
+        name                = uuid4().hex
+        preprocessed_source = join(self.directory, f'{name}.ii')
+        object_             = join(self.directory, f'{name}.o')
+        if compiler.get_side_outputs(object_):
+            raise UnsupportedSideOutputsError("the worker can't send back the compiler's side outputs")
+        try:
+            with self.file_system.open_file(preprocessed_source, 'wb') as f:
+                f.write(preprocessed)
+            compiler.compile_preprocessed(preprocessed_source, object_)
+            with self.file_system.open_file(object_, 'rb') as f:
+                return f.read()
+        finally:
+            self.file_system.remove_file_if_it_exists(preprocessed_source)
+            self.file_system.remove_file_if_it_exists(object_)
+
+
+class CompileRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        compile_worker = self.server.compile_worker
+        if not compile_worker.slots.acquire(blocking=False):
+            self.wfile.write(busy_reply)
+            return
+
+        try:
+            self.wfile.write(accepted_reply)
+            line = self.rfile.readline()
+            if not line:
+                return
+            preprocessed = self.rfile.read()
+            try:
+                object_ = compile_worker.compile(json.loads(line), preprocessed)
+            except Exception as exception:
+                logger.warning(f"couldn't compile request from {self.client_address} -- {exception}")
+                self.wfile.write(failed_reply + str(exception).encode())
+                return
+            self.wfile.write(succeeded_reply + object_)
+        finally:
+            compile_worker.slots.release()
+
+
+class CompileServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+
+    daemon_threads = True
+
+    def __init__(self, host: str, port: int, compile_worker: CompileWorker):
+        super().__init__((host, port), CompileRequestHandler)
+        self.compile_worker = compile_worker
@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Event
+from typing import Callable, Generator, Iterable, Tuple, TypeVar
+
+
+class MappingInterruptedError(Exception):
+    pass
+
+
+T = TypeVar('T')
+
+
+R = TypeVar('R')
+
+
+def parallel_map(function: Callable[[T], R], 
+                 items: Iterable[T], 
+                 jobs: int, 
+                 interruption: Event = None) -> Generator[Tuple[T, R], None, None]:
+    if jobs <= 0:
+        raise ValueError("number of jobs must be greater than 0")
+
+    def interruptible_function(item: T) -> R:
+        if interruption != None and interruption.is_set():
+            raise MappingInterruptedError("mapping was interrupted before all items were processed")
+        return function(item)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(interruptible_function, item): item for item in items}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,55 @@
+from praline.common.concurrency import MappingInterruptedError, parallel_map
+
+from threading import Event
+from time import sleep
+from unittest import TestCase
+
+
+class InterruptMappingError(Exception):
+    pass
+
+
+class ConcurrencyTest(TestCase):
+    def test_parallel_map(self):
+        results = {item: result for item, result in parallel_map(lambda x: x * x, [1, 2, 3, 4], jobs=3)}
+
+        self.assertEqual(results, {1: 1, 2: 4, 3: 9, 4: 16})
+
+    def test_parallel_map_with_no_items(self):
+        results = list(parallel_map(lambda x: x, [], jobs=2))
+
+        self.assertEqual(results, [])
+
+    def test_parallel_map_with_invalid_jobs(self):
+        self.assertRaises(ValueError, list, parallel_map(lambda x: x, [1], jobs=0))
+
+    def test_parallel_map_fails_fast(self):
+        invoked = []
+
+        def function(item):
+            if item == 0:
+                raise InterruptMappingError()
+            sleep(0.05)
+            invoked.append(item)
+            return item
+
+        with self.assertRaises(InterruptMappingError):
+            for _ in parallel_map(function, range(10), jobs=2):
+                pass
+
+        self.assertLessEqual(len(invoked), 2)
+
+    def test_parallel_map_with_interruption(self):
+        interruption = Event()
+        invoked      = []
+
+        def function(item):
+            invoked.append(item)
+            interruption.set()
+            return item
+
+        with self.assertRaises(MappingInterruptedError):
+            for _ in parallel_map(function, range(10), jobs=1, interruption=interruption):
+                pass
+
+        self.assertEqual(invoked, [0])
@@ -1,4 +1,5 @@
-from praline.common import Architecture, Platform
+from praline.common import ArchiveFormat, Architecture, Platform
+from praline.common.concurrency import MappingInterruptedError
 from praline.common.tracing import trace, INFO
 
 import os
@@ -9,8 +10,18 @@ import subprocess
 import sys
 import tarfile
 
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
 from logging import getLogger
-from typing import Any, IO, List, Dict
+from threading import Event, Thread
+from time import monotonic
+from typing import Any, Callable, ContextManager, IO, Iterator, List, Dict, Tuple
+
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 logger = getLogger(__name__)
@@ -44,13 +55,77 @@ def common_path(paths: List[str]) -> str:
     return os.path.commonpath(paths)
 
 
+def expand_user(path: str) -> str:
+    return os.path.expanduser(path)
+
+
+class ZstdTarFile(tarfile.TarFile):
+    OPEN_METH = {**tarfile.TarFile.OPEN_METH, 'zst': 'zstopen'}
+
+    @classmethod
+    def zstopen(cls, name: str, mode: str = 'r', fileobj: IO[bytes] = None, **kwargs):
+        if zstandard == None:
+            raise tarfile.CompressionError("the zstandard module is not available")
+        if mode == 'r':
+            compressed = open(name, 'rb') if fileobj == None else fileobj
+            reader     = zstandard.ZstdDecompressor().stream_reader(compressed, 
+                                                                    read_across_frames=True, 
+                                                                    closefd=fileobj == None)
+            archive    = cls.taropen(name, 'r', reader, **kwargs)
+        elif mode == 'w':
+            compressed = open(name, 'wb') if fileobj == None else fileobj
+            writer     = zstandard.ZstdCompressor(threads=-1).stream_writer(compressed, closefd=fileobj == None)
+            archive    = cls.taropen(name, 'w', writer, **kwargs)
+        else:
+            raise ValueError(f"mode '{mode}' is not supported for zstandard archives")
+        archive._extfileobj = False
+        return archive
+
+
+@dataclass(frozen=True)
+class ProcessUsage:
+    wall_time: float
+    peak_memory: int
+
+
 class FileSystem:
-    @trace
-    def execute(self, 
-                command: List[str], 
-                add_to_library_path: List[str] = [], 
-                interactive: bool = False, 
-                add_to_env: Dict[str, str] = {}):
+    output: IO[Any] = None
+
+    interruption: Event = None
+
+    on_rewrite: Callable[[str], ContextManager[None]] = None
+
+    file_states: Dict[str, Tuple[int, float]] = None
+
+    file_hashes: Dict[str, Tuple[Tuple[int, float], str]] = None
+
+    @contextmanager
+    def interruptible(self, process: subprocess.Popen) -> Iterator[None]:
+        if self.interruption == None:
+            yield
+            return
+        finished = Event()
+        killed   = Event()
+
+        def kill_on_interruption():
+            while not finished.is_set():
+                if self.interruption.wait(0.05) and not finished.is_set():
+                    killed.set()
+                    process.kill()
+                    return
+
+        Thread(target=kill_on_interruption, daemon=True).start()
+        try:
+            yield
+        finally:
+            finished.set()
+        if killed.is_set():
+            raise MappingInterruptedError(f"command '{' '.join(process.args)}' was interrupted")
+
+    def rewriting(self, path: str) -> ContextManager[None]:
+        return self.on_rewrite(path) if self.on_rewrite != None else nullcontext()
+
+    def get_environment(self, add_to_library_path: List[str], add_to_env: Dict[str, str]) -> Dict[str, str]:
         environment_copy = dict(os.environ)
         if add_to_library_path:
             if sys.platform == 'linux' or sys.platform == 'darwin':
@@ -59,15 +134,28 @@ class FileSystem:
                 environment_copy['PATH'] += os.pathsep + os.pathsep.join(add_to_library_path)
             else:
                 raise RuntimeError(f"couldn't change library path -- unsupported platform '{sys.platform}'")
-        
+
         for key, value in add_to_env.items():
             if key in environment_copy:
                 raise RuntimeError(f"variable '{key}' already present in environment")
             else:
                 environment_copy[key] = value
-        
+
+        return environment_copy
+
+    @trace
+    def execute(self, 
+                command: List[str], 
+                add_to_library_path: List[str] = [], 
+                interactive: bool = False, 
+                add_to_env: Dict[str, str] = {}):
+        environment_copy = self.get_environment(add_to_library_path, add_to_env)
         if interactive:
-            process = subprocess.Popen(command, shell=(os.name == 'nt'), env=environment_copy)
+            process = subprocess.Popen(command, 
+                                       shell=(os.name == 'nt'), 
+                                       stdout=self.output, 
+                                       stderr=self.output, 
+                                       env=environment_copy)
             process.wait()
             return process.returncode
         else:
@@ -76,9 +164,69 @@ class FileSystem:
                                        stdout=subprocess.PIPE, 
                                        stderr=subprocess.PIPE, 
                                        env=environment_copy)
-            stdout, stderror = process.communicate()
+            with self.interruptible(process):
+                stdout, stderror = process.communicate()
             return process.returncode, stdout, stderror
 
+    @trace
+    def execute_streaming(self, 
+                          command: List[str], 
+                          consume: Callable[[bytes], None], 
+                          add_to_library_path: List[str] = [], 
+                          add_to_env: Dict[str, str] = {}) -> Tuple[int, bytes]:
+        environment_copy = self.get_environment(add_to_library_path, add_to_env)
+        process = subprocess.Popen(command, 
+                                   shell=(os.name == 'nt'), 
+                                   stdout=subprocess.PIPE, 
+                                   stderr=subprocess.PIPE, 
+                                   env=environment_copy)
+        stderror = []
+        reader   = Thread(target=lambda: stderror.append(process.stderr.read()))
+        reader.start()
+        with self.interruptible(process):
+            try:
+                for chunk in iter(lambda: process.stdout.read(65536), b''):
+                    consume(chunk)
+            finally:
+                process.stdout.close()
+                reader.join()
+                process.stderr.close()
+                process.wait()
+        return process.returncode, stderror[0]
+
+    @trace
+    def execute_and_measure(self, 
+                            command: List[str], 
+                            add_to_library_path: List[str] = [], 
+                            add_to_env: Dict[str, str] = {}) -> Tuple[int, bytes, bytes, ProcessUsage]:
+        environment_copy = self.get_environment(add_to_library_path, add_to_env)
+        start   = monotonic()
+        process = subprocess.Popen(command, 
+                                   shell=(os.name == 'nt'), 
+                                   stdout=subprocess.PIPE, 
+                                   stderr=subprocess.PIPE, 
+                                   env=environment_copy)
+        if not hasattr(os, 'wait4'):
+            stdout, stderror = process.communicate()
+            return process.returncode, stdout, stderror, ProcessUsage(monotonic() - start, None)
+
+        outputs = {}
+        readers = [Thread(target=lambda stream: outputs.__setitem__(stream, stream.read()), args=(stream,))
+                   for stream in [process.stdout, process.stderr]]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        _, status, usage   = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        process.stdout.close()
+        process.stderr.close()
+        peak_memory = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+        return (process.returncode, 
+                outputs[process.stdout], 
+                outputs[process.stderr], 
+                ProcessUsage(monotonic() - start, peak_memory))
+
     def execute_and_fail_on_bad_return(self, 
                                        command: List[str], 
                                        add_to_library_path: List[str] = [], 
@@ -122,7 +270,7 @@ class FileSystem:
     def create_directory_if_missing(self, path: str) -> None:
         if not self.exists(path):
             logger.debug(f"creating directory '{path}'")
-            os.makedirs(path)
+            os.makedirs(path, exist_ok=True)
         elif not self.is_directory(path):
             raise RuntimeError(f"'{path}' already exists and is not a directory")
 
@@ -154,6 +302,30 @@ class FileSystem:
         if self.exists(path):
             self.remove_file(path)
 
+    def copy_file(self, source: str, destination: str) -> None:
+        shutil.copy(source, destination)
+
+    def link_or_copy_file(self, source: str, destination: str) -> None:
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy(source, destination)
+
+    def rename(self, source: str, destination: str) -> None:
+        os.replace(source, destination)
+
+    def touch(self, path: str) -> None:
+        os.utime(path)
+
+    def change_mode(self, path: str, mode: int) -> None:
+        os.chmod(path, mode)
+
+    def get_size(self, path: str) -> int:
+        return os.path.getsize(path)
+
+    def get_modification_time(self, path: str) -> float:
+        return os.path.getmtime(path)
+
     def which(self, thing: str) -> str:
         directories = os.environ["PATH"].split(os.pathsep)
         current = directory_name(thing)
@@ -162,8 +334,9 @@ class FileSystem:
         for directory in directories:
             if self.exists(directory):
                 for entry in os.scandir(directory):
-                    path = join(directory, entry.name)
-                    if thing == os.path.splitext(entry.name)[0] and os.access(path, os.X_OK) and entry.is_file():
+                    path  = join(directory, entry.name)
+                    names = [entry.name, os.path.splitext(entry.name)[0]]
+                    if thing in names and os.access(path, os.X_OK) and entry.is_file():
                         return entry.path
         return None
 
@@ -187,7 +360,17 @@ class FileSystem:
             raise RuntimeError(f"unrecognized platform '{sys.platform}'")
 
     def open_tarfile(self, path: str, mode: str):
-        return tarfile.open(path, mode)
+        return ZstdTarFile.open(path, mode)
+
+    def open_tarstream(self, stream: IO[Any], mode: str):
+        if mode == 'r|zst':
+            if zstandard == None:
+                raise tarfile.CompressionError("the zstandard module is not available")
+            return ZstdTarFile.open(fileobj=zstandard.ZstdDecompressor().stream_reader(stream), mode='r|')
+        return ZstdTarFile.open(fileobj=stream, mode=mode)
+
+    def get_archive_formats(self) -> List[ArchiveFormat]:
+        return [ArchiveFormat.zst, ArchiveFormat.gz] if zstandard != None else [ArchiveFormat.gz]
 
     def copyfileobj(self, source, destination):
         shutil.copyfileobj(source, destination)
@@ -0,0 +1,98 @@
+from praline.common import (ArchiveFormat, Architecture, ArtifactLoggingLevel, ArtifactManifest, ArtifactType, 
+                            ArtifactVersion, Compiler, ExportedSymbols, Mode, Platform)
+from praline.common.concurrency import MappingInterruptedError
+from praline.common.file_system import FileSystem, join
+from praline.common.hashing import hash_archive
+from praline.common.package import pack, read_artifact_manifest, unpack, unpack_streaming
+
+from tempfile import TemporaryDirectory
+from threading import Event, Timer
+from time import monotonic
+from unittest import TestCase, skipUnless
+
+import os
+import pickle
+import sys
+
+
+class FileSystemTest(TestCase):
+    def test_execute_kills_interrupted_process(self):
+        file_system              = FileSystem()
+        file_system.interruption = Event()
+        command                  = [sys.executable, '-c', 'import time; time.sleep(30)']
+
+        for execute in [lambda: file_system.execute(command), 
+                        lambda: file_system.execute_streaming(command, lambda chunk: None)]:
+            file_system.interruption.clear()
+            timer = Timer(0.1, file_system.interruption.set)
+            timer.start()
+            start = monotonic()
+
+            self.assertRaises(MappingInterruptedError, execute)
+
+            self.assertLess(monotonic() - start, 10)
+
+            timer.join()
+
+    def test_execute_without_interruption(self):
+        file_system              = FileSystem()
+        file_system.interruption = Event()
+
+        status, stdout, _ = file_system.execute([sys.executable, '-c', 'print("done")'])
+
+        self.assertEqual((status, stdout.strip()), (0, b'done'))
+
+    @skipUnless(ArchiveFormat.zst in FileSystem().get_archive_formats(), "the zstandard module is not available")
+    def test_zstandard_package_round_trip(self):
+        file_system       = FileSystem()
+        artifact_manifest = ArtifactManifest(organization='org',
+                                             artifact='art',
+                                             version=ArtifactVersion.from_string('1.0.0'),
+                                             mode=Mode.debug,
+                                             architecture=Architecture.x64,
+                                             platform=Platform.linux,
+                                             compiler=Compiler.gcc,
+                                             exported_symbols=ExportedSymbols.explicit,
+                                             artifact_type=ArtifactType.library,
+                                             artifact_logging_level=ArtifactLoggingLevel.info,
+                                             dependencies=[])
+        with TemporaryDirectory() as directory:
+            files = {
+                '.manifest': pickle.dumps(artifact_manifest),
+                join('headers', 'org', 'art', 'a.hpp'): b'PRALINE_EXPORT void a();',
+                join('libraries', 'liborg-art.so'): os.urandom(1 << 20),
+                join('resources', 'org', 'art', 'b.txt'): b'resource' * 4096
+            }
+            for name, contents in files.items():
+                path = join(directory, 'project', name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(contents)
+
+            package_files = [(join(directory, 'project', name), name) for name in files]
+            packages      = {archive_format: join(directory, f'org-art-x64-linux-gcc-debug-1.0.0.tar.{archive_format}')
+                             for archive_format in ArchiveFormat}
+            for package in packages.values():
+                pack(file_system, package, package_files)
+
+            package_hash = hash_archive(file_system, packages[ArchiveFormat.zst])
+
+            self.assertEqual(package_hash, hash_archive(file_system, packages[ArchiveFormat.gz]))
+
+            self.assertEqual(read_artifact_manifest(file_system, packages[ArchiveFormat.zst]), artifact_manifest)
+
+            unpacked = join(directory, 'unpacked')
+            contents = unpack(file_system, packages[ArchiveFormat.zst], unpacked)
+
+            self.assertEqual(contents['libraries'], [join(unpacked, 'libraries', 'liborg-art.so')])
+
+            streamed = join(directory, 'streamed')
+            with open(packages[ArchiveFormat.zst], 'rb') as stream:
+                unpack_streaming(file_system, stream, packages[ArchiveFormat.zst], streamed, package_hash)
+
+            for root in [unpacked, streamed]:
+                for name, contents in files.items():
+                    if name != '.manifest':
+                        with open(join(root, name), 'rb') as f:
+                            expected = contents.replace(b'PRALINE_EXPORT', b'PRALINE_IMPORT')
+                            self.assertEqual(f.read(), expected)
@@ -1,4 +1,5 @@
-from praline.common.file_system import FileSystem
+from praline.common import get_archive_format
+from praline.common.file_system import FileSystem, normalized_path
 from praline.common.tracing import trace
 
 from dataclasses import dataclass
@@ -6,24 +7,42 @@ from enum import Enum
 from hashlib import sha3_256
 from typing import Callable, Dict, Generator, List
 
+import re
+
+
+hash_pattern = re.compile(r'[0-9a-f]{64}')
+
 
 @trace
 def hash_file(file_system: FileSystem, file_path: str) -> str:
+    state = None
+    if file_system.file_states != None:
+        path  = normalized_path(file_path)
+        state = file_system.file_states.get(path)
+        if state != None:
+            cached = file_system.file_hashes.get(path)
+            if cached != None and cached[0] == state:
+                return cached[1]
+
     hasher = sha3_256()
     with file_system.open_file(file_path, 'rb') as f:
         for chunk in iter(lambda: f.read(4096), b''):
             hasher.update(chunk)
-    return hasher.hexdigest()
+    file_hash = hasher.hexdigest()
+
+    if state != None:
+        file_system.file_hashes[path] = (state, file_hash)
+    return file_hash
 
 
 @trace
 def hash_archive(file_system: FileSystem, archive_path: str):
     hasher = sha3_256()
-    with file_system.open_tarfile(archive_path, 'r:gz') as archive:
-        for member in archive.getmembers():
+    with file_system.open_tarfile(archive_path, f'r:{get_archive_format(archive_path)}') as archive:
+        for member in archive:
             if member.isfile():
                 hasher.update(member.name.encode('utf-8'))
-                with archive.extractfile(member.name) as f:
+                with archive.extractfile(member) as f:
                     for chunk in iter(lambda: f.read(4096), b''):
                         hasher.update(chunk)
     return hasher.hexdigest()
@@ -33,6 +52,12 @@ def hash_binary(data: bytes) -> str:
     return sha3_256(data).hexdigest()
 
 
+def hash_streaming(prefix: bytes, produce: Callable[[Callable[[bytes], None]], None]) -> str:
+    hasher = sha3_256(prefix)
+    produce(hasher.update)
+    return hasher.hexdigest()
+
+
 class DeltaType(Enum):
     Added    = 0
     Modified = 1
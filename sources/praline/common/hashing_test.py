@@ -1,5 +1,5 @@
 from praline.common.hashing import (DeltaItem, DeltaType, delta, hash_archive, hash_binary, hash_file, 
-                                    progression_resolution)
+                                    hash_streaming, progression_resolution)
 from praline.common.testing.file_system_mock import ArchiveMock, FileSystemMock
 
 from os.path import join
@@ -16,12 +16,40 @@ class HashingTest(TestCase):
 
         self.assertEqual(hash_value, '3734c3023573321d4f7912cfeda42eb8fa74d1c3fb2f8f08147ac66ee14a5bba')
 
+    def test_hash_file_with_file_states(self):
+        file_name   = join('my', 'file')
+        file_system = FileSystemMock(directories={'my'}, files={file_name: b'secretvalue'})
+
+        file_system.file_states = {file_name: (11, 0)}
+        file_system.file_hashes = {}
+
+        hash_value = hash_file(file_system, file_name)
+
+        self.assertEqual(file_system.file_hashes, {file_name: ((11, 0), hash_value)})
+
+        file_system.files[file_name] = b'othervalue!'
+
+        self.assertEqual(hash_file(file_system, file_name), hash_value)
+
+        file_system.file_states = {file_name: (11, 1)}
+
+        self.assertEqual(hash_file(file_system, file_name), hash_file(FileSystemMock(files={'f': b'othervalue!'}), 'f'))
+
     def test_hash_binary(self):
         binary     = b'another_secret?!'
         hash_value = hash_binary(binary)
 
         self.assertEqual(hash_value, '62e404dfe29153db02cd492c1360eb1677a262ef1efe140083a7d9a0d893371e')
 
+    def test_hash_streaming(self):
+        def produce(consume):
+            for chunk in [b'secret', b'_?!']:
+                consume(chunk)
+
+        hash_value = hash_streaming(b'another_', produce)
+
+        self.assertEqual(hash_value, hash_binary(b'another_secret_?!'))
+
 
     def test_hash_archive(self):
         file_system = FileSystemMock(
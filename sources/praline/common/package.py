@@ -1,14 +1,17 @@
-from praline.common import (ArtifactManifest, DependencyScope, DependencyVersion, PackageVersion, package_extension,
-                            package_name_pattern)
+from praline.common import (ArchiveFormat, ArtifactManifest, DependencyScope, DependencyVersion, PackageVersion, 
+                            get_archive_format, package_name_pattern, strip_package_extension)
 from praline.common.algorithm.general import cartesian_product
 from praline.common.algorithm.graph.instance_traversal import InstanceValidationResult, multiple_instance_depth_first_traversal
 from praline.common.compiling.compiler import get_compiler_supplier
-from praline.common.file_system import FileSystem, basename, common_path, join, normalized_path
+from praline.common.file_system import FileSystem, basename, common_path, directory_name, join, normalized_path
 from praline.common.tracing import trace
 
+import io
+import json
 import logging
 import pickle
-from typing import Dict, List, Tuple
+from hashlib import sha3_256
+from typing import Any, Dict, IO, List, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -38,8 +41,14 @@ class InvalidManifestFileError(Exception):
     pass
 
 
+class PackageHashMismatchError(Exception):
+    pass
+
+
 manifest_file_name = '.manifest'
 
+contents_suffix = '.contents'
+
 
 def write_artifact_manifest(file_system: FileSystem, manifest_path: str, artifact_manifest: ArtifactManifest):
     with file_system.open_file(manifest_path, 'wb') as f:
@@ -47,8 +56,11 @@ def write_artifact_manifest(file_system: FileSystem, manifest_path: str, artifac
 
 
 def read_artifact_manifest(file_system: FileSystem, package_path: str) -> ArtifactManifest:
-    with file_system.open_tarfile(package_path, 'r:gz') as archive:
-        with archive.extractfile(manifest_file_name) as f:
+    with file_system.open_tarfile(package_path, f'r:{get_archive_format(package_path)}') as archive:
+        member = next((member for member in archive if member.name == manifest_file_name), None)
+        if member == None:
+            raise KeyError(f"filename '{manifest_file_name}' not found")
+        with archive.extractfile(member) as f:
             data = pickle.load(f)
             if isinstance(data, ArtifactManifest):
                 return data
@@ -57,7 +69,7 @@ def read_artifact_manifest(file_system: FileSystem, package_path: str) -> Artifa
 
 
 def split_package_version(package_name: str) -> str:
-    return package_name[:-len(package_extension)].rsplit('-', 1)
+    return strip_package_extension(package_name).rsplit('-', 1)
 
 
 @trace
@@ -70,9 +82,9 @@ def get_matching_packages(dependency: str, candidate_packages: List[str]) -> Lis
         if identifier == candidate_identifier:
             package_version = PackageVersion.from_string(candidate_version)
             if dependency_version.matches(package_version):
-                matching_versions.append(package_version)
-    sorted_versions = sorted(matching_versions, reverse=True)
-    return [f"{identifier}-{version}{package_extension}" for version in sorted_versions]
+                matching_versions.append((package_version, candidate))
+    sorted_versions = sorted(matching_versions, key=lambda pair: pair[0], reverse=True)
+    return [candidate for _, candidate in sorted_versions]
 
 
 @trace
@@ -83,17 +95,32 @@ def get_packages_from_directory(file_system: FileSystem, directory: str) -> List
 
 def get_package_dependencies_from_archive(file_system: FileSystem, package_path: str) -> List[str]:
     artifact_manifest = read_artifact_manifest(file_system, package_path)
-    return artifact_manifest.get_package_dependencies_file_names()
+    return artifact_manifest.get_package_dependencies_file_names(get_archive_format(package_path))
+
+
+def select_package_formats(packages: List[str], archive_formats: List[ArchiveFormat]) -> List[str]:
+    selected = {}
+    for package in packages:
+        archive_format = get_archive_format(package)
+        if archive_format not in archive_formats:
+            continue
+        identifier = strip_package_extension(package)
+        if (identifier not in selected or 
+            archive_formats.index(archive_format) < archive_formats.index(get_archive_format(selected[identifier]))):
+            selected[identifier] = package
+    return sorted(selected.values())
 
 
 @trace
 def get_package_dependencies_recursively(file_system: FileSystem, 
                                          artifact_manifest: ArtifactManifest,
-                                         repository_path: str) -> List[str]:
+                                         repository_path: str,
+                                         archive_formats: List[ArchiveFormat] = [ArchiveFormat.gz]) -> List[str]:
     root_package      = artifact_manifest.get_package_file_name()
     root_dependencies = artifact_manifest.get_package_dependencies_file_names()
 
-    candidate_packages = get_packages_from_directory(file_system, repository_path)
+    candidate_packages = select_package_formats(get_packages_from_directory(file_system, repository_path), 
+                                                archive_formats)
 
     def no_version_conflicts(package, dependency_tree):
         package_identifier, package_version = split_package_version(package)
@@ -135,11 +162,34 @@ def get_package_dependencies_recursively(file_system: FileSystem,
     return dependencies
 
 
+def is_header(package_file_path: str) -> bool:
+    return common_path([normalized_path(package_file_path), 'headers']) == 'headers'
+
+
+def get_import_header(contents: bytes) -> bytes:
+    return contents.replace(b'PRALINE_EXPORT', b'PRALINE_IMPORT')
+
+
+def extract_header(file_system: FileSystem, contents: bytes, path: str, mode: int):
+    file_system.create_directory_if_missing(directory_name(path))
+    file_system.remove_file_if_it_exists(path)
+    with file_system.open_file(path, 'wb') as f:
+        f.write(get_import_header(contents))
+    file_system.change_mode(path, mode)
+
+
 @trace
 def pack(file_system: FileSystem, package_path: str, package_files: List[Tuple[str, str]]):
-    with file_system.open_tarfile(package_path, 'w:gz') as archive:
+    with file_system.open_tarfile(package_path, f'w:{get_archive_format(package_path)}') as archive:
         for file_path, package_file_path in package_files:
-            archive.add(file_path, package_file_path)
+            if is_header(package_file_path):
+                with file_system.open_file(file_path, 'rb') as f:
+                    contents = get_import_header(f.read())
+                member      = archive.gettarinfo(file_path, package_file_path)
+                member.size = len(contents)
+                archive.addfile(member, io.BytesIO(contents))
+            else:
+                archive.add(file_path, package_file_path)
 
 
 @trace
@@ -153,28 +203,91 @@ def unpack(file_system: FileSystem, package_path: str, extraction_path: str) ->
         'executables': []
     }
 
-    with file_system.open_tarfile(package_path, 'r:gz') as archive:
-        for member in archive.getmembers():
+    with file_system.open_tarfile(package_path, f'r:{get_archive_format(package_path)}') as archive:
+        for member in archive:
             if member.isfile():
                 valid = False
                 for root, files in contents.items():
                     if common_path([normalized_path(member.name), normalized_path(root)]) == normalized_path(root):
-                        archive.extract(member, extraction_path)
+                        if root == 'headers':
+                            with archive.extractfile(member) as source:
+                                extract_header(file_system, source.read(), join(extraction_path, member.name), 
+                                               member.mode)
+                        else:
+                            archive.extract(member, extraction_path)
                         files.append(join(extraction_path, member.name))
                         valid = True
                 if member.name != manifest_file_name and not valid:
                     raise InvalidPackageContentsError(f"unrecognized file '{member.name}' in package")
-    
-    for header in contents['headers']:
-        with file_system.open_file(header, 'rb') as f:
-            text = f.read().decode()
-        with file_system.open_file(header, 'wb') as f:
-            f.write(text.replace('PRALINE_EXPORT', 'PRALINE_IMPORT').encode())
+    return contents
+
+
+@trace
+def unpack_streaming(file_system: FileSystem, 
+                     stream: IO[Any], 
+                     package_path: str, 
+                     extraction_path: str, 
+                     expected_hash: str) -> Dict[str, List[str]]:
+    contents = {
+        'resources': [],
+        'headers': [],
+        'libraries': [],
+        'libraries_interfaces': [],
+        'symbols_tables': [],
+        'executables': []
+    }
+
+    hasher    = sha3_256()
+    extracted = []
+    try:
+        with file_system.open_tarstream(stream, f'r|{get_archive_format(package_path)}') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                hasher.update(member.name.encode('utf-8'))
+                with archive.extractfile(member) as source:
+                    if member.name == manifest_file_name:
+                        for chunk in iter(lambda: source.read(65536), b''):
+                            hasher.update(chunk)
+                        continue
+                    name  = normalized_path(member.name)
+                    roots = [r for r in contents if common_path([name, normalized_path(r)]) == normalized_path(r)]
+                    if not roots:
+                        raise InvalidPackageContentsError(f"unrecognized file '{member.name}' in package")
+                    path = join(extraction_path, member.name)
+                    extracted.append(path)
+                    if roots[0] == 'headers':
+                        header = source.read()
+                        hasher.update(header)
+                        extract_header(file_system, header, path, member.mode)
+                    else:
+                        file_system.create_directory_if_missing(directory_name(path))
+                        file_system.remove_file_if_it_exists(path)
+                        with file_system.open_file(path, 'wb') as destination:
+                            for chunk in iter(lambda: source.read(65536), b''):
+                                hasher.update(chunk)
+                                destination.write(chunk)
+                        file_system.change_mode(path, member.mode)
+                    contents[roots[0]].append(path)
+
+        if hasher.hexdigest() != expected_hash:
+            raise PackageHashMismatchError(f"package '{basename(package_path)}' doesn't match its hash {expected_hash}")
+    except Exception:
+        for path in extracted:
+            file_system.remove_file_if_it_exists(path)
+        raise
+
+    with file_system.open_file(package_path + contents_suffix, 'wb') as f:
+        f.write(json.dumps(contents).encode())
     return contents
 
 
 @trace
 def get_package_contents(file_system: FileSystem, package_path: str, extraction_path: str) -> Dict[str, List[str]]:
+    if not file_system.exists(package_path) and file_system.exists(package_path + contents_suffix):
+        with file_system.open_file(package_path + contents_suffix, 'rb') as f:
+            return json.loads(f.read().decode())
+
     contents = {
         'resources': [],
         'headers': [],
@@ -184,7 +297,7 @@ def get_package_contents(file_system: FileSystem, package_path: str, extraction_
         'executables': []
     }
 
-    with file_system.open_tarfile(package_path, 'r:gz') as archive:
+    with file_system.open_tarfile(package_path, f'r:{get_archive_format(package_path)}') as archive:
         for member in archive.getmembers():
             if member.isfile():
                 valid = False
@@ -214,10 +327,9 @@ def clean_up_package(file_system: FileSystem, package_path: str, extraction_path
     file_system.remove_directory_recursively_if_it_exists(resources)
     file_system.remove_directory_recursively_if_it_exists(headers)
 
-    if 'SNAPSHOT' in package_name:
-        artifact_identifer = package_name[:-27]
-    else:
-        artifact_identifer = package_name[:-7]
+    artifact_identifer = strip_package_extension(package_name)
+    if 'SNAPSHOT' in artifact_identifer:
+        artifact_identifer = artifact_identifer[:-20]
 
     compiler_supplier = get_compiler_supplier(compiler)
     yield_descriptor  = compiler_supplier.get_yield_descriptor()
@@ -236,3 +348,4 @@ def clean_up_package(file_system: FileSystem, package_path: str, extraction_path
     file_system.remove_file_if_it_exists(library_interface)
     file_system.remove_file_if_it_exists(symbols_table)
     file_system.remove_file_if_it_exists(package_path)
+    file_system.remove_file_if_it_exists(package_path + contents_suffix)
@@ -1,9 +1,9 @@
-from praline.common import (Architecture, ArtifactManifest, ArtifactVersion, ArtifactType, ArtifactDependency, 
+from praline.common import (ArchiveFormat, Architecture, ArtifactManifest, ArtifactVersion, ArtifactType, ArtifactDependency, 
                             ArtifactLoggingLevel, Compiler, ExportedSymbols, Mode, DependencyScope, 
                             DependencyVersion, Platform)
 from praline.common.package import (InvalidManifestFileError, get_matching_packages, read_artifact_manifest, 
                                     split_package_version, write_artifact_manifest, get_packages_from_directory,
-                                    get_package_dependencies_from_archive)
+                                    get_package_dependencies_from_archive, select_package_formats, pack, unpack)
 from praline.common.testing.file_system_mock import ArchiveMock, FileSystemMock
 
 import pickle
@@ -138,11 +138,49 @@ class PackageTest(TestCase):
 
         self.assertEqual(matching_packages, expected_matching_packages)
 
+    def test_get_matching_packages_with_archive_formats(self):
+        dependency = 'org-art-x64-linux-gcc-debug-12.+4.+0.tar.gz'
+
+        candidates = [
+            'org-art-x64-linux-gcc-debug-12.4.0.tar.gz',
+            'org-art-x64-linux-gcc-debug-12.5.0.tar.zst',
+            'org-art-x64-linux-gcc-debug-13.0.0.tar.zst',
+        ]
+
+        expected_matching_packages = [
+            'org-art-x64-linux-gcc-debug-12.5.0.tar.zst',
+            'org-art-x64-linux-gcc-debug-12.4.0.tar.gz',
+        ]
+
+        matching_packages = get_matching_packages(dependency, candidates)
+
+        self.assertEqual(matching_packages, expected_matching_packages)
+
+    def test_select_package_formats(self):
+        packages = [
+            'org-art-x64-linux-gcc-debug-12.4.0.tar.gz',
+            'org-art-x64-linux-gcc-debug-12.4.0.tar.zst',
+            'org-art-x64-linux-gcc-debug-12.5.0.tar.gz',
+            'org-art-x64-linux-gcc-debug-12.6.0.tar.zst',
+        ]
+
+        self.assertEqual(select_package_formats(packages, [ArchiveFormat.zst, ArchiveFormat.gz]), [
+            'org-art-x64-linux-gcc-debug-12.4.0.tar.zst',
+            'org-art-x64-linux-gcc-debug-12.5.0.tar.gz',
+            'org-art-x64-linux-gcc-debug-12.6.0.tar.zst',
+        ])
+
+        self.assertEqual(select_package_formats(packages, [ArchiveFormat.gz]), [
+            'org-art-x64-linux-gcc-debug-12.4.0.tar.gz',
+            'org-art-x64-linux-gcc-debug-12.5.0.tar.gz',
+        ])
+
     def test_get_packages_from_directory(self):
         file_system = FileSystemMock(
             files={
                 join('packages', 'org-art-x64-linux-gcc-debug-12.4.0.SNAPSHOT20230120115015000006.tar.gz'): b'',
                 join('packages', 'org-art-x64-linux-gcc-debug-12.4.0.tar.gz'): b'',
+                join('packages', 'org-art-x64-linux-gcc-debug-12.4.1.tar.zst'): b'',
                 join('packages', 'not-a-package.tar.gz'): b'',
             },
             directories={'packages'}
@@ -152,7 +190,8 @@ class PackageTest(TestCase):
 
         expected_packages = {
             'org-art-x64-linux-gcc-debug-12.4.0.SNAPSHOT20230120115015000006.tar.gz',
-            'org-art-x64-linux-gcc-debug-12.4.0.tar.gz'
+            'org-art-x64-linux-gcc-debug-12.4.0.tar.gz',
+            'org-art-x64-linux-gcc-debug-12.4.1.tar.zst'
         }
 
         self.assertCountEqual(packages, expected_packages)
@@ -181,22 +220,84 @@ class PackageTest(TestCase):
             ]
         )
 
-        package_path = join('packages', 'org-art-x64-linux-gcc-debug-7.5.2.tar.gz')
+        for archive_format in ArchiveFormat:
+            package_path = join('packages', f'org-art-x64-linux-gcc-debug-7.5.2.tar.{archive_format}')
+
+            file_system = FileSystemMock(
+                directories={
+                    'packages'
+                }, 
+                files={
+                    package_path: ArchiveMock({'.manifest': pickle.dumps(artifact_manifest)})
+                }
+            )
 
+            package_dependencies = get_package_dependencies_from_archive(file_system, package_path)
+
+            expected_package_dependencies = {
+                f"org2-art2-x64-linux-gcc-debug-1.2.4.SNAPSHOT.tar.{archive_format}",
+                f"org3-art3-x64-linux-gcc-debug-5.0.9.tar.{archive_format}",
+            }
+
+            self.assertCountEqual(package_dependencies, expected_package_dependencies)
+
+    def test_pack_and_unpack(self):
         file_system = FileSystemMock(
             directories={
+                'project/sources/org/aa',
+                'project/target/libraries',
+                'project/target/external/packages'
+            },
+            files={
+                'project/sources/org/aa/a.hpp': b'class PRALINE_EXPORT a {};',
+                'project/target/libraries/org-aa-x64-linux-gcc-debug-1.0.0.so': b'PRALINE_EXPORT'
+            }
+        )
+
+        package_path = 'project/target/external/packages/org-aa-x64-linux-gcc-debug-1.0.0.tar.gz'
+
+        pack(file_system, package_path, [
+            ('project/sources/org/aa/a.hpp', 'headers/org/aa/a.hpp'),
+            ('project/target/libraries/org-aa-x64-linux-gcc-debug-1.0.0.so', 
+             'libraries/org-aa-x64-linux-gcc-debug-1.0.0.so')
+        ])
+
+        self.assertEqual(file_system.files[package_path].members, {
+            'headers/org/aa/a.hpp': b'class PRALINE_IMPORT a {};',
+            'libraries/org-aa-x64-linux-gcc-debug-1.0.0.so': b'PRALINE_EXPORT'
+        })
+
+        self.assertEqual(file_system.files[join('project', 'sources', 'org', 'aa', 'a.hpp')], 
+                         b'class PRALINE_EXPORT a {};')
+
+        contents = unpack(file_system, package_path, 'external')
+
+        self.assertEqual(contents['headers'], [join('external', 'headers/org/aa/a.hpp')])
+
+        self.assertEqual(file_system.files[join('external', 'headers', 'org', 'aa', 'a.hpp')], 
+                         b'class PRALINE_IMPORT a {};')
+
+    def test_unpack_package_with_export_headers(self):
+        file_system = FileSystemMock(
+            directories={
+                'external',
                 'packages'
-            }, 
+            },
             files={
-                package_path: ArchiveMock({'.manifest': pickle.dumps(artifact_manifest)})
+                'packages/org-aa-x64-linux-gcc-debug-1.0.0.tar.gz': ArchiveMock({
+                    'headers/org/aa/a.hpp': b'class PRALINE_EXPORT a {};',
+                    'resources/org/aa/a.txt': b'PRALINE_EXPORT'
+                })
             }
         )
 
-        package_dependencies = get_package_dependencies_from_archive(file_system, package_path)
+        contents = unpack(file_system, 'packages/org-aa-x64-linux-gcc-debug-1.0.0.tar.gz', 'external')
 
-        expected_package_dependencies = {
-            "org2-art2-x64-linux-gcc-debug-1.2.4.SNAPSHOT.tar.gz",
-            "org3-art3-x64-linux-gcc-debug-5.0.9.tar.gz",
-        }
+        self.assertEqual(contents['headers'], [join('external', 'headers/org/aa/a.hpp')])
+
+        self.assertEqual(contents['resources'], [join('external', 'resources/org/aa/a.txt')])
+
+        self.assertEqual(file_system.files[join('external', 'headers', 'org', 'aa', 'a.hpp')], 
+                         b'class PRALINE_IMPORT a {};')
 
-        self.assertCountEqual(package_dependencies, expected_package_dependencies)
+        self.assertEqual(file_system.files[join('external', 'resources', 'org', 'aa', 'a.txt')], b'PRALINE_EXPORT')
@@ -1,6 +1,6 @@
 from praline.common import (
     Architecture, ArtifactVersion, ArtifactType, Compiler, DependencyScope, DependencyVersion, ExportedSymbols, 
-    Mode, Platform
+    Linker, Mode, Platform
 )
 from praline.common.pralinefile import read_pralinefile
 from praline.common.testing.file_system_mock import FileSystemMock 
@@ -34,6 +34,7 @@ class PralinefileTest(TestCase):
             'compilers': list(Compiler),
             'exported_symbols': ExportedSymbols.explicit,
             'artifact_type': ArtifactType.library,
+            'linker': Linker.ld,
             'dependencies': [
                 {
                     'organization': 'org',
@@ -62,6 +63,7 @@ class PralinefileTest(TestCase):
                     compilers: [gcc, clang]
                     exported_symbols: all
                     artifact_type: executable
+                    linker: auto
                     dependencies:
                     - organization: org
                       artifact: art
@@ -81,6 +83,7 @@ class PralinefileTest(TestCase):
             'compilers': [Compiler.gcc, Compiler.clang],
             'exported_symbols': ExportedSymbols.all,
             'artifact_type': ArtifactType.executable,
+            'linker': Linker.auto,
             'dependencies': [
                 {
                     'organization': 'org',
@@ -12,6 +12,7 @@ allowed_fields = [
     'compilers',
     'exported_symbols',
     'artifact_type',
+    'linker',
     'dependencies'
 ]
 
@@ -0,0 +1,16 @@
+from praline.common import Linker
+from praline.common.pralinefile.validation.validator import PralinefileValidationError, validator
+from typing import Any, Dict
+
+
+@validator
+def validate_linker(pralinefile: Dict[str, Any]):
+    allowed_linkers = [linker.value for linker in Linker]
+    linker = pralinefile.get('linker', Linker.ld.value)
+    if not isinstance(linker, str):
+        raise PralinefileValidationError(
+            f"Pralinefile linker field has invalid type '{type(linker)}' -- type must be str")
+    if linker not in allowed_linkers:
+        raise PralinefileValidationError(
+                f"Pralinefile linker '{linker}' is not recognized -- allowed linkers are {allowed_linkers}")
+    pralinefile['linker'] = Linker(linker)
@@ -0,0 +1,49 @@
+from praline.common import Linker
+from praline.common.pralinefile.validation.linker_validator import validate_linker
+from praline.common.pralinefile.validation.validator import PralinefileValidationError
+from unittest import TestCase
+
+
+class LinkerValidatorTest(TestCase):
+    def test_valid_linker(self):
+        pralinefile = {
+            'organization': 'candyco',
+            'artifact': 'chocolaterie',
+            'linker': 'mold',
+            'version': '1.5.0'
+        }
+
+        validate_linker(pralinefile)
+
+        self.assertEqual(pralinefile['linker'], Linker.mold)
+
+    def test_invalid_linker_type(self):
+        pralinefile = {
+            'organization': 'candyco',
+            'artifact': 'chocolaterie',
+            'linker': ['mold', 'lld'],
+            'version': '1.5.0'
+        }
+
+        self.assertRaises(PralinefileValidationError, validate_linker, pralinefile)
+
+    def test_invalid_linker_value(self):
+        pralinefile = {
+            'organization': 'candyco',
+            'artifact': 'chocolaterie',
+            'linker': 'bfd',
+            'version': '1.5.0'
+        }
+
+        self.assertRaises(PralinefileValidationError, validate_linker, pralinefile)
+
+    def test_default_value(self):
+        pralinefile = {
+            'organization': 'candyco',
+            'artifact': 'chocolaterie',
+            'version': '1.5.0'
+        }
+        
+        validate_linker(pralinefile)
+
+        self.assertEqual(pralinefile['linker'], Linker.ld)
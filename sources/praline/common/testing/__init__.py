@@ -3,21 +3,24 @@ from praline.common import ProjectStructure
 from os.path import join
 
 
+target_root = join('project', 'target', 'gcc-debug-arm-debug')
+
+
 project_structure_dummy = ProjectStructure(
     project_directory='project',
     resources_root=join('project', 'resources'),
     sources_root=join('project', 'sources'),
-    target_root=join('project', 'target'),
-    objects_root=join('project', 'target', 'objects'),
-    executables_root=join('project', 'target', 'executables'),
-    libraries_root=join('project', 'target', 'libraries'),
-    libraries_interfaces_root=join('project', 'target', 'libraries_interfaces'),
-    symbols_tables_root=join('project', 'target', 'symbols_tables'),
-    external_root=join('project', 'target', 'external'),
-    external_packages_root=join('project', 'target', 'external', 'packages'),
-    external_headers_root=join('project', 'target', 'external', 'headers'),
-    external_executables_root=join('project', 'target', 'external', 'executables'),
-    external_libraries_root=join('project', 'target', 'external', 'libraries'),
-    external_libraries_interfaces_root=join('project', 'target', 'external', 'libraries_interfaces'),
-    external_symbols_tables_root=join('project', 'target', 'external', 'symbols_tables'),
+    target_root=target_root,
+    objects_root=join(target_root, 'objects'),
+    executables_root=join(target_root, 'executables'),
+    libraries_root=join(target_root, 'libraries'),
+    libraries_interfaces_root=join(target_root, 'libraries_interfaces'),
+    symbols_tables_root=join(target_root, 'symbols_tables'),
+    external_root=join(target_root, 'external'),
+    external_packages_root=join(target_root, 'external', 'packages'),
+    external_headers_root=join(target_root, 'external', 'headers'),
+    external_executables_root=join(target_root, 'external', 'executables'),
+    external_libraries_root=join(target_root, 'external', 'libraries'),
+    external_libraries_interfaces_root=join(target_root, 'external', 'libraries_interfaces'),
+    external_symbols_tables_root=join(target_root, 'external', 'symbols_tables'),
 )
@@ -1,5 +1,8 @@
+from praline.common import ArchiveFormat
+
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, IO, List, Set
+from typing import Any, Callable, ContextManager, Dict, IO, List, Set
 import io
 import os
 import os.path
@@ -34,6 +37,7 @@ class ArchiveMemberMock:
     def __init__(self, name: str, contents: bytes):
         self.name     = name
         self.contents = contents
+        self.mode     = 0o644
 
     def isfile(self) -> bool:
         return True
@@ -48,6 +52,9 @@ class ArchiveMock:
     def __enter__(self):
         return self
 
+    def __iter__(self):
+        return iter(self.getmembers())
+
     def getmembers(self) -> List[ArchiveMemberMock]:
         return [ArchiveMemberMock(name, contents) for name, contents in self.members.items()]
 
@@ -56,12 +63,24 @@ class ArchiveMock:
             self.members[archive_file_path] = contents = f.read()
             return ArchiveMemberMock(archive_file_path, contents)
 
+    def gettarinfo(self, file_path: str, archive_file_path: str) -> ArchiveMemberMock:
+        if not self.file_system.is_file(file_path):
+            raise FileNotFoundError(file_path)
+        return ArchiveMemberMock(archive_file_path, b'')
+
+    def addfile(self, member: ArchiveMemberMock, fileobj: IO[bytes]) -> None:
+        self.members[member.name] = member.contents = fileobj.read(member.size)
+
     def extract(self, member, extraction_path):
         path = os.path.join(extraction_path, member.name)
+        self.file_system.create_directory_if_missing(os.path.dirname(path))
         with self.file_system.open_file(path, 'wb') as f:
             f.write(member.contents)
 
     def extractfile(self, archive_file_path: str):
+        if isinstance(archive_file_path, ArchiveMemberMock):
+            archive_file_path = archive_file_path.name
+
         def on_close(file: FileMock):
             self.members[archive_file_path] = file.getvalue()
 
@@ -116,7 +135,12 @@ class FileSystemMock:
         self.working_directory = os.path.normpath(working_directory) if working_directory else None
         self.on_which          = on_which
         self.on_execute        = on_execute
+        self.on_rewrite        = None
+        self.file_states       = None
+        self.file_hashes       = None
         self.stdout            = io.StringIO("")
+        self.clock             = 0
+        self.timestamps        = {}
 
     def execute_and_fail_on_bad_return(self,
                                        command: List[str], 
@@ -126,6 +150,9 @@ class FileSystemMock:
         if not self.on_execute(command, add_to_library_path, interactive, add_to_env):
             raise RuntimeError("command exited with failure")
 
+    def rewriting(self, path: str) -> ContextManager[None]:
+        return self.on_rewrite(path) if self.on_rewrite != None else nullcontext()
+
     def get_working_directory(self) -> str:
         return self.working_directory
 
@@ -147,7 +174,7 @@ class FileSystemMock:
         return any(is_subpath_or_path(normalized_path, d) for d in self.directories)
 
     def exists(self, path: str) -> bool:
-        return self.is_file(path) or self.is_directory(path)
+        return path != None and (self.is_file(path) or self.is_directory(path))
 
     def list_directory(self, directory: str, hidden: bool = False) -> List[str]:
         normalized_path = os.path.normpath(directory)
@@ -186,7 +213,7 @@ class FileSystemMock:
             raise RuntimeError(f"file '{normalized_path}' is already open")
         if 'r' in mode and normalized_path not in self.files:
             raise FileNotFoundError(normalized_path)
-        if 'w' in mode and normalized_path not in self.files:
+        if ('w' in mode or 'a' in mode) and normalized_path not in self.files:
             for directory_path in self.directories:
                 if is_subpath_or_path(normalized_path, directory_path):
                     raise RuntimeError(f"cannot create file '{normalized_path}' -- '{directory_path}' is a directory")
@@ -201,7 +228,10 @@ class FileSystemMock:
             self.files[normalized_path] = file.getvalue()
             self.open_files.remove(normalized_path)
 
-        return FileMock(self.files[normalized_path], on_close)
+        file = FileMock(self.files[normalized_path], on_close)
+        if 'a' in mode:
+            file.seek(0, io.SEEK_END)
+        return file
 
     def open_tarfile(self, archive_path: str, mode: str):
         normalized_path = os.path.normpath(archive_path)
@@ -211,13 +241,13 @@ class FileSystemMock:
 
         file_exists = normalized_path in self.files
 
-        if mode == 'r:gz':
+        if mode in ['r:gz', 'r:zst']:
             if file_exists:
                 if not isinstance(self.files[normalized_path], ArchiveMock):
                     raise RuntimeError(f"file '{normalized_path}' is not an archive")
             else:
                 raise FileNotFoundError(normalized_path)
-        elif mode == 'w:gz':
+        elif mode in ['w:gz', 'w:zst']:
             if not file_exists:
                 for directory_path in self.directories:
                     if is_subpath_or_path(normalized_path, directory_path):
@@ -241,11 +271,74 @@ class FileSystemMock:
 
         return archive
 
+    def open_tarstream(self, stream: ArchiveMock, mode: str):
+        if mode not in ['r|gz', 'r|zst']:
+            raise RuntimeError(f"FileSystemMock doesn't support mode '{mode}'")
+        if not isinstance(stream, ArchiveMock):
+            raise RuntimeError("stream is not an archive")
+        stream.file_system = self
+        stream.on_close    = lambda archive: None
+        return stream
+
+    def get_archive_formats(self) -> List[ArchiveFormat]:
+        return [ArchiveFormat.zst, ArchiveFormat.gz]
+
+    def copy_file(self, source: str, destination: str) -> None:
+        with self.open_file(source, 'rb') as s:
+            with self.open_file(destination, 'wb') as d:
+                d.write(s.read())
+
+    def link_or_copy_file(self, source: str, destination: str) -> None:
+        self.copy_file(source, destination)
+
+    def rename(self, source: str, destination: str) -> None:
+        normalized_source      = os.path.normpath(source)
+        normalized_destination = os.path.normpath(destination)
+        if normalized_source in self.files:
+            self.files[normalized_destination] = self.files.pop(normalized_source)
+            self.timestamps[normalized_destination] = self.timestamps.pop(normalized_source, 0)
+        elif self.is_directory(normalized_source):
+            if self.exists(normalized_destination):
+                raise OSError(f"cannot rename '{normalized_source}' -- '{normalized_destination}' already exists")
+            moved = lambda path: os.path.join(normalized_destination, os.path.relpath(path, normalized_source))
+            for path in [f for f in self.files if is_subpath(normalized_source, f)]:
+                self.files[moved(path)] = self.files.pop(path)
+                self.timestamps[moved(path)] = self.timestamps.pop(path, 0)
+            self.directories = unique_directories({moved(d) if is_subpath_or_path(normalized_source, d) else d 
+                                                   for d in self.directories})
+        else:
+            raise FileNotFoundError(normalized_source)
+
+    def change_mode(self, path: str, mode: int) -> None:
+        normalized_path = os.path.normpath(path)
+        if normalized_path not in self.files:
+            raise FileNotFoundError(normalized_path)
+
+    def touch(self, path: str) -> None:
+        normalized_path = os.path.normpath(path)
+        if normalized_path not in self.files:
+            raise FileNotFoundError(normalized_path)
+        self.clock += 1
+        self.timestamps[normalized_path] = self.clock
+
+    def get_size(self, path: str) -> int:
+        normalized_path = os.path.normpath(path)
+        if normalized_path not in self.files:
+            raise FileNotFoundError(normalized_path)
+        return len(self.files[normalized_path])
+
+    def get_modification_time(self, path: str) -> float:
+        normalized_path = os.path.normpath(path)
+        if normalized_path not in self.files:
+            raise FileNotFoundError(normalized_path)
+        return self.timestamps.get(normalized_path, 0)
+
     def remove_file(self, path: str) -> None:
         normalized_path = os.path.normpath(path)
         if normalized_path not in self.files:
             raise FileNotFoundError(normalized_path)
         self.files.pop(normalized_path)
+        self.timestamps.pop(normalized_path, None)
 
     def remove_file_if_it_exists(self, path) -> None:
         if self.exists(path):
@@ -18,7 +18,8 @@ class ProgressBarMock:
         self.test_case.assertLessEqual(self.progress, self.resolution)
 
     def __exit__(self, type, value, traceback):
-        self.test_case.assertEqual(self.progress, self.resolution)
+        if type == None:
+            self.test_case.assertEqual(self.progress, self.resolution)
 
 
 class ProgressBarSupplierMock:
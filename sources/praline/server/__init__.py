@@ -6,18 +6,19 @@ import yaml
 with open(f"{os.path.dirname(__file__)}/../../../resources/praline-server.config", 'r') as f:
     configuration = yaml.load(f.read(), Loader=yaml.SafeLoader)
 
-logging.config.dictConfig(configuration['logging'])
-
 
 from flask import Flask, send_from_directory, request, Response, jsonify
-from praline.common import ArtifactManifest
+from praline.common import ArchiveFormat, ArtifactManifest, RemoteCacheMode
 from praline.common.file_system import FileSystem, join
-from praline.common.hashing import hash_archive
+from praline.common.hashing import hash_archive, hash_binary, hash_pattern
 from praline.common.package import get_package_dependencies_recursively
 from typing import Dict
 
+import json
 import pickle
 import base64
+import re
+import uuid
 
 
 file_system = FileSystem()
@@ -26,6 +27,17 @@ server = Flask(__name__, root_path=file_system.get_working_directory())
 
 repository_path = join(configuration['repository'], 'packages')
 
+cache_path = join(configuration['repository'], 'cache')
+
+cache_entry_pattern = re.compile(r'(?P<key>[0-9a-f]{64})(?P<metadata>\.metadata)?')
+
+cache_mode = RemoteCacheMode(configuration.get('cache-mode', RemoteCacheMode.read_only))
+
+
+def create_app() -> Flask:
+    logging.config.dictConfig(configuration['logging'])
+    return server
+
 
 @server.route('/package/<package>', methods=['GET', 'PUT'])
 def package(package) -> Response:
@@ -42,6 +54,49 @@ def package(package) -> Response:
         return Response(f"succesfully created package '{package}'", status=201, mimetype='text/plain')
 
 
+def validate_cache_entry(entry: str, contents: bytes) -> str:
+    if not cache_entry_pattern.fullmatch(entry)['metadata']:
+        if hash_binary(contents) != entry:
+            return f"cache entry '{entry}' doesn't match the hash of its contents"
+        return None
+    try:
+        metadata = json.loads(contents.decode())
+    except ValueError:
+        return f"cache entry '{entry}' is not valid JSON"
+    object_hash = metadata.get('object') if isinstance(metadata, dict) else None
+    if not isinstance(object_hash, str) or not hash_pattern.fullmatch(object_hash):
+        return f"cache entry '{entry}' doesn't reference an object"
+    if not file_system.exists(join(cache_path, object_hash)):
+        return f"cache entry '{entry}' references the missing object '{object_hash}'"
+    return None
+
+
+@server.route('/cache/<entry>', methods=['GET', 'PUT'])
+def cache(entry) -> Response:
+    if not cache_entry_pattern.fullmatch(entry):
+        return Response(f"invalid cache entry '{entry}'", status=400, mimetype='text/plain')
+    file_system.create_directory_if_missing(cache_path)
+    entry_path = join(cache_path, entry)
+    if request.method == 'GET':
+        if not file_system.exists(entry_path):
+            return Response(f"cache entry '{entry}' not found", status=404, mimetype='text/plain')
+        return send_from_directory(cache_path, entry, as_attachment=True)
+    elif request.method == 'PUT':
+        if cache_mode != RemoteCacheMode.read_write:
+            return Response("the cache is read only", status=403, mimetype='text/plain')
+        if file_system.exists(entry_path):
+            return Response(f"cache entry '{entry}' already exists", status=200, mimetype='text/plain')
+        contents = request.stream.read()
+        error    = validate_cache_entry(entry, contents)
+        if error:
+            return Response(error, status=400, mimetype='text/plain')
+        temporary_path = f'{entry_path}.{uuid.uuid4().hex}'
+        with open(temporary_path, 'wb') as f:
+            f.write(contents)
+        file_system.rename(temporary_path, entry_path)
+        return Response(f"succesfully created cache entry '{entry}'", status=201, mimetype='text/plain')
+
+
 @server.route('/solve-dependencies', methods=['GET'])
 def solve_dependencies() -> Dict[str, str]:
     file_system.create_directory_if_missing(repository_path)
@@ -51,7 +106,12 @@ def solve_dependencies() -> Dict[str, str]:
         if not isinstance(artifact_manifest, ArtifactManifest):
             return Response("invalid package manifest", status=400, mimetype='text/plain')
         
-        dependencies = get_package_dependencies_recursively(file_system, artifact_manifest, repository_path)
+        archive_formats = [ArchiveFormat(f) for f in payload.get('archive_formats', [ArchiveFormat.gz]) 
+                           if f in file_system.get_archive_formats()]
+        dependencies = get_package_dependencies_recursively(file_system, 
+                                                            artifact_manifest, 
+                                                            repository_path, 
+                                                            archive_formats)
         dependencies_with_hashes = {d: hash_archive(file_system, join(repository_path, d)) for d in dependencies}
         return jsonify(dependencies_with_hashes)
     except RuntimeError as exception:
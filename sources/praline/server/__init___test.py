@@ -0,0 +1,80 @@
+from praline.common import RemoteCacheMode
+
+from hashlib import sha3_256
+from os.path import exists, join
+from tempfile import TemporaryDirectory
+from typing import Tuple
+from unittest import TestCase
+from unittest.mock import patch
+
+import json
+import praline.server as server
+
+
+object_hash = sha3_256(b'object-a.').hexdigest()
+
+key = sha3_256(b'key-a.').hexdigest()
+
+
+class ServerCacheTest(TestCase):
+    def setUp(self):
+        self.repository = TemporaryDirectory()
+        self.patches    = [patch.object(server, 'cache_path', self.repository.name),
+                           patch.object(server, 'cache_mode', RemoteCacheMode.read_write)]
+        for p in self.patches:
+            p.start()
+        self.client = server.server.test_client()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.repository.cleanup()
+
+    def get(self, path: str) -> Tuple[int, bytes]:
+        with self.client.get(path) as response:
+            return (response.status_code, response.data)
+
+    def put(self, path: str, data: bytes) -> int:
+        with self.client.put(path, data=data) as response:
+            return response.status_code
+
+    def test_put_and_get_entries(self):
+        metadata = json.dumps({'object': object_hash, 'metadata': ['sources/a.hpp']}).encode()
+
+        self.assertEqual(self.put(f'/cache/{object_hash}', b'object-a.'), 201)
+
+        self.assertEqual(self.put(f'/cache/{key}.metadata', metadata), 201)
+
+        self.assertEqual(self.put(f'/cache/{object_hash}', b'object-a.'), 200)
+
+        self.assertEqual(self.get(f'/cache/{object_hash}'), (200, b'object-a.'))
+
+        self.assertEqual(self.get(f'/cache/{key}.metadata'), (200, metadata))
+
+    def test_get_missing_entry(self):
+        self.assertEqual(self.get(f'/cache/{object_hash}')[0], 404)
+
+    def test_invalid_entry_name(self):
+        self.assertEqual(self.get('/cache/abcd')[0], 400)
+
+        self.assertEqual(self.put(f'/cache/{object_hash}.pickle', b'object-a.'), 400)
+
+    def test_put_object_not_matching_its_hash(self):
+        self.assertEqual(self.put(f'/cache/{object_hash}', b'tampered-object-a.'), 400)
+
+        self.assertFalse(exists(join(self.repository.name, object_hash)))
+
+    def test_put_invalid_metadata(self):
+        self.assertEqual(self.put(f'/cache/{key}.metadata', b'\x80\x04\x95'), 400)
+
+        self.assertEqual(self.put(f'/cache/{key}.metadata', json.dumps({'object': '../a'}).encode()), 400)
+
+        self.assertEqual(self.put(f'/cache/{key}.metadata', json.dumps({'object': object_hash}).encode()), 400)
+
+        self.assertFalse(exists(join(self.repository.name, f'{key}.metadata')))
+
+    def test_read_only_cache(self):
+        with patch.object(server, 'cache_mode', RemoteCacheMode.read_only):
+            self.assertEqual(self.put(f'/cache/{object_hash}', b'object-a.'), 403)
+
+        self.assertFalse(exists(join(self.repository.name, object_hash)))